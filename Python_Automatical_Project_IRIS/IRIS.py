@@ -1,17 +1,19 @@
 # 표준 라이브러리
-import configparser
+import argparse
 import datetime as dt
-from flask import Flask, render_template
+import os
 
 # 로컬 매니저
-from Managers.ai_manager import GeminiSummarizer
-from Managers.gcalendar_manager import CalendarManager
-from Managers.news_manager import NewsManager
-from Managers.report_manager import ReportManager
-from Managers.sender_manager import SenderManager
-from Managers.weather_manager import WeatherManager
+from Managers.gcalendar_manager import TOKEN_FILE, CalendarManager, enable_token_auto_refresh
+from Managers.pipeline_manager import PipelineManager
+from Managers.profile_manager import StartupProfiler
+from Managers.registry_manager import ManagerRegistry, get_target_news_count
+from Managers.scheduler_manager import BriefingScheduler, start_status_server
 
 KST = dt.timezone(dt.timedelta(hours=9))
+CONFIG_PATH = 'config.ini'
+# [SCHEDULE] 섹션에서 슬롯(cron 식)이 아닌 설정 이름
+SCHEDULE_OPTIONS = ('prefetch_minutes', 'status_host', 'status_port')
 
 # 메일 및 보고서 시간별 제목
 def get_iris_subject(part = ""):
@@ -34,92 +36,224 @@ def get_iris_subject(part = ""):
     else:
         return subject
         
-def run_news_briefing():
-    # ... (설정 로드 및 매니저 구성 부분은 동일) ...
+def run_news_briefing(registry=None, prefetched=None):
+    """
+    브리핑을 한 번 실행합니다.
+    :param registry: 매니저를 재사용할 ManagerRegistry (데몬 모드에서는 실행마다 같은 객체를 넘김)
+    :param prefetched: prefetch_briefing()으로 미리 수집한 결과 (있으면 해당 수집 단계를 건너뜀)
+    :return: 모든 단계가 성공했으면 True
+    """
     print("🕊️ 이리스!, 작업을 시작합니다!")
+    registry = registry or ManagerRegistry(CONFIG_PATH)
+    prefetched = prefetched or {}
 
     try:
-        config = configparser.ConfigParser()
-        config.read('config.ini', encoding='utf-8')
-        
-        naver_client_id = config['API']['NAVER_API_KEY']
-        naver_client_secret = config['API']['NAVER_API_PW']
+        config = registry.get_config()
         search_query = config['USER']['news_keyword']
-        target_count = int(config['USER']['target_news_count'])
+        target_count = get_target_news_count(config)
         file_path = config['PATHS']['output_directory']
-
-        weather_api_key = config['API']["WEATHER_API_KEY"]
         target_city = config['USER']['target_city']
-
-        gemini_api_key = config['API']['GOOGLE_GEMINI_API_KEY']
-        
-        sender_email = config['EMAIL']['SENDER_EMAIL']
-        sender_password = config['EMAIL']['SENDER_PASSWORD']
         target_email = config['USER']['target_email']
-        smtp_server = config['EMAIL']['SMTP_SERVER']
-        smtp_port = int(config['EMAIL']['SMTP_PORT'])
-
-        web_url = config['PATHS']['web_url']
 
     except Exception as e:
         print(f"❌ 설정 파일(config.ini)을 읽는 중 오류가 발생했습니다: {e}")
-        return
+        return False
 
-    # 전문가 팀(매니저 객체)을 구성
+    # 전문가 팀(매니저 객체)을 구성 (캘린더는 인증이 오래 걸리므로 파이프라인 단계에서 생성)
+    # 레지스트리가 설정이 바뀐 매니저만 새로 만들므로, 데몬 모드에서는 이전 실행의 객체와 연결을 그대로 재사용
     try:
-        ai_summarizer = GeminiSummarizer(api_key=gemini_api_key)
-        news_manager = NewsManager( naver_client_id, naver_client_secret, ai_summarizer, file_path )
-        weather_manager = WeatherManager( weather_api_key, target_city, file_path, ai_summarizer )
-        report_manager = ReportManager( file_path, web_url )
-        sender_manager = SenderManager( smtp_server, smtp_port, sender_email, sender_password )
-        gcalendar_manager = CalendarManager()
+        news_manager = registry.news(file_path)
+        weather_manager = registry.weather(target_city, file_path)
+        report_manager = registry.report()
+        renderer = registry.renderer()
+        outbox = registry.outbox()
 
     except Exception as e:
         print(f"❌ 전문가 팀을 구성하는 중 오류가 발생했습니다: {e}")
-        return
+        return False
 
-    # 요약 및 보고서 생성 워크플로우를 실행
-    try:
-        # 1) NewsManager에게 뉴스 요약 작업을 지시
-        news_manager.run_workflow(query=search_query, target_count=target_count)
+    now = dt.datetime.now(KST)
+    today = now.date()
+    tomorrow = today + dt.timedelta(days=1)
 
-        # 2) WeatherManager에게 날씨 정보 수집 요구
-        now = dt.datetime.now(KST)
-        today = now.date()
-        tomorrow = today + dt.timedelta(days=1)
+    # 요약 및 보고서 생성 워크플로우를 단계별로 정의
+    # 1) 뉴스 수집 / 날씨 수집 / 캘린더 인증은 서로 독립적이므로 동시에 실행
+    #    (데몬 모드에서 미리 수집한 결과가 있으면 그대로 사용)
+    def fetch_news(results):
+        if prefetched.get("news_fetch") is not None:
+            return prefetched["news_fetch"]
+        return news_manager.fetch_articles(query=search_query, target_count=target_count)
 
-        weather_manager.run_workflow(today)
+    def fetch_weather(results):
+        if prefetched.get("weather_fetch") is not None:
+            return prefetched["weather_fetch"]
+        return weather_manager.build_ai_weather_prompt()
 
-        # 오늘 일정 업데이트
-        _, today_summary, today_desc = weather_manager.run_workflow(today)
-        gcalendar_manager.upsert_today(today_summary, today_desc)
+    def connect_calendar(results):
+        return CalendarManager()
 
-        # 내일 06:00 일정 생성
+    # 2) 뉴스 요약 및 뉴스 파일 저장 (가장 오래 걸리는 단계)
+    #    날씨 한마디를 뉴스 요약 묶음에 함께 실으면 날씨/캘린더가 뉴스 요약을 기다려야 하므로 묶지 않음
+    def summarize_news(results):
+        news_manager.run_workflow(query=search_query, target_count=target_count, articles=results["news_fetch"])
+
+    # 3) 날씨 한마디 요청, 날씨 파일 저장 및 캘린더용 요약 생성 (오늘 + 12시 이후에는 내일)
+    #    뉴스 요약과 동시에 진행하며, 한마디는 한 번만 요청해서 오늘/내일에 함께 사용
+    def build_weather(results):
+        weather_comment = weather_manager.get_ai_weather_comment(results["weather_fetch"])
+        _, today_summary, today_desc = weather_manager.run_workflow(today, ai_comment=weather_comment)
+        tomorrow_event = None
         if now.hour >= 12:
-            _, tom_summary, tom_desc = weather_manager.run_workflow(tomorrow)
-            gcalendar_manager.upsert_tomorrow_06(tom_summary, tom_desc)
+            _, tom_summary, tom_desc = weather_manager.run_workflow(tomorrow, ai_comment=weather_comment)
+            tomorrow_event = (tom_summary, tom_desc)
+        return (today_summary, today_desc), tomorrow_event
+
+    def update_calendar(results):
+        gcalendar_manager = results["calendar_client"]
+        (today_summary, today_desc), tomorrow_event = results["weather"]
+        # 오늘 일정 + (있으면) 내일 06:00 일정을 한 번의 조회와 한 번의 배치 요청으로 동기화
+        day_to_payload = {today: (today_summary, today_desc)}
+        if tomorrow_event:
+            day_to_payload[tomorrow] = tomorrow_event
+        return gcalendar_manager.sync_weather_events(day_to_payload)
+
+    # [수정] 이메일 발송 로직: 브리핑을 한 번만 렌더링하고, 수신자별 값은 발송할 때 채움
+    def render_email(results):
+        report_subject = get_iris_subject(part='report')
+        briefing_data = report_manager.get_briefing_data(subject=report_subject)
+        if not briefing_data.get("news_data") and not briefing_data.get("weather_data"):
+            raise ValueError("이메일로 보낼 데이터가 없습니다.")
+        return renderer.render_briefing(briefing_data)
+
+    def send_email(results):
+        mail_subject = get_iris_subject(part='mail')
+        # target_email은 쉼표로 여러 명을 지정할 수 있음
+        # 보낸편지함에 먼저 저장한 뒤 바로 발송하며, 실패한 메일은 편지함에 남아 다음 실행(또는 웹 앱)에서 재시도
+        message_id = outbox.enqueue(target_email, subject=mail_subject, body=results["render"])
+        outbox.drain()
+        status = outbox.status(message_id)
+        if status['status'] != 'sent':
+            print(f"⚠️ 메일 발송이 끝나지 않았습니다 (상태: {status['status']}). 보낸편지함에서 다시 시도합니다.")
+        return status
+
+    pipeline = PipelineManager(max_workers=4)
+    pipeline.add_stage("news_fetch", fetch_news, timeout=60)
+    pipeline.add_stage("weather_fetch", fetch_weather, timeout=30)
+    pipeline.add_stage("calendar_client", connect_calendar, timeout=120)
+    pipeline.add_stage("news", summarize_news, deps=("news_fetch",), timeout=120)
+    pipeline.add_stage("weather", build_weather, deps=("weather_fetch",), timeout=60)
+    pipeline.add_stage("calendar", update_calendar, deps=("weather", "calendar_client"), timeout=60)
+    pipeline.add_stage("render", render_email, deps=("news", "weather"), timeout=30)
+    pipeline.add_stage("send", send_email, deps=("render",), timeout=60)
+
+    try:
+        pipeline.run()
+    except Exception as e:
+        print(f"❌ 브리핑 작업 중 오류가 발생했습니다: {e}")
+    print(pipeline.report())
+    return all(pipeline.status.get(name) == "done" for name in pipeline.stages)
+
+def prefetch_briefing(registry):
+    """
+    슬롯 몇 분 전에 뉴스 목록과 날씨 예보를 미리 받아 두고, 캘린더 인증도 미리 끝내 둡니다.
+    :return: run_news_briefing(prefetched=...)에 넘길 결과
+    """
+    config = registry.get_config()
+    file_path = config['PATHS']['output_directory']
+    news_manager = registry.news(file_path)
+    weather_manager = registry.weather(config['USER']['target_city'], file_path)
 
+    prefetched = {}
+    try:
+        prefetched["news_fetch"] = news_manager.fetch_articles(
+            query=config['USER']['news_keyword'], target_count=get_target_news_count(config)
+        )
+    except Exception as e:
+        print(f"⚠️ 뉴스 미리 수집 실패 (정각에 다시 수집합니다): {e}")
+    try:
+        prefetched["weather_fetch"] = weather_manager.build_ai_weather_prompt()
+    except Exception as e:
+        print(f"⚠️ 날씨 미리 수집 실패 (정각에 다시 수집합니다): {e}")
+    try:
+        CalendarManager()  # 캘린더 서비스는 프로세스 안에서 캐시되므로 정각에는 바로 사용
     except Exception as e:
-        print(f"❌ 데이터 생성 중 오류가 발생했습니다: {e}")
+        print(f"⚠️ 캘린더 미리 연결 실패: {e}")
+    print(f"-> 브리핑 데이터를 미리 준비했습니다: {', '.join(prefetched) or '없음'}")
+    return prefetched
+
+def run_daemon():
+    """
+    프로세스를 띄워 둔 채 [SCHEDULE]의 cron 식마다 브리핑을 실행합니다.
+    매니저/연결/캐시를 실행 사이에 유지하고, /health, /status 로 상태를 확인할 수 있습니다.
+    """
+    registry = ManagerRegistry(CONFIG_PATH)
+    config = registry.get_config()
+    if not config.has_section('SCHEDULE'):
+        print("❌ config.ini에 [SCHEDULE] 섹션이 없습니다.")
         return
-    
-    # [수정] 이메일 발송 로직: Flask 템플릿을 사용하여 HTML 생성
+    slots = {name: expr for name, expr in config['SCHEDULE'].items() if name not in SCHEDULE_OPTIONS}
+
+    def run_slot(slot, prefetched):
+        if not run_news_briefing(registry, prefetched):
+            raise RuntimeError("일부 단계가 실패했습니다.")
+
+    scheduler = BriefingScheduler(
+        slots, run=run_slot, prefetch=lambda slot: prefetch_briefing(registry),
+        prefetch_minutes=config.getint('SCHEDULE', 'prefetch_minutes', fallback=5), tz=KST
+    )
+    registry.outbox().start()  # 실패한 메일은 다음 슬롯을 기다리지 않고 백그라운드에서 재시도
+    enable_token_auto_refresh()  # 캘린더 토큰이 슬롯 사이에 만료되지 않도록 미리 갱신
+    start_status_server(
+        scheduler.status,
+        host=config.get('SCHEDULE', 'status_host', fallback='127.0.0.1'),
+        port=config.getint('SCHEDULE', 'status_port', fallback=8765),
+    )
     try:
-        app = Flask(__name__, template_folder='templates') # 이메일 템플릿을 위해 Flask 앱 컨텍스트 사용
-        with app.app_context():
-            report_subject = get_iris_subject(part='report')
-            briefing_data = report_manager.get_briefing_data(subject=report_subject)
-            if not briefing_data.get("news_data") and not briefing_data.get("weather_data"):
-                print("❌ 오류: 이메일로 보낼 데이터가 없습니다.")
-                return 
-
-            html_body = render_template('email_briefing.html', data=briefing_data)
-        
-        mail_subject = get_iris_subject(part='mail')
-        sender_manager.send_email(receiver_email=target_email, subject=mail_subject, body=html_body)
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        scheduler.stop()
+        print("🕊️ 이리스 데몬을 종료합니다.")
 
-    except Exception as e:
-        print(f"❌ 메일 전송 중 오류가 발생했습니다: {e}")
+def profile_startup():
+    """
+    import 시간(패키지별)과 매니저를 처음 사용할 때까지 걸리는 시간(무거운 라이브러리를 늦게 불러오는 시간 포함)을 출력합니다.
+    네트워크 요청은 하지 않습니다.
+    """
+    profiler = StartupProfiler("IRIS 시작 시간")
+    profiler.add_imports("IRIS", cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    registry = ManagerRegistry(CONFIG_PATH)
+    with profiler.step("config.ini 읽기"):
+        registry.get_config()
+    config = registry.get_config()
+    file_path = config.get('PATHS', 'output_directory', fallback='./files')
+    with profiler.step("요약기 (google.generativeai)"):
+        registry.summarizer()
+    with profiler.step("뉴스 매니저"):
+        registry.news(file_path)
+    with profiler.step("날씨 매니저"):
+        registry.weather(config.get('USER', 'target_city', fallback=''), file_path)
+    with profiler.step("보고서 매니저"):
+        registry.report()
+    with profiler.step("이메일 렌더러 (jinja2)"):
+        registry.renderer()
+    with profiler.step("보낸편지함"):
+        registry.outbox()
+    with profiler.step("캘린더 서비스 (google API)"):
+        # 토큰이 없으면 브라우저 인증을 기다리게 되므로 측정하지 않음
+        if not os.path.exists(TOKEN_FILE):
+            raise FileNotFoundError(f"{TOKEN_FILE}이 없어 건너뜁니다.")
+        CalendarManager()
+    print(profiler.report())
 
 if __name__ == "__main__":
-    run_news_briefing()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="IRIS 뉴스/날씨 브리핑")
+    parser.add_argument("--daemon", action="store_true", help="[SCHEDULE] 설정에 따라 상주하며 브리핑을 실행")
+    parser.add_argument("--profile-startup", action="store_true", help="import/매니저 준비 시간을 측정해 출력")
+    args = parser.parse_args()
+    if args.profile_startup:
+        profile_startup()
+    elif args.daemon:
+        run_daemon()
+    else:
+        run_news_briefing()
\ No newline at end of file
@@ -1,9 +1,39 @@
-import google.generativeai as genai
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 class GeminiSummarizer:
-    def __init__(self, api_key):
+    def __init__(self, api_key, model_name='gemini-1.5-pro', cache=None, batch_char_budget=6000):
+        # google.generativeai는 불러오는 데 오래 걸리므로 요약기를 처음 만들 때 불러옴
+        import google.generativeai as genai
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-1.5-pro')
+        self.model_name = model_name
+        self.model = genai.GenerativeModel(model_name)
+        # 동일한 프롬프트의 재요청을 막기 위한 요약 캐시 (cache_manager.SummaryCache)
+        self.cache = cache
+        # 한 번의 묶음 요청에 넣을 프롬프트 글자 수 상한
+        self.batch_char_budget = batch_char_budget
+
+    def _build_prompt(self, text):
+        return f"""
+            다음 뉴스 기사의 본문을 한국어로, 전문적이고 간결하게 세 개의 핵심 문장으로 요약해 줘.
+            한 문장이 끝나면 </br>로 문단을 나눠서 보기 편하게 해줬으면 좋겠고,
+            중요하다고 생각하는 단어에는 HTML 문법으로 볼드 처리해주면 좋겠어
+
+            ---
+            {text}
+            ---
+            """
+
+    def _cache_get(self, prompt):
+        if not self.cache:
+            return None
+        return self.cache.get(self.cache.make_key(self.model_name, prompt))
+
+    def _cache_set(self, prompt, value):
+        if self.cache:
+            self.cache.set(self.cache.make_key(self.model_name, prompt), value)
 
     def summarize(self, text, prompt=None):
         """
@@ -13,17 +43,136 @@ class GeminiSummarizer:
         :return: 요약된 텍스트
         """
         if not prompt:
-            prompt = f"""
-            다음 뉴스 기사의 본문을 한국어로, 전문적이고 간결하게 세 개의 핵심 문장으로 요약해 줘.
-            한 문장이 끝나면 </br>로 문단을 나눠서 보기 편하게 해줬으면 좋겠고,
-            중요하다고 생각하는 단어에는 HTML 문법으로 볼드 처리해주면 좋겠어
+            prompt = self._build_prompt(text)
+        try:
+            return self._generate(prompt)
+        except Exception as e:
+            return f"Gemini 요약 중 오류 발생: {e}"
 
-            ---
-            {text}
-            ---
+    def _generate(self, prompt):
+        # 캐시 확인 후 한 건을 요청 (실패하면 예외를 그대로 올림)
+        cached = self._cache_get(prompt)
+        if cached is not None:
+            return cached
+        response = self.model.generate_content(prompt)
+        self._cache_set(prompt, response.text)
+        return response.text
+
+    def _generate_or_empty(self, prompt):
+        # 묶음 요약 경로에서는 오류 문구가 요약으로 표시되지 않도록 실패 시 빈 요약을 반환
+        try:
+            return self._generate(prompt)
+        except Exception as e:
+            print(f"⚠️ 요약 요청 실패 (빈 요약으로 대체): {e}")
+            return ""
+
+    def summarize_many(self, texts, prompts=None, max_workers=4, timeout=None):
+        """
+        여러 텍스트를 묶어서 한 번의 요청으로 요약합니다.
+        :param texts: 요약할 원본 텍스트 목록
+        :param prompts: 항목별 프롬프트 목록 (None인 항목은 기본 뉴스 요약 프롬프트 사용)
+        :param max_workers: 동시에 보낼 묶음 요청 수
+        :param timeout: 묶음 요청 한 번의 제한 시간(초). 기사별이 아니라 묶음 단위로 적용되며,
+                        시간을 넘긴 묶음의 항목은 모두 빈 문자열 (묶음은 max_workers개씩 차례로 기다리므로
+                        전체 대기 시간은 최대 timeout × 차례 수)
+        :return: 입력 순서와 동일한 요약 결과 목록
+        """
+        prompts = prompts or [None] * len(texts)
+        item_prompts = [p or (self._build_prompt(t) if t else None) for t, p in zip(texts, prompts)]
+        results = [""] * len(item_prompts)
+
+        # 1. 캐시에 있는 항목은 바로 채움
+        pending = []
+        for i, prompt in enumerate(item_prompts):
+            if not prompt:
+                continue
+            cached = self._cache_get(prompt)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+        if not pending:
+            return results
+
+        # 2. 글자 수 상한에 맞춰 묶음(sub-batch)으로 나눔
+        batches, current, size = [], [], 0
+        for i in pending:
+            length = len(item_prompts[i])
+            if current and size + length > self.batch_char_budget:
+                batches.append(current)
+                current, size = [], 0
+            current.append(i)
+            size += length
+        batches.append(current)
+
+        # 3. 묶음 요청을 동시에 보내고, 순서대로 결과를 모음
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches))))
+        try:
+            futures = [(batch, executor.submit(self._summarize_batch, [item_prompts[i] for i in batch]))
+                       for batch in batches]
+            start = time.monotonic()
+            for order, (batch, future) in enumerate(futures):
+                try:
+                    if timeout:
+                        deadline = start + timeout * (order // max(1, max_workers) + 1)
+                        answers = future.result(timeout=max(0, deadline - time.monotonic()))
+                    else:
+                        answers = future.result()
+                    for i, answer in zip(batch, answers):
+                        results[i] = answer
+                except Exception as e:
+                    future.cancel()
+                    print(f"⚠️ 묶음 요약 실패 또는 시간 초과 (빈 요약으로 대체): {type(e).__name__} {e}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def _summarize_batch(self, prompts):
+        if len(prompts) == 1:
+            return [self._generate_or_empty(prompts[0])]
+
+        tasks = "\n\n".join(f"[작업 {n}]\n{prompt.strip()}" for n, prompt in enumerate(prompts, start=1))
+        batch_prompt = f"""
+            아래에 번호가 붙은 {len(prompts)}개의 작업이 있어. 각 작업을 서로 독립적으로 수행해 줘.
+            응답은 다른 설명 없이 JSON 배열 하나로만 작성하고, 형식은 다음과 같아야 해.
+            [{{"id": 1, "answer": "작업 1의 결과"}}, {{"id": 2, "answer": "작업 2의 결과"}}]
+
+            {tasks}
             """
+        answers = {}
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            response = self.model.generate_content(batch_prompt)
+            answers = self._parse_batch_reply(response.text, len(prompts))
         except Exception as e:
-            return f"Gemini 요약 중 오류 발생: {e}"
\ No newline at end of file
+            print(f"⚠️ 묶음 요약 요청 실패, 개별 요청으로 전환합니다: {e}")
+
+        results = []
+        for n, prompt in enumerate(prompts, start=1):
+            answer = answers.get(n)
+            if answer:
+                self._cache_set(prompt, answer)
+                results.append(answer)
+            else:
+                # 파싱하지 못한 항목은 개별 요청으로 대체
+                results.append(self._generate_or_empty(prompt))
+        return results
+
+    def _parse_batch_reply(self, reply, count):
+        match = re.search(r"\[.*\]", reply, re.DOTALL)
+        if not match:
+            return {}
+        try:
+            items = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return {}
+
+        answers = {}
+        for item in items if isinstance(items, list) else []:
+            if isinstance(item, dict) and isinstance(item.get("answer"), str):
+                try:
+                    n = int(item.get("id"))
+                except (TypeError, ValueError):
+                    continue
+                if 1 <= n <= count:
+                    answers[n] = item["answer"]
+        return answers
@@ -0,0 +1,225 @@
+# Managers/cache_manager.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class SummaryCache:
+    """
+    AI 요약 결과를 디스크(SQLite)에 저장하는 캐시입니다.
+    키는 '모델 이름 + 프롬프트'의 해시이며, TTL과 최대 개수(LRU 방식 삭제)를 지원합니다.
+    웹 앱과 예약 실행(IRIS.py)이 동시에 사용해도 안전하도록 WAL 모드로 동작합니다.
+    """
+    def __init__(self, file_path, filename="summary_cache.sqlite3", ttl_seconds=7 * 24 * 3600, max_entries=2000):
+        os.makedirs(file_path, exist_ok=True)
+        self.db_path = os.path.join(file_path, filename)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA busy_timeout = 10000")
+        return conn
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS summaries (
+                    key         TEXT PRIMARY KEY,
+                    value       TEXT NOT NULL,
+                    created_at  REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_accessed ON summaries (accessed_at)")
+
+    @staticmethod
+    def make_key(model_name, prompt):
+        return hashlib.sha256(f"{model_name}\n{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT value, created_at FROM summaries WHERE key = ?", (key,)).fetchone()
+                if row and (not self.ttl_seconds or now - row[1] < self.ttl_seconds):
+                    conn.execute("UPDATE summaries SET accessed_at = ? WHERE key = ?", (now, key))
+                    self._count(hit=True)
+                    return row[0]
+                if row:
+                    conn.execute("DELETE FROM summaries WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            print(f"⚠️ 요약 캐시 조회 중 오류 발생: {e}")
+        self._count(hit=False)
+        return None
+
+    def set(self, key, value):
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO summaries (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, value, now, now),
+                )
+                self._evict(conn, now)
+        except sqlite3.Error as e:
+            print(f"⚠️ 요약 캐시 저장 중 오류 발생: {e}")
+
+    def _evict(self, conn, now):
+        if self.ttl_seconds:
+            conn.execute("DELETE FROM summaries WHERE created_at < ?", (now - self.ttl_seconds,))
+        if self.max_entries:
+            # 가장 오래 사용되지 않은 항목부터 삭제 (LRU)
+            conn.execute("""
+                DELETE FROM summaries WHERE key IN (
+                    SELECT key FROM summaries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self):
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        try:
+            with self._connect() as conn:
+                entries = conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+        except sqlite3.Error:
+            entries = None
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+            "entries": entries,
+        }
+
+
+# 웹 화면의 도시 목록(web_app.CITIES)은 좌표가 바뀌지 않으므로 미리 넣어 둠
+KNOWN_CITY_COORDS = {
+    "seoul": (37.5665, 126.9780), "busan": (35.1796, 129.0756), "incheon": (37.4563, 126.7052),
+    "daegu": (35.8714, 128.6014), "gwangju": (35.1595, 126.8526), "daejeon": (36.3504, 127.3845),
+    "ulsan": (35.5384, 129.3114), "sejong": (36.4800, 127.2890), "suwon": (37.2636, 127.0286),
+    "chuncheon": (37.8813, 127.7298), "cheongju": (36.6424, 127.4890), "jeonju": (35.8242, 127.1480),
+    "changwon": (35.2280, 128.6811), "andong": (36.5684, 128.7294), "jeju": (33.4996, 126.5312),
+}
+
+
+class GeocodeCache:
+    """
+    지역 이름 -> (위도, 경도) 변환 결과를 JSON 파일에 영구 저장하는 캐시입니다.
+    같은 파일을 쓰는 인스턴스끼리는 프로세스 안에서 메모리 사본을 공유합니다.
+    """
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, file_path="", filename="geocode_cache.json"):
+        self.cache_path = os.path.join(file_path, filename) if file_path else None
+        with self._shared_lock:
+            if self.cache_path not in self._shared:
+                entries = dict(KNOWN_CITY_COORDS)
+                entries.update(self._load())
+                self._shared[self.cache_path] = entries
+            self._entries = self._shared[self.cache_path]
+
+    @staticmethod
+    def normalize(location_name):
+        return " ".join(location_name.split()).lower()
+
+    def _load(self):
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return {key: tuple(value) for key, value in json.load(f).items()}
+        except (FileNotFoundError, json.JSONDecodeError, TypeError, ValueError):
+            return {}
+
+    def get(self, location_name):
+        return self._entries.get(self.normalize(location_name))
+
+    def set(self, location_name, coords):
+        with self._shared_lock:
+            self._entries[self.normalize(location_name)] = tuple(coords)
+            if not self.cache_path:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+                tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f, ensure_ascii=False, indent=4)
+                os.replace(tmp_path, self.cache_path)
+            except OSError as e:
+                print(f"⚠️ 좌표 캐시 저장 중 오류 발생: {e}")
+
+
+class SectionCache:
+    """
+    웹 화면의 뉴스/날씨 섹션을 위한 stale-while-revalidate 캐시입니다.
+    - 섹션별 신선도(초) 안의 데이터는 그대로 반환합니다.
+    - 신선도가 지난 데이터도 바로 반환하고, 백그라운드 새로 고침을 한 번만 시작합니다.
+      (submit은 JobManager.submit 형태이며, 같은 키의 새로 고침이 진행 중이면 그 작업에 합류)
+    """
+    def __init__(self, freshness, submit, retry_interval=60):
+        self.freshness = dict(freshness)
+        self.submit = submit
+        self.retry_interval = retry_interval
+        self._entries = {}  # (섹션, 키) -> (값, 저장 시각)
+        self._empty_at = {}  # (섹션, 키) -> 마지막으로 새로 고침 결과가 비어 있던 시각
+        self._lock = threading.Lock()
+
+    def peek(self, section, key):
+        with self._lock:
+            return self._entries.get((section, key))
+
+    def set(self, section, key, value, stored_at=None):
+        with self._lock:
+            current = self._entries.get((section, key))
+            stored_at = stored_at or time.time()
+            # 더 오래된 데이터(예: 파일에서 읽은 값)가 최신 값을 덮어쓰지 않도록 함
+            if current is None or current[1] <= stored_at:
+                self._entries[(section, key)] = (value, stored_at)
+
+    def is_fresh(self, section, key):
+        entry = self.peek(section, key)
+        return entry is not None and time.time() - entry[1] < self.freshness.get(section, 0)
+
+    def get(self, section, key, loader, description="", on_refresh=None):
+        """
+        :param loader: loader(report) 형태의 최신 데이터 조회 함수 (백그라운드에서 실행, 값이 없으면 None 반환)
+        :param on_refresh: 새로 고침이 끝났을 때 추가로 호출할 on_refresh(value) 콜백
+        :return: (캐시된 값 또는 None, 새로 고침 작업 ID 또는 None)
+        """
+        entry = self.peek(section, key)
+        if entry is not None and time.time() - entry[1] < self.freshness.get(section, 0):
+            return entry[0], None
+        # 직전 새로 고침 결과가 비어 있었다면 잠시 다시 시도하지 않음 (API 반복 호출 방지)
+        with self._lock:
+            empty_at = self._empty_at.get((section, key), 0)
+        if time.time() - empty_at < self.retry_interval:
+            return (entry[0] if entry else None), None
+
+        def on_done(value):
+            if value is None:
+                with self._lock:
+                    self._empty_at[(section, key)] = time.time()
+                return
+            self.set(section, key, value)
+            if on_refresh:
+                on_refresh(value)
+
+        job_id = self.submit(("refresh", section, key), loader, description or f"{section} 새로 고침: {key}", on_done)
+        return (entry[0] if entry else None), job_id
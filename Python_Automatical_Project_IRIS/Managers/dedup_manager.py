@@ -0,0 +1,74 @@
+# Managers/dedup_manager.py
+from collections import Counter, defaultdict
+
+
+class TitleIndex:
+    """
+    제목 유사도(fuzz.token_sort_ratio) 비교를 위한 색인입니다.
+    모든 제목을 일일이 비교하는 대신, 글자 단위 역색인으로 '기준 점수에 도달할 수 있는' 후보만 고른 뒤
+    rapidfuzz의 process.extract로 후보들과 한 번에 비교합니다.
+
+    token_sort_ratio는 정렬된 토큰 문자열 간의 Indel 유사도(2 * LCS / 전체 길이)이며,
+    LCS는 두 문자열이 공유하는 글자 수(중복 포함)를 넘을 수 없으므로 이 상한으로 거른 후보만 비교해도
+    전체 비교와 같은 결과가 나옵니다.
+    """
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.keys = []       # 정렬된 토큰 문자열 (token_sort_ratio의 비교 대상)
+        self.spaces = []     # 각 제목의 공백 수
+        self.postings = defaultdict(list)  # 글자 -> [(제목 번호, 등장 횟수)]
+
+    def __len__(self):
+        return len(self.keys)
+
+    @staticmethod
+    def _sort_key(title):
+        return " ".join(sorted(title.split()))
+
+    def add(self, title):
+        key = self._sort_key(title)
+        entry_id = len(self.keys)
+        self.keys.append(key)
+        self.spaces.append(key.count(" "))
+        for ch, count in Counter(key.replace(" ", "")).items():
+            self.postings[ch].append((entry_id, count))
+        return entry_id
+
+    def _candidates(self, key):
+        # 공백 없이는 겹치는 글자가 없는 제목의 점수 상한은 50 미만이므로, 기준이 50 이상이면 후보에서 제외
+        if not key or self.threshold < 50:
+            return list(range(len(self.keys)))
+
+        shared = defaultdict(int)
+        for ch, count in Counter(key.replace(" ", "")).items():
+            for entry_id, entry_count in self.postings.get(ch, ()):
+                shared[entry_id] += min(count, entry_count)
+
+        q_len, q_spaces = len(key), key.count(" ")
+        return sorted(
+            entry_id for entry_id, common in shared.items()
+            if 200 * (common + min(q_spaces, self.spaces[entry_id]))
+            >= self.threshold * (q_len + len(self.keys[entry_id])) - 1e-9
+        )
+
+    def _matches(self, title):
+        # 기준 점수 이상인 후보들의 (제목 번호, 점수) 목록
+        key = self._sort_key(title)
+        candidates = self._candidates(key)
+        if not candidates:
+            return []
+        from rapidfuzz import fuzz, process  # 실제로 비교할 후보가 있을 때만 불러옴
+        results = process.extract(
+            key, [self.keys[i] for i in candidates], scorer=fuzz.ratio,
+            score_cutoff=self.threshold, limit=None
+        )
+        return [(candidates[pos], score) for _, score, pos in results]
+
+    def find_first(self, title):
+        """점수가 기준 이상(>=)인 제목 중 가장 먼저 추가된 제목의 번호를 반환합니다."""
+        matches = self._matches(title)
+        return min(entry_id for entry_id, _ in matches) if matches else None
+
+    def has_match_above(self, title):
+        """점수가 기준을 초과(>)하는 제목이 하나라도 있는지 확인합니다."""
+        return any(score > self.threshold for _, score in self._matches(title))
@@ -1,56 +1,105 @@
 import os  # 파일/경로 존재 여부 확인 및 입출력 유틸 사용
+import hashlib  # 일정 내용이 바뀌었는지 비교하기 위한 해시 계산
 import html  # 텍스트를 HTML로 이스케이프하기 위한 유틸 함수 제공
 import re  # 패턴 매칭과 파싱을 위한 정규표현식 엔진 사용
+import threading  # 서비스 캐시 보호와 백그라운드 토큰 갱신 타이머에 사용
 import datetime as dt  # 날짜/시간 처리와 타임존 연산을 위한 표준 모듈 사용
-from typing import Optional, Dict, Any, Tuple  # 정적 분석과 가독성을 위한 타입 힌트 사용
+from typing import Optional, Dict, Any, Tuple, List  # 정적 분석과 가독성을 위한 타입 힌트 사용
 
-from google.oauth2.credentials import Credentials  # 저장된 OAuth2 자격 증명 로드/검증/사용
-from googleapiclient.discovery import build  # Google API 서비스 클라이언트를 동적으로 생성
-from google_auth_oauthlib.flow import InstalledAppFlow  # 설치형 앱의 OAuth 동의 플로우 수행
-from google.auth.transport.requests import Request  # 토큰 갱신 시 HTTP 전송을 담당하는 어댑터
+# google 인증/API 라이브러리는 불러오는 데 오래 걸리므로 모듈 상단이 아닌 실제로 쓰는 함수 안에서 불러옴
 
 SCOPES = ["https://www.googleapis.com/auth/calendar.events"]  # 캘린더 이벤트 읽기/쓰기 권한 스코프 지정
 KST = dt.timezone(dt.timedelta(hours=9))  # 한국 표준시(+09:00) 타임존 객체 생성
 WX_MARK = "1"  # 날씨 일정임을 식별하기 위한 private extended property의 값
+TOKEN_FILE = "token.json"  # 사용자 토큰 파일 경로
+REFRESH_MARGIN = dt.timedelta(minutes=5)  # 토큰 만료 이 시간 전에 미리 갱신
+RETRY_DELAY = 60  # 미리 갱신에 실패하면 다시 시도할 간격(초)
+
+_service_cache: Dict[str, Any] = {}  # 토큰 파일 경로 -> 인증된 Calendar 서비스 (프로세스 전체에서 공유)
+_service_creds: Dict[str, Any] = {}  # 토큰 파일 경로 -> 캐시된 서비스가 사용하는 자격 증명
+_service_lock = threading.RLock()  # 서비스 생성과 토큰 파일 저장이 동시에 일어나지 않도록 보호
+_auto_refresh = False  # 백그라운드 토큰 미리 갱신 사용 여부 (상주 실행에서만 켬, 한 번 실행하고 끝나는 경우에는 불필요)
+
+
+def _save_credentials(creds) -> None:  # 갱신된 토큰을 파일에 원자적으로 저장
+    tmp_path = f"{TOKEN_FILE}.{os.getpid()}.tmp"  # 임시 파일에 먼저 기록
+    with open(tmp_path, "w", encoding="utf-8") as f:  # 신규 또는 갱신된 토큰을 로컬에 안전하게 보관
+        f.write(creds.to_json())  # Credentials를 JSON 문자열로 직렬화하여 저장
+    os.replace(tmp_path, TOKEN_FILE)  # 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 교체
+
+
+def _load_credentials():  # 토큰 파일을 읽고, 필요하면 갱신하거나 브라우저 동의 플로우를 수행
+    from google.oauth2.credentials import Credentials  # 저장된 OAuth2 자격 증명 로드/검증/사용
+    from google.auth.transport.requests import Request  # 토큰 갱신 시 HTTP 전송을 담당하는 어댑터
+    creds = None  # 자격 증명 객체를 보관할 변수 초기화
+    if os.path.exists(TOKEN_FILE):  # 기존에 발급받은 사용자 토큰 파일이 존재하는지 확인
+        creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)  # 토큰 파일을 로드해 Credentials 객체 생성
+    if not creds or not creds.valid:  # 토큰이 없거나 유효하지 않은 경우 재발급/갱신 필요 판단
+        if creds and creds.expired and creds.refresh_token:  # 만료되었지만 refresh_token이 있으면 자동 갱신 경로 사용
+            creds.refresh(Request())  # HTTP 요청을 통해 액세스 토큰을 새로 고침
+        else:  # 토큰이 없거나 갱신 불가한 경우 브라우저 동의 플로우 수행
+            if not os.path.exists("credentials.json"):  # 클라이언트 비밀키 파일이 없으면 구성 오류로 간주
+                raise FileNotFoundError("Google Cloud 인증 파일(credentials.json)을 찾을 수 없습니다.")  # 설정 누락을 명확히 알림
+            from google_auth_oauthlib.flow import InstalledAppFlow  # 설치형 앱의 OAuth 동의 플로우 수행 (최초 인증 때만 필요)
+            flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)  # OAuth 클라이언트 정보를 로드하여 플로우 생성
+            creds = flow.run_local_server(port=0)  # 로컬 웹서버를 열어 사용자 브라우저로 인증/동의 진행
+        _save_credentials(creds)  # 신규 또는 갱신된 토큰 저장
+    return creds  # 유효한 자격 증명 반환
+
+
+def enable_token_auto_refresh() -> None:  # 상주 실행(데몬)에서 토큰 만료 전 백그라운드 갱신을 켬
+    global _auto_refresh  # 모듈 전역 설정 변경
+    with _service_lock:  # 서비스 생성과 겹치지 않도록 잠금
+        if _auto_refresh:  # 이미 켜져 있으면
+            return  # 타이머를 중복으로 만들지 않음
+        _auto_refresh = True  # 이후 만드는 서비스는 생성 시 바로 예약
+        for creds in _service_creds.values():  # 이미 만든 서비스의 자격 증명도
+            _schedule_refresh(creds)  # 갱신 예약
+
+
+def _schedule_refresh(creds) -> None:  # 토큰 만료 REFRESH_MARGIN 전에 백그라운드 갱신을 예약
+    if not creds.refresh_token or not creds.expiry:  # 갱신할 수 없거나 만료 시각이 없는 토큰이면
+        return  # 예약하지 않음
+    now = dt.datetime.now(dt.timezone.utc).replace(tzinfo=None)  # google-auth의 expiry는 UTC 기준 naive datetime
+    delay = max(0.0, (creds.expiry - REFRESH_MARGIN - now).total_seconds())  # 미리 갱신할 때까지 남은 시간
+    timer = threading.Timer(delay, _refresh_credentials, args=(creds,))  # 지정 시간 뒤 갱신 실행
+    timer.daemon = True  # 프로세스 종료를 막지 않도록 데몬 스레드로 실행
+    timer.start()  # 타이머 시작
+
+
+def _refresh_credentials(creds) -> None:  # 백그라운드에서 토큰을 미리 갱신하고 다음 갱신을 다시 예약
+    from google.auth.transport.requests import Request  # 토큰 갱신 시 HTTP 전송을 담당하는 어댑터
+    try:  # 네트워크 오류 등으로 실패할 수 있으므로 보호
+        creds.refresh(Request())  # 서비스가 쓰는 같은 자격 증명 객체를 제자리에서 갱신 (느린 네트워크 요청이므로 잠금 밖에서 수행)
+        with _service_lock:  # 파일 저장만 잠금 안에서 수행
+            _save_credentials(creds)  # 갱신된 토큰을 파일에도 반영
+        print("  -> 캘린더 토큰을 미리 갱신했습니다.")  # 갱신 완료 로그
+        _schedule_refresh(creds)  # 새 만료 시각 기준으로 다음 갱신 예약
+    except Exception as e:  # 실패하면
+        print(f"⚠️ 캘린더 토큰 미리 갱신 실패, {RETRY_DELAY}초 후 다시 시도합니다: {e}")  # 오류 로그
+        timer = threading.Timer(RETRY_DELAY, _refresh_credentials, args=(creds,))  # 잠시 뒤 재시도 예약
+        timer.daemon = True  # 데몬 스레드로 실행
+        timer.start()  # 타이머 시작
 
 
 class GCalendarManager:  # 구글 캘린더에 날씨 일정을 생성/수정/삭제하는 매니저 클래스 선언
-    def __init__(self, calendar_id: str = "primary"):  # 매니저 인스턴스 초기화(대상 캘린더 선택)
+    def __init__(self, calendar_id: str = "primary", service: Any = None):  # 매니저 인스턴스 초기화(대상 캘린더 선택)
         self.calendar_id = calendar_id  # 조작 대상 캘린더 ID를 보관(기본: 사용자 기본 캘린더)
-        self.service = self._get_calendar_service()  # 인증을 완료하고 Calendar API 서비스 핸들을 준비
-
-    def _get_calendar_service(self):  # 구글 캘린더 API 클라이언트를 생성/반환하는 내부 유틸리티
-        creds = None  # 자격 증명 객체를 보관할 변수 초기화
-        if os.path.exists("token.json"):  # 기존에 발급받은 사용자 토큰 파일이 존재하는지 확인
-            creds = Credentials.from_authorized_user_file("token.json", SCOPES)  # 토큰 파일을 로드해 Credentials 객체 생성
-        if not creds or not creds.valid:  # 토큰이 없거나 유효하지 않은 경우 재발급/갱신 필요 판단
-            if creds and creds.expired and creds.refresh_token:  # 만료되었지만 refresh_token이 있으면 자동 갱신 경로 사용
-                creds.refresh(Request())  # HTTP 요청을 통해 액세스 토큰을 새로 고침
-            else:  # 토큰이 없거나 갱신 불가한 경우 브라우저 동의 플로우 수행
-                if not os.path.exists("credentials.json"):  # 클라이언트 비밀키 파일이 없으면 구성 오류로 간주
-                    raise FileNotFoundError("Google Cloud 인증 파일(credentials.json)을 찾을 수 없습니다.")  # 설정 누락을 명확히 알림
-                flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)  # OAuth 클라이언트 정보를 로드하여 플로우 생성
-                creds = flow.run_local_server(port=0)  # 로컬 웹서버를 열어 사용자 브라우저로 인증/동의 진행
-            with open("token.json", "w", encoding="utf-8") as f:  # 신규 또는 갱신된 토큰을 로컬에 안전하게 보관
-                f.write(creds.to_json())  # Credentials를 JSON 문자열로 직렬화하여 저장
-        return build("calendar", "v3", credentials=creds)  # 인증된 Credentials로 Calendar v3 서비스 인스턴스를 생성/반환
-
-    def _find_event_for_date(self, for_date: dt.date) -> Optional[Dict[str, Any]]:  # 특정 날짜에 해당하는 날씨 이벤트 1건을 조회
-        time_min = dt.datetime.combine(for_date, dt.time.min, tzinfo=KST).isoformat()  # 조회 시작 시각을 해당 날짜 00:00:00(+09:00)로 설정
-        time_max = dt.datetime.combine(for_date, dt.time.max, tzinfo=KST).isoformat()  # 조회 종료 시각을 해당 날짜 23:59:59.999999(+09:00)로 설정
-        try:  # API 호출 중 예외 발생을 포착하기 위한 보호 블록 시작
-            events_result = self.service.events().list(  # 이벤트 목록 조회 메서드 체이닝 시작
-                calendarId=self.calendar_id,  # 대상 캘린더 지정
-                timeMin=time_min,  # 기간 필터: 시작 시각
-                timeMax=time_max,  # 기간 필터: 종료 시각
-                singleEvents=True,  # 반복 이벤트를 개별 인스턴스로 확장하여 반환하도록 지정
-                privateExtendedProperty=[f"wx={WX_MARK}", f"for_date={for_date.isoformat()}"],  # 확장 속성 필터로 날씨표식/대상날짜가 일치하는 이벤트만 검색
-            ).execute()  # 요청 전송 및 결과 수신
-            items = events_result.get("items", [])  # 응답에서 이벤트 리스트를 안전하게 추출(없으면 빈 리스트)
-            return items[0] if items else None  # 첫 번째 일치 항목을 반환하거나 없으면 None 반환
-        except Exception as e:  # 네트워크/권한/파라미터 오류 등 모든 예외 포착
-            print(f"  -> 캘린더 이벤트 조회 중 오류 발생: {e}")  # 디버깅을 위해 오류 메시지를 표준 출력에 남김
-            return None  # 실패 시 일관되게 None 반환하여 상위 로직이 분기 처리할 수 있게 함
+        self.service = service or self._get_calendar_service()  # 주입된 서비스(예: 테스트용 가짜 서비스)가 없으면 캐시된 인증 서비스 사용
+
+    def _get_calendar_service(self):  # 프로세스에 캐시된 Calendar 서비스를 반환(없을 때만 인증/생성)
+        with _service_lock:  # 여러 스레드가 동시에 만들지 않도록 잠금
+            service = _service_cache.get(TOKEN_FILE)  # 이미 만든 서비스가 있는지 확인
+            if service is None:  # 처음 요청이면
+                from googleapiclient.discovery import build  # Google API 서비스 클라이언트 생성 함수 (처음 만들 때만 불러옴)
+                creds = _load_credentials()  # 토큰 파일 로드/갱신/동의 플로우로 자격 증명 준비
+                service = build("calendar", "v3", credentials=creds,  # 라이브러리에 포함된 정적 디스커버리 문서로 서비스 생성
+                                static_discovery=True, cache_discovery=False)  # (디스커버리 문서를 네트워크로 받지 않음)
+                _service_cache[TOKEN_FILE] = service  # 프로세스가 끝날 때까지 재사용
+                _service_creds[TOKEN_FILE] = creds  # 나중에 미리 갱신을 켤 때 사용할 자격 증명 보관
+                if _auto_refresh:  # 상주 실행이면
+                    _schedule_refresh(creds)  # 만료 전에 백그라운드에서 토큰을 미리 갱신하도록 예약
+            return service  # 인증된 서비스 반환
 
     def _to_html_description(self, description: str) -> str:
         lines = description.splitlines()
@@ -66,27 +115,6 @@ class GCalendarManager:  # 구글 캘린더에 날씨 일정을 생성/수정/
 
         return "".join(parts)
 
-    def _add_event(self, summary: str, description: str,  # 새 캘린더 이벤트를 생성하고 ID를 반환
-                   start_time: dt.datetime, end_time: dt.datetime) -> str:  # 시작/종료 시각을 받아 정확한 일정 생성
-        if not summary or not description:  # 제목 또는 설명이 비어 있으면
-            raise ValueError("summary/description이 비었습니다.")  # 명확한 예외를 던져 호출자에게 입력 오류 알림
-        desc_html = self._to_html_description(description)  # 설명 텍스트를 HTML로 변환하여 표와 줄바꿈을 적용
-
-        event = {  # Google Calendar API가 요구하는 이벤트 본문을 구성
-            "summary": summary,  # 일정 제목 설정
-            "description": desc_html,  # HTML 변환된 본문을 저장(리치 텍스트 표현)
-            "start": {"dateTime": start_time.isoformat(), "timeZone": "Asia/Seoul"},  # 시작 시각과 타임존 명시
-            "end":   {"dateTime": end_time.isoformat(),   "timeZone": "Asia/Seoul"},  # 종료 시각과 타임존 명시
-            "transparency": "transparent",  # 바쁨 상태를 차단하지 않도록 투명 처리
-            "reminders": {"useDefault": False, "overrides": [{"method": "popup", "minutes": 0}]},  # 기본 리마인더 대신 즉시 팝업 알림 설정
-            "extendedProperties": {"private": {"wx": WX_MARK, "for_date": start_time.date().isoformat()}},  # 커스텀 메타로 날씨표식/대상날짜 저장
-        }  # 이벤트 본문 구성 완료
-        created = self.service.events().insert(calendarId=self.calendar_id, body=event).execute()  # Calendar API로 이벤트를 생성 요청하고 응답 수신
-        return created.get("id")  # 생성된 이벤트의 고유 ID를 반환하여 추후 수정/삭제에 사용 가능
-
-    def _delete_event(self, event_id: str) -> None:  # 주어진 이벤트 ID를 가진 일정을 삭제
-        self.service.events().delete(calendarId=self.calendar_id, eventId=event_id).execute()  # Calendar API 호출로 일정 제거 수행
-
     def _get_today_time_block(self) -> Tuple[dt.datetime, dt.datetime]:  # 오늘 날짜 안에서 시작 시각을 0/6/12/18시로 스냅하여 30분 블록 계산
         now = dt.datetime.now(KST)  # 현재 KST 시각을 획득
         if   now.hour >= 18: start_hour = 18  # 현재 시간이 18시 이후면 18시 블록 선택
@@ -97,38 +125,121 @@ class GCalendarManager:  # 구글 캘린더에 날씨 일정을 생성/수정/
         end_dt = start_dt + dt.timedelta(minutes=30)  # 블록 종료를 시작으로부터 30분 뒤로 설정
         return start_dt, end_dt  # (시작, 종료) 튜플을 반환하여 일정 생성 시 사용
 
-    def upsert_today(self, summary: str, description: str):  # 오늘 일정이 있으면 삭제 후 최신 내용으로 재생성
+    @staticmethod
+    def _content_hash(event: Dict[str, Any]) -> str:  # 일정의 제목/본문/시간으로 내용 해시를 계산
+        key = "\n".join([event["summary"], event["description"], event["start"]["dateTime"], event["end"]["dateTime"]])  # 비교 대상 필드를 한 문자열로 결합
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]  # 확장 속성에 저장하기 좋은 짧은 해시 반환
+
+    def _build_event(self, for_date: dt.date, payload: Tuple) -> Dict[str, Any]:  # (제목, 설명[, 시작 시각])으로 이벤트 본문 구성
+        summary, description = payload[0], payload[1]  # 제목과 설명 추출
+        if not summary or not description:  # 제목 또는 설명이 비어 있으면
+            raise ValueError("summary/description이 비었습니다.")  # 입력 오류를 명확히 알림
+        if len(payload) > 2 and payload[2]:  # 시작 시각이 지정된 경우
+            start_dt = payload[2]  # 지정된 시각 사용
+        elif for_date == dt.datetime.now(KST).date():  # 오늘 일정이면
+            start_dt, _ = self._get_today_time_block()  # 현재 시간대 블록(0/6/12/18시) 사용
+        else:  # 그 외 날짜는
+            start_dt = dt.datetime.combine(for_date, dt.time(6, 0), tzinfo=KST)  # 06:00 고정
+        end_dt = start_dt + dt.timedelta(minutes=30)  # 30분 길이의 블록
+        event = {  # Google Calendar API가 요구하는 이벤트 본문을 구성
+            "summary": summary,  # 일정 제목
+            "description": self._to_html_description(description),  # HTML 변환된 본문
+            "start": {"dateTime": start_dt.isoformat(), "timeZone": "Asia/Seoul"},  # 시작 시각과 타임존
+            "end":   {"dateTime": end_dt.isoformat(),   "timeZone": "Asia/Seoul"},  # 종료 시각과 타임존
+            "transparency": "transparent",  # 바쁨 상태를 차단하지 않도록 투명 처리
+            "reminders": {"useDefault": False, "overrides": [{"method": "popup", "minutes": 0}]},  # 즉시 팝업 알림
+        }  # 이벤트 본문 구성 완료
+        event["extendedProperties"] = {"private": {  # 날씨표식/대상날짜/내용 해시를 커스텀 메타로 저장
+            "wx": WX_MARK, "for_date": for_date.isoformat(), "content_hash": self._content_hash(event),
+        }}
+        return event  # 완성된 이벤트 본문 반환
+
+    def _list_weather_events(self, days: List[dt.date]) -> Dict[str, List[Dict[str, Any]]]:  # 여러 날짜의 날씨 이벤트를 한 번의 기간 조회로 가져옴
+        time_min = dt.datetime.combine(min(days), dt.time.min, tzinfo=KST).isoformat()  # 가장 이른 날짜 00:00
+        time_max = dt.datetime.combine(max(days), dt.time.max, tzinfo=KST).isoformat()  # 가장 늦은 날짜 23:59:59
+        wanted = {day.isoformat() for day in days}  # 대상 날짜 집합
+        by_date: Dict[str, List[Dict[str, Any]]] = {}  # 날짜 -> 이벤트 목록
+        page_token = None  # 결과가 여러 페이지일 때 사용하는 토큰
+        while True:  # 모든 페이지를 읽을 때까지 반복
+            result = self.service.events().list(  # 기간 + 날씨표식 조건으로 목록 조회
+                calendarId=self.calendar_id, timeMin=time_min, timeMax=time_max, singleEvents=True,
+                privateExtendedProperty=[f"wx={WX_MARK}"], pageToken=page_token,
+            ).execute()  # 요청 전송
+            for event in result.get("items", []):  # 조회된 이벤트를 대상 날짜별로 분류
+                for_date = event.get("extendedProperties", {}).get("private", {}).get("for_date")  # 이벤트에 기록된 대상 날짜
+                if for_date in wanted:  # 요청한 날짜의 이벤트만 사용
+                    by_date.setdefault(for_date, []).append(event)
+            page_token = result.get("nextPageToken")  # 다음 페이지가 있는지 확인
+            if not page_token:  # 마지막 페이지면 종료
+                return by_date
+
+    def sync_weather_events(self, day_to_payload: Dict[dt.date, Optional[Tuple]]) -> Dict[str, str]:  # 여러 날짜의 날씨 일정을 한 번에 동기화
+        """
+        날짜별 날씨 일정을 한 번의 기간 조회와 한 번의 배치 요청으로 맞춥니다.
+        - payload가 (제목, 설명[, 시작 시각])이면 기존 일정을 제자리 수정(patch)하고, 없으면 새로 만듭니다.
+        - 저장된 내용 해시가 같으면 아무 요청도 보내지 않습니다.
+        - payload가 None이면 해당 날짜의 일정을 삭제합니다.
+        :return: {날짜: 'created' / 'updated' / 'unchanged' / 'deleted' / 'absent' / 'failed: 오류'}
+        """
+        if not day_to_payload:  # 처리할 날짜가 없으면
+            return {}  # 바로 종료
+        existing = self._list_weather_events(list(day_to_payload))  # 대상 날짜 전체를 한 번에 조회
+        outcome: Dict[str, str] = {}  # 날짜별 처리 결과
+        mutations = []  # (요청 ID, 요청 객체, 성공 시 결과) 목록
+
+        for day, payload in sorted(day_to_payload.items()):  # 날짜 순서대로 처리
+            key = day.isoformat()  # 날짜 문자열 키
+            events = existing.get(key, [])  # 해당 날짜의 기존 일정들
+            keep, extras = (events[0], events[1:]) if events else (None, [])  # 하나만 남기고 중복 일정은 삭제 대상으로 분리
+            for extra in extras:  # 같은 날짜의 중복 일정은 삭제(결과는 실패한 경우에만 기록)
+                mutations.append((f"{key}:delete:{extra['id']}", self.service.events().delete(calendarId=self.calendar_id, eventId=extra["id"]), None))
+            if payload is None:  # 삭제 요청이면
+                if keep:  # 지울 일정이 있으면 삭제 요청 추가
+                    mutations.append((f"{key}:delete:{keep['id']}", self.service.events().delete(calendarId=self.calendar_id, eventId=keep["id"]), "deleted"))
+                else:  # 없으면 할 일 없음
+                    outcome[key] = "absent"
+                continue
+
+            event = self._build_event(day, payload)  # 새 이벤트 본문 구성
+            if keep is None:  # 기존 일정이 없으면 새로 생성
+                mutations.append((f"{key}:insert", self.service.events().insert(calendarId=self.calendar_id, body=event), "created"))
+            elif keep.get("extendedProperties", {}).get("private", {}).get("content_hash") == event["extendedProperties"]["private"]["content_hash"]:  # 내용이 같으면
+                outcome[key] = "unchanged"  # 쓰기 생략
+            else:  # 내용이 바뀌었으면 기존 일정을 제자리에서 수정
+                mutations.append((f"{key}:patch", self.service.events().patch(calendarId=self.calendar_id, eventId=keep["id"], body=event), "updated"))
+
+        if mutations:  # 보낼 변경 요청이 있으면 하나의 배치 요청으로 전송
+            def on_response(request_id, response, exception):  # 배치 안의 요청별 결과 처리
+                day_key, _, _ = request_id.partition(":")  # 요청 ID에서 날짜 추출
+                if exception is not None:  # 요청이 실패했으면
+                    outcome[day_key] = f"failed: {exception}"  # 실패 사유 기록
+                elif done_labels[request_id] and not outcome.get(day_key, "").startswith("failed"):  # 다른 요청이 이미 실패하지 않았으면
+                    outcome[day_key] = done_labels[request_id]  # 성공 결과 기록
+
+            done_labels = {request_id: label for request_id, _, label in mutations}  # 요청 ID -> 성공 시 결과
+            batch = self.service.new_batch_http_request(callback=on_response)  # 배치 요청 생성
+            for request_id, request, _ in mutations:  # 모든 변경 요청을 배치에 추가
+                batch.add(request, request_id=request_id)
+            batch.execute()  # 한 번의 HTTP 왕복으로 전송
+
+        for key, result in sorted(outcome.items()):  # 처리 결과를 로그로 출력
+            print(f"  -> [{key}] 날씨 일정: {result}")
+        return outcome  # 날짜별 처리 결과 반환
+
+    def upsert_today(self, summary: str, description: str):  # 오늘 일정을 최신 내용으로 맞춤(있으면 제자리 수정)
         today = dt.datetime.now(KST).date()  # 오늘 날짜(KST 기준)를 획득
         print(f"\n[TODAY] 오늘({today}) 날씨 일정을 최신화합니다.")  # 동작 로그를 콘솔에 출력
-        existing = self._find_event_for_date(today)  # 오늘 날짜에 해당하는 기존 날씨 이벤트 조회
-        if existing:  # 기존 이벤트가 존재하면
-            self._delete_event(existing["id"])  # 해당 이벤트를 삭제하여 중복을 방지
-            print(f"  -> 기존 오늘 일정(ID: {existing['id']}) 삭제")  # 삭제 완료 로그 출력
-        start_dt, end_dt = self._get_today_time_block()  # 현재 시간대에 맞는 30분 블록을 계산
-        new_id = self._add_event(summary, description, start_dt, end_dt)  # 계산된 블록으로 새 이벤트를 생성
-        print(f"  -> ✅ 오늘 일정 {start_dt.strftime('%H:%M')}에 생성 (ID: {new_id})")  # 생성된 일정의 시각과 ID를 로그로 안내
-
-    def upsert_tomorrow_06(self, summary: str, description: str):  # 내일 06:00 고정 시간으로 일정을 재생성
+        self.sync_weather_events({today: (summary, description)})  # 조회/수정을 일괄 동기화 로직으로 위임
+
+    def upsert_tomorrow_06(self, summary: str, description: str):  # 내일 06:00 고정 시간 일정을 최신 내용으로 맞춤
         tomorrow = dt.datetime.now(KST).date() + dt.timedelta(days=1)  # 내일 날짜(KST 기준)를 계산
         print(f"\n[TOMORROW] 내일({tomorrow}) 06:00 날씨 일정을 최신화합니다.")  # 진행 로그 출력
-        existing = self._find_event_for_date(tomorrow)  # 내일 날짜의 기존 날씨 이벤트 조회
-        if existing:  # 기존 이벤트가 있으면
-            self._delete_event(existing["id"])  # 먼저 삭제하여 중복 생성 방지
-            print("  -> 기존 내일 일정 삭제")  # 삭제 로그 출력
-        start_dt = dt.datetime.combine(tomorrow, dt.time(6, 0), tzinfo=KST)  # 내일 06:00 시작 시각을 생성
-        end_dt = start_dt + dt.timedelta(minutes=30)  # 30분 길이의 블록으로 종료 시각 계산
-        new_id = self._add_event(summary, description, start_dt, end_dt)  # 설정된 시간으로 새 이벤트 생성
-        print(f"  -> ✅ 내일 06:00 일정 생성 (ID: {new_id})")  # 생성된 이벤트 ID를 로그로 안내
+        self.sync_weather_events({tomorrow: (summary, description)})  # 내일 날짜는 06:00 블록으로 동기화
 
     def cleanup_yesterday_weather(self):  # 어제 날짜의 날씨 일정이 남아 있으면 정리(삭제)
         yesterday = dt.datetime.now(KST).date() - dt.timedelta(days=1)  # 어제 날짜(KST 기준)를 계산
         print(f"\n[CLEANUP] 어제({yesterday}) 날씨 일정 정리")  # 정리 작업 로그 출력
-        event = self._find_event_for_date(yesterday)  # 어제 날짜의 기존 날씨 이벤트 존재 여부 확인
-        if event:  # 이벤트가 존재하면
-            self._delete_event(event["id"])  # 해당 이벤트를 삭제하여 오래된 정보 제거
-            print("  -> 어제 일정을 삭제했습니다.")  # 삭제 결과 로그 출력
-        else:  # 존재하지 않으면
-            print("  -> 정리할 어제 일정이 없습니다.")  # 할 일이 없음을 알리는 로그 출력
+        self.sync_weather_events({yesterday: None})  # payload None은 삭제 요청
 
     def sync_weather_event_for_tomorrow(self, summary: str, description: str):  # 과거 하위 호환 API 이름을 현재 동작으로 매핑
         self.upsert_tomorrow_06(summary, description)  # (구) 내일 일정 생성 요청을 내일 06:00 생성 로직으로 위임
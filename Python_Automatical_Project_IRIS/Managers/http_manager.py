@@ -0,0 +1,92 @@
+# Managers/http_manager.py
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class RateLimiter:
+    """초당 요청 수를 제한하는 토큰 버킷입니다. acquire()는 토큰이 생길 때까지 기다립니다."""
+    def __init__(self, rate_per_second, burst=None):
+        self.rate = float(rate_per_second)
+        self.capacity = float(burst or rate_per_second)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_for = (1 - self.tokens) / self.rate
+            time.sleep(wait_for)
+
+
+class HttpClient:
+    """
+    모든 매니저가 함께 쓰는 HTTP 클라이언트입니다.
+    - 호스트별 keep-alive 연결 재사용 (Session + 연결 풀)
+    - 기본 연결/읽기 제한 시간
+    - 429/5xx 응답에 대한 지수 백오프 재시도
+    - 호스트별 동시 요청 수 제한 및 (설정한 경우) 초당 요청 수 제한
+    """
+    def __init__(self, connect_timeout=3.05, read_timeout=15, retries=3, backoff_factor=0.5,
+                 pool_maxsize=10, per_host_limit=4):
+        self.timeout = (connect_timeout, read_timeout)
+        self.per_host_limit = per_host_limit
+        self._host_slots = {}
+        self._rate_limits = {}
+        self._lock = threading.Lock()
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _slot_for(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_slots[host]
+
+    def set_rate_limit(self, host, rate_per_second):
+        """API 호출 한도가 있는 호스트에 초당 요청 수 제한을 설정합니다. (이미 있으면 유지)"""
+        with self._lock:
+            if host not in self._rate_limits:
+                self._rate_limits[host] = RateLimiter(rate_per_second)
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        limiter = self._rate_limits.get(urlsplit(url).netloc)
+        if limiter:
+            limiter.acquire()
+        with self._slot_for(url):
+            return self.session.get(url, params=params, headers=headers, timeout=timeout or self.timeout)
+
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_http_client():
+    """프로세스 전체에서 하나의 HttpClient를 공유합니다."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
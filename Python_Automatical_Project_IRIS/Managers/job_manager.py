@@ -0,0 +1,126 @@
+# Managers/job_manager.py
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Job:
+    def __init__(self, key, description):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.description = description
+        self.status = "queued"      # queued -> running -> done / failed
+        self.progress = "대기 중"
+        self.error = None
+        self.result = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.version = 0            # 상태가 바뀔 때마다 증가 (SSE 변경 감지용)
+        self.listeners = []
+
+    @property
+    def active(self):
+        return self.status in ("queued", "running")
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "description": self.description,
+            "status": self.status,
+            "progress": self.progress,
+            "error": self.error,
+            "version": self.version,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobManager:
+    """
+    웹 요청에서 오래 걸리는 갱신 작업(뉴스 수집, AI 요약, 날씨 조회)을 백그라운드에서 실행합니다.
+    - submit()은 작업 ID를 바로 반환하고, 진행 상황은 get() 또는 wait_for_change()로 확인합니다.
+    - 같은 키(예: 같은 키워드의 뉴스 갱신)로 진행 중인 작업이 있으면 새로 만들지 않고 그 작업에 합류합니다.
+    - 합류한 요청마다 on_done 콜백을 등록할 수 있으며, 작업이 끝나면 결과와 함께 모두 호출됩니다.
+    """
+    def __init__(self, max_workers=2, keep_finished=200):
+        self.keep_finished = keep_finished
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="iris-job")
+        self._jobs = {}
+        self._active_by_key = {}
+        self._cond = threading.Condition()
+
+    def submit(self, key, func, description="", on_done=None):
+        """
+        :param key: 중복 작업을 합치기 위한 키
+        :param func: func(report) 형태의 작업 함수, report(메시지)로 진행 상황을 알림
+        :param on_done: on_done(result) 형태의 완료 콜백 (성공한 경우에만 호출)
+        :return: 작업 ID
+        """
+        with self._cond:
+            job = self._active_by_key.get(key)
+            if job:
+                if on_done:
+                    job.listeners.append(on_done)
+                print(f"-> 진행 중인 작업에 합류합니다: {job.description} ({job.id})")
+                return job.id
+
+            job = Job(key, description)
+            if on_done:
+                job.listeners.append(on_done)
+            self._jobs[job.id] = job
+            self._active_by_key[key] = job
+            self._prune()
+        self._executor.submit(self._run, job, func)
+        return job.id
+
+    def _update(self, job, **changes):
+        with self._cond:
+            for name, value in changes.items():
+                setattr(job, name, value)
+            job.version += 1
+            self._cond.notify_all()
+
+    def _run(self, job, func):
+        self._update(job, status="running", progress="작업 시작")
+        try:
+            result = func(lambda message: self._update(job, progress=message))
+        except Exception as e:
+            print(f"❌ 백그라운드 작업 실패 ({job.description}): {e}")
+            self._release(job)
+            self._update(job, status="failed", progress="실패", error=str(e), finished_at=time.time())
+            return
+
+        # 더 이상 합류할 수 없게 한 뒤 콜백을 호출하고, 콜백이 끝난 다음에 완료로 표시
+        listeners = self._release(job)
+        for listener in listeners:
+            try:
+                listener(result)
+            except Exception as e:
+                print(f"⚠️ 작업 완료 처리 중 오류 발생: {e}")
+        self._update(job, status="done", progress="완료", result=result, finished_at=time.time())
+
+    def _release(self, job):
+        with self._cond:
+            if self._active_by_key.get(job.key) is job:
+                del self._active_by_key[job.key]
+            return list(job.listeners)
+
+    def _prune(self):
+        finished = [job for job in self._jobs.values() if not job.active]
+        for job in sorted(finished, key=lambda j: j.created_at)[:max(0, len(finished) - self.keep_finished)]:
+            del self._jobs[job.id]
+
+    def get(self, job_id):
+        with self._cond:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job else None
+
+    def wait_for_change(self, job_id, last_version, timeout=15):
+        """작업 상태가 last_version 이후로 바뀌거나 timeout이 지날 때까지 기다린 뒤 현재 상태를 반환합니다."""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: job_id not in self._jobs or self._jobs[job_id].version != last_version, timeout=timeout
+            )
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job else None
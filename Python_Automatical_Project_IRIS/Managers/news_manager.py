@@ -1,16 +1,32 @@
 # Managers/news_manager.py
-import glob
+import hashlib
 import json
 import os
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 import requests
-from rapidfuzz import fuzz
+
+from .dedup_manager import TitleIndex
+from .http_manager import get_http_client
+from .snapshot_manager import write_snapshot
+from .store_manager import BriefingArchive, SeenTopicStore
+
+_TAG_PATTERN = re.compile(r'<.*?>')
+_NOISE_PATTERN = re.compile(r'&quot;|\[.*?\]|【.*?】|「.*?」')
+
+# 같은 제목을 여러 번 정리하지 않도록 결과를 캐시
+@lru_cache(maxsize=4096)
+def _clean_title_text(title):
+    cleaned = _TAG_PATTERN.sub('', title)
+    return _NOISE_PATTERN.sub('', cleaned).strip()
 
 class NewsManager:
-    def __init__(self, naver_client_id, naver_client_secret, summarizer, file_path, threshold=50, cutoff_hour=6, days_to_keep=7):
+    def __init__(self, naver_client_id, naver_client_secret, summarizer, file_path, threshold=50, cutoff_hour=6, days_to_keep=7,
+                 summary_count=3, max_workers=4, summary_timeout=30, pages_per_keyword=2, naver_rate_limit=10,
+                 seen_window_hours=24):
         self.client_id = naver_client_id
         self.client_secret = naver_client_secret
         self.summarizer = summarizer
@@ -18,56 +34,47 @@ class NewsManager:
         self.SIMILARITY_THRESHOLD = threshold
         self.CUTOFF_HOUR = cutoff_hour
         self.DAYS_TO_KEEP_LOGS = days_to_keep
-        self.seen_topics_filepath = self._get_logical_date_filepath() if self.file_path else None
+        # 요약 대상 기사 수 / 동시에 진행할 요약 요청 수 / 기사당 제한 시간(초)
+        self.SUMMARY_COUNT = summary_count
+        self.MAX_WORKERS = max(1, max_workers)
+        self.SUMMARY_TIMEOUT = summary_timeout
+        # 이미 다룬 주제는 최근 SEEN_WINDOW_HOURS 시간 동안 다시 고르지 않음 (임시 모드에서는 기록하지 않음)
+        self.SEEN_WINDOW_HOURS = seen_window_hours
+        self.seen_store = SeenTopicStore(self.file_path, retention_days=days_to_keep) if self.file_path else None
+        # 지난 뉴스 스냅샷을 모두 남기는 보관소 (파일 경로가 있을 때만)
+        self.archive = BriefingArchive(self.file_path) if self.file_path else None
+        self.http = get_http_client()
+        # 네이버 검색 API 호출 한도에 맞춰 초당 요청 수를 제한 (페이지당 100건, 최대 1000번째까지)
+        self.http.set_rate_limit("openapi.naver.com", naver_rate_limit)
+        self.PAGE_STARTS = [1 + 100 * page for page in range(max(1, min(pages_per_keyword, 10)))]
+        # 키워드별 수집 기록 (임시 모드에서는 기록하지 않고 매번 최근 24시간을 모두 조회)
+        self.MAX_TRACKED_LINKS = 2000
+        self.fetch_state_filepath = os.path.join(self.file_path, "news_fetch_state.json") if self.file_path else None
+        self._fetch_state = {}
 
     def _clean_title(self, title):
-        cleaned = re.sub(r'<.*?>', '', title)
-        cleaned = re.sub(r'&quot;|\[.*?\]|【.*?】|「.*?」', '', cleaned).strip()
-        return cleaned
+        return _clean_title_text(title)
 
     def _get_logical_date_obj(self):
         now = datetime.now()
         return (now - timedelta(days=1)).date() if now.hour < self.CUTOFF_HOUR else now.date()
 
-    def _get_logical_date_filepath(self):
-        date_str = self._get_logical_date_obj().strftime("%Y-%m-%d")
-        os.makedirs(self.file_path, exist_ok=True)
-        return os.path.join(self.file_path, f"seen_topics_{date_str}.txt")
-
     def _load_seen_topics(self):
-        if not self.seen_topics_filepath:
-            return set()
-        try:
-            with open(self.seen_topics_filepath, 'r', encoding='utf-8') as f:
-                return set(line.strip() for line in f)
-        except FileNotFoundError:
-            return set()
+        if not self.seen_store:
+            return []
+        return self.seen_store.recent_titles(self.SEEN_WINDOW_HOURS)
         
     def _save_seen_topics(self, topics):
-        if not self.seen_topics_filepath:
-            return
-        with open(self.seen_topics_filepath, 'a', encoding='utf-8') as f:
-            for topic in topics:
-                f.write(topic + '\n')
-
-    def manage_old_files(self):
-        if not self.file_path:
+        if not self.seen_store:
             return
-        today = datetime.now().date()
-        for filename in glob.glob(os.path.join(self.file_path, "seen_topics_*.txt")):
-            try:
-                file_date_str = os.path.basename(filename).replace("seen_topics_", '').replace('.txt', '')
-                file_date = datetime.strptime(file_date_str, "%Y-%m-%d").date()
-                if (today - file_date).days >= self.DAYS_TO_KEEP_LOGS:
-                    os.remove(filename)
-            except ValueError:
-                continue
+        self.seen_store.add_many(topics)
 
     def _fetch_from_api(self, query, count, start):
-        url = f"https://openapi.naver.com/v1/search/news.json?query={query}&display={count}&start={start}&sort=sim"
+        url = "https://openapi.naver.com/v1/search/news.json"
+        params = {"query": query, "display": count, "start": start, "sort": "date"}
         headers = {"X-Naver-Client-Id": self.client_id, "X-Naver-Client-Secret": self.client_secret}
         try:
-            response = requests.get(url, headers=headers)
+            response = self.http.get(url, params=params, headers=headers)
             response.raise_for_status()
             return response.json().get('items', [])
         except requests.exceptions.RequestException as e:
@@ -75,68 +82,179 @@ class NewsManager:
             return []
 
     def _group_similar_articles(self, articles):
+        # 각 그룹의 대표 제목만 색인에 넣고, 기준 이상인 가장 앞선 그룹에 기사를 추가
         article_groups = []
+        rep_index = TitleIndex(self.SIMILARITY_THRESHOLD)
         for article in articles:
             cleaned_title = self._clean_title(article['title'])
-            found_group = False
-            for group in article_groups:
-                rep_title = self._clean_title(group[0]['title'])
-                if fuzz.token_sort_ratio(cleaned_title, rep_title) >= self.SIMILARITY_THRESHOLD:
-                    group.append(article)
-                    found_group = True
-                    break
-            if not found_group:
+            group_id = rep_index.find_first(cleaned_title)
+            if group_id is None:
+                rep_index.add(cleaned_title)
                 article_groups.append([article])
+            else:
+                article_groups[group_id].append(article)
         return article_groups
 
+    # 쉼표로 구분된 여러 키워드를 목록으로 분리 (중복/빈 값 제거, 순서 유지)
+    def _split_keywords(self, query):
+        keywords = []
+        for keyword in query.split(','):
+            keyword = keyword.strip()
+            if keyword and keyword not in keywords:
+                keywords.append(keyword)
+        return keywords
+
+    # --- 키워드별 수집 기록(high-water mark): 가장 최근 pubDate와 이미 처리한 링크 해시 ---
+    def _load_fetch_state(self):
+        # 다른 프로세스(웹/예약 실행)의 갱신을 반영하기 위해 매번 다시 읽음
+        # 임시 모드('확인', 웹 섹션 새로 고침)는 매니저를 오래 재사용하므로 기록이 남으면 두 번째부터 새 기사만 받게 됨
+        self._fetch_state = {}
+        if self.fetch_state_filepath:
+            try:
+                with open(self.fetch_state_filepath, 'r', encoding='utf-8') as f:
+                    self._fetch_state = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                pass
+        return self._fetch_state
+
+    def _save_fetch_state(self):
+        if not self.fetch_state_filepath:
+            return
+        tmp_path = f"{self.fetch_state_filepath}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._fetch_state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.fetch_state_filepath)
+        except OSError as e:
+            print(f"⚠️ 뉴스 수집 기록 저장 중 오류 발생: {e}")
+
+    @staticmethod
+    def _link_hash(article):
+        link = article.get('originallink') or article.get('link', '')
+        return hashlib.sha1(link.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def _parse_pub_date(article):
+        try:
+            return datetime.strptime(article['pubDate'], '%a, %d %b %Y %H:%M:%S %z')
+        except (ValueError, KeyError):
+            return None
+
+    # 한 키워드를 최신순으로 페이지를 넘기며 수집, 이미 처리한 기사나 24시간 이전 기사에 닿으면 중단
+    def _fetch_keyword(self, keyword, state, oldest_allowed):
+        processed = set(state.get('link_hashes', []))
+        high_water = state.get('newest_pub', 0)
+        new_articles, skipped, pages = [], 0, 0
+
+        for start in self.PAGE_STARTS:
+            items = self._fetch_from_api(keyword, 100, start)
+            pages += 1
+            reached_old = len(items) < 100
+            for article in items:
+                pub_date = self._parse_pub_date(article)
+                if pub_date is None:
+                    continue
+                if pub_date <= oldest_allowed or pub_date.timestamp() < high_water:
+                    reached_old = True
+                if self._link_hash(article) in processed or pub_date <= oldest_allowed:
+                    skipped += 1
+                    continue
+                article['keyword'] = keyword
+                new_articles.append(article)
+            if reached_old:
+                break
+
+        return new_articles, {"new": len(new_articles), "skipped": skipped, "pages": pages}
+
+    # 실제로 반환한(브리핑에 고른) 기사만 처리한 것으로 기록 (고르지 않은 주제는 다음 수집에서 다시 후보가 됨)
+    def _update_fetch_state(self, returned_articles):
+        if not self.fetch_state_filepath or not returned_articles:
+            return
+        fetch_state = self._load_fetch_state()
+        for article in returned_articles:
+            state = fetch_state.setdefault(article['keyword'], {"newest_pub": 0, "link_hashes": []})
+            state["link_hashes"] = list(dict.fromkeys(state["link_hashes"] + [self._link_hash(article)]))[-self.MAX_TRACKED_LINKS:]
+            pub_date = self._parse_pub_date(article)
+            if pub_date:
+                state["newest_pub"] = max(state["newest_pub"], pub_date.timestamp())
+        self._save_fetch_state()
+
+    # 키워드들을 동시에 수집하고, 키워드 순서대로 합침 (링크 기준 중복 제거)
+    # 수집 통계는 호출마다 따로 반환 (웹과 데몬이 같은 인스턴스를 동시에 사용하므로 인스턴스에 두지 않음)
+    def _fetch_all_keywords(self, keywords, oldest_allowed):
+        fetch_state = self._load_fetch_state()
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(keywords))) as executor:
+            results = list(executor.map(
+                lambda keyword: self._fetch_keyword(keyword, fetch_state.get(keyword, {}), oldest_allowed), keywords
+            ))
+
+        merged, seen_links, fetch_stats = [], set(), {}
+        for keyword, (articles, stats) in zip(keywords, results):
+            fetch_stats[keyword] = stats
+            print(f"-> '{keyword}' 수집: 새 기사 {stats['new']}건, 건너뜀 {stats['skipped']}건 ({stats['pages']}페이지)")
+            for article in articles:
+                link_hash = self._link_hash(article)
+                if link_hash in seen_links:
+                    continue
+                seen_links.add(link_hash)
+                merged.append(article)
+        return merged, fetch_stats
+
     def _get_new_articles(self, query, target_count=10):
-        self.manage_old_files()
-        seen_topics = self._load_seen_topics()
+        seen_index = TitleIndex(self.SIMILARITY_THRESHOLD)
+        for topic in self._load_seen_topics():
+            seen_index.add(topic)
         now = datetime.now(timezone.utc)
         twenty_four_hours_ago = now - timedelta(hours=24)
-        
-        articles_new_topics = []
-        start_index = 1
-        for _ in range(2):
-            fetched_articles = self._fetch_from_api(query, 100, start_index)
-            if not fetched_articles: break
-            
-            recent_articles = []
-            for article in fetched_articles:
-                try:
-                    pub_date_dt = datetime.strptime(article['pubDate'], '%a, %d %b %Y %H:%M:%S %z')
-                    if pub_date_dt > twenty_four_hours_ago:
-                        recent_articles.append(article)
-                except (ValueError, KeyError):
-                    continue
-            
-            articles_new_topics.extend(art for art in recent_articles if not any(fuzz.token_sort_ratio(self._clean_title(art['title']), topic) > self.SIMILARITY_THRESHOLD for topic in seen_topics))
-            if len(articles_new_topics) >= target_count * 5: break
-            start_index += 100
-            time.sleep(0.5)
 
-        if not articles_new_topics: return []
+        keywords = self._split_keywords(query)
+        if not keywords: return [], {}
+
+        recent_articles, fetch_stats = self._fetch_all_keywords(keywords, twenty_four_hours_ago)
+
+        articles_new_topics = [art for art in recent_articles if not seen_index.has_match_above(self._clean_title(art['title']))]
+
+        if not articles_new_topics: return [], fetch_stats
         
         article_groups = self._group_similar_articles(articles_new_topics)
         article_groups.sort(key=len, reverse=True)
         final_articles = [group[0] for group in article_groups][:target_count]
+        # 여러 키워드를 조회한 경우 키워드(주제)별로 모아서 반환
+        final_articles.sort(key=lambda art: keywords.index(art.get('keyword', keywords[0])))
         new_topics_to_save = [self._clean_title(art['title']) for art in final_articles]
         self._save_seen_topics(new_topics_to_save)
-        return final_articles
+        self._update_fetch_state(final_articles)
+        return final_articles, fetch_stats
+
+    # 요약 없이 새로운 기사 목록만 수집 (브리핑 파이프라인에서 다른 작업과 동시에 실행)
+    def fetch_articles(self, query, target_count=10):
+        return self.fetch_articles_with_stats(query, target_count)[0]
+
+    # fetch_articles와 같지만 이번 호출의 키워드별 수집 통계({키워드: {new, skipped, pages}})도 함께 반환
+    def fetch_articles_with_stats(self, query, target_count=10):
+        return self._get_new_articles(query, target_count)
+
+    # --- [내부 함수] 여러 기사를 묶음 요청으로 요약 (순서 유지, 실패/시간 초과 시 빈 요약) ---
+    def _summarize_all(self, descriptions):
+        texts = list(descriptions)
+        if not any(texts):
+            return [""] * len(texts)
+        return self.summarizer.summarize_many(
+            texts, max_workers=self.MAX_WORKERS, timeout=self.SUMMARY_TIMEOUT
+        )
 
     # --- [내부 공통 함수] 뉴스 데이터를 가공하여 최종 딕셔너리 형태로 만듦 ---
-    def _create_news_data_dict(self, query, target_count):
-        final_articles = self._get_new_articles(query, target_count)
+    def _create_news_data_dict(self, query, target_count, articles=None):
+        final_articles = articles if articles is not None else self.fetch_articles(query, target_count)
+        descriptions = [self._clean_title(article.get('description', ''))
+                        for article in (final_articles or [])[:self.SUMMARY_COUNT]]
+        summaries = self._summarize_all(descriptions)
         
         articles_for_export = []
         if final_articles:
             for i, article in enumerate(final_articles):
                 try:
-                    summary = ""
-                    if i < 3:
-                        description = self._clean_title(article.get('description', ''))
-                        if description:
-                            summary = self.summarizer.summarize(description)
+                    summary = summaries[i] if i < len(summaries) else ""
                     
                     try:
                         pub_date = datetime.strptime(article['pubDate'], '%a, %d %b %Y %H:%M:%S %z')
@@ -146,6 +264,7 @@ class NewsManager:
 
                     articles_for_export.append({
                         'cleaned_title': self._clean_title(article['title']),
+                        'keyword': article.get('keyword', query),
                         'summary': summary,
                         'naver_link': article['link'],
                         'publication_date': article['pubDate'],
@@ -159,30 +278,35 @@ class NewsManager:
 
         return {
             "topic": query,
-            "articles": articles_for_export
+            "articles": articles_for_export,
         }
 
     # '갱신' 시 호출: 데이터를 생성하고 파일에 저장
-    def run_workflow(self, query, target_count=10):
+    # articles를 넘기면 (fetch_articles로 미리 수집한) 해당 기사 목록을 그대로 사용
+    def run_workflow(self, query, target_count=10, articles=None):
         if not self.file_path:
             print("❌ NewsManager: 파일 경로가 지정되지 않아 'run_workflow'를 실행할 수 없습니다.")
             return
 
-        output_data = self._create_news_data_dict(query, target_count)
+        output_data = self._create_news_data_dict(query, target_count, articles)
         date_str = self._get_logical_date_obj().strftime("%Y-%m-%d")
         output_filename = os.path.join(self.file_path, f"news_summary_{date_str}.json")
         
         try:
-            with open(output_filename, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, ensure_ascii=False, indent=4)
-            print(f"✅ '{output_filename}' 파일로 뉴스 정보 저장을 완료했습니다.")
+            if write_snapshot(output_filename, output_data):
+                print(f"✅ '{output_filename}' 파일로 뉴스 정보 저장을 완료했습니다.")
         except Exception as e:
             print(f"❌ 최종 JSON 파일 저장 중 심각한 오류가 발생했습니다: {e}")
+        try:
+            self.archive.add_news(date_str, output_data)
+        except Exception as e:
+            print(f"⚠️ 뉴스 보관소 기록 중 오류 발생: {e}")
 
     # '확인' 시 호출: 데이터를 생성만 하고 파일에 저장하지 않음
     def get_temporary_news(self, query, target_count=10):
         print("-> 임시 뉴스 정보를 조회합니다 (파일 저장 안 함).")
-        return self._create_news_data_dict(query, target_count)
+        output_data = self._create_news_data_dict(query, target_count)
+        return output_data
     
     # 뉴스 기록 초기화
     def clear_today_seen_topics(self):
@@ -190,12 +314,15 @@ class NewsManager:
             print("-> 임시 모드에서는 뉴스 기록을 초기화할 수 없습니다.")
             return
             
-        filepath = self._get_logical_date_filepath()
+        # 수집 기록도 함께 초기화하여 다음 조회 시 처음부터 다시 수집
+        if self.fetch_state_filepath and os.path.exists(self.fetch_state_filepath):
+            os.remove(self.fetch_state_filepath)
+
         try:
-            if os.path.exists(filepath):
-                os.remove(filepath)
-                print(f"✅ '{filepath}' 파일을 삭제하여 뉴스 주제 기억을 초기화했습니다.")
+            deleted = self.seen_store.clear_recent(self.SEEN_WINDOW_HOURS)
+            if deleted:
+                print(f"✅ 최근 {self.SEEN_WINDOW_HOURS}시간의 뉴스 주제 기록 {deleted}건을 삭제하여 뉴스 주제 기억을 초기화했습니다.")
             else:
-                print("-> 삭제할 뉴스 기억 파일이 없습니다.")
+                print("-> 삭제할 뉴스 주제 기록이 없습니다.")
         except Exception as e:
-            print(f"❌ 뉴스 기억 파일 삭제 중 오류 발생: {e}")
\ No newline at end of file
+            print(f"❌ 뉴스 주제 기록 삭제 중 오류 발생: {e}")
\ No newline at end of file
@@ -0,0 +1,243 @@
+# Managers/outbox_manager.py
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+
+class EmailOutbox:
+    """
+    보낼 메일을 SQLite에 먼저 저장하고, 백그라운드 작업자가 SMTP로 발송하는 보낸편지함입니다.
+    - enqueue()는 저장만 하고 바로 반환하므로 요청 처리 시간이 SMTP 속도와 무관합니다.
+    - 발송에 실패한 수신자는 지수 백오프로 다시 시도하고, max_attempts를 넘으면 'dead' 상태로 남깁니다.
+    - 메일 서버가 잠시 멈춰도 저장된 메일은 사라지지 않으며, 웹 앱과 IRIS.py가 같은 편지함을 함께 처리해도 안전합니다.
+
+    수신자별 상태: queued -> sending -> sent / retry(재시도 대기) / dead(포기)
+    """
+    PENDING = ("queued", "retry", "sending")
+
+    def __init__(self, file_path, sender_factory, filename="email_outbox.sqlite3", parallel=2,
+                 max_attempts=5, base_delay=30, max_delay=1800, poll_interval=5,
+                 sending_timeout=600, retention_days=30, personalize=None):
+        """
+        :param sender_factory: 발송할 때마다 SenderManager를 돌려주는 함수 (설정이 바뀌어도 최신 값 사용)
+        :param personalize: 저장된 본문에 수신자별 값을 채워 넣는 함수 (예: BriefingRenderer.personalize)
+        :param sending_timeout: 'sending' 상태로 이 시간(초) 넘게 남은 수신자는 중단된 것으로 보고 다시 발송
+        """
+        os.makedirs(file_path, exist_ok=True)
+        self.db_path = os.path.join(file_path, filename)
+        self.sender_factory = sender_factory
+        self.parallel = parallel
+        self.personalize = personalize
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.sending_timeout = sending_timeout
+        self.retention_seconds = retention_days * 24 * 3600
+        self._wakeup = threading.Event()
+        self._worker = None
+        self._start_lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA busy_timeout = 10000")
+        return conn
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS messages (
+                    id         TEXT PRIMARY KEY,
+                    subject    TEXT NOT NULL,
+                    body       TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS deliveries (
+                    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+                    message_id      TEXT NOT NULL REFERENCES messages (id),
+                    recipient       TEXT NOT NULL,
+                    status          TEXT NOT NULL,
+                    attempts        INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    last_error      TEXT,
+                    updated_at      REAL NOT NULL,
+                    sent_at         REAL
+                );
+                CREATE INDEX IF NOT EXISTS idx_deliveries_due ON deliveries (status, next_attempt_at);
+                CREATE INDEX IF NOT EXISTS idx_deliveries_message ON deliveries (message_id);
+            """)
+
+    # ----------- 저장 -----------
+    def enqueue(self, recipients, subject, body):
+        """
+        메일을 편지함에 저장하고 메시지 ID를 반환합니다. (발송은 작업자가 처리)
+        :param recipients: 수신자 목록 또는 쉼표로 구분된 문자열
+        """
+        if isinstance(recipients, str):
+            recipients = recipients.split(",")
+        recipients = list(dict.fromkeys(r.strip() for r in recipients if r and r.strip()))
+        if not recipients:
+            raise ValueError("수신자가 없습니다.")
+
+        message_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("INSERT INTO messages (id, subject, body, created_at) VALUES (?, ?, ?, ?)",
+                         (message_id, subject, body, now))
+            conn.executemany(
+                "INSERT INTO deliveries (message_id, recipient, status, next_attempt_at, updated_at) VALUES (?, ?, 'queued', ?, ?)",
+                [(message_id, recipient, now, now) for recipient in recipients],
+            )
+        print(f"📮 메일을 보낸편지함에 저장했습니다: {len(recipients)}명 ({message_id})")
+        self._wakeup.set()
+        return message_id
+
+    # ----------- 발송 -----------
+    def _claim_due(self, conn, now):
+        # 발송할 차례인 수신자를 'sending'으로 바꿔 다른 작업자(다른 프로세스 포함)가 중복 발송하지 않게 함
+        rows = conn.execute(
+            """SELECT id, message_id, recipient FROM deliveries
+               WHERE (status IN ('queued', 'retry') AND next_attempt_at <= ?)
+                  OR (status = 'sending' AND updated_at < ?)
+               ORDER BY next_attempt_at LIMIT 200""",
+            (now, now - self.sending_timeout),
+        ).fetchall()
+        claimed = []
+        for delivery_id, message_id, recipient in rows:
+            updated = conn.execute(
+                """UPDATE deliveries SET status = 'sending', updated_at = ?
+                   WHERE id = ? AND (status IN ('queued', 'retry') OR (status = 'sending' AND updated_at < ?))""",
+                (now, delivery_id, now - self.sending_timeout),
+            ).rowcount
+            if updated:
+                claimed.append((delivery_id, message_id, recipient))
+        return claimed
+
+    def _retry_delay(self, attempts):
+        return min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+
+    def drain(self):
+        """발송할 차례가 된 메일을 모두 보냅니다. :return: (성공 수, 실패 수)"""
+        with self._drain_lock:
+            with self._connect() as conn:
+                claimed = self._claim_due(conn, time.time())
+            if not claimed:
+                return 0, 0
+
+            by_message = {}
+            for delivery_id, message_id, recipient in claimed:
+                by_message.setdefault(message_id, []).append((delivery_id, recipient))
+
+            sent_count, failed_count = 0, 0
+            for message_id, deliveries in by_message.items():
+                with self._connect() as conn:
+                    subject, body = conn.execute("SELECT subject, body FROM messages WHERE id = ?", (message_id,)).fetchone()
+                try:
+                    results = self.sender_factory().send_bulk(
+                        [recipient for _, recipient in deliveries], subject, body,
+                        parallel=self.parallel, personalize=self.personalize
+                    )
+                except Exception as e:
+                    results = {recipient: {"success": False, "error": str(e)} for _, recipient in deliveries}
+                sent, failed = self._record_results(deliveries, results)
+                sent_count += sent
+                failed_count += failed
+            return sent_count, failed_count
+
+    def _record_results(self, deliveries, results):
+        now = time.time()
+        sent, failed = 0, 0
+        with self._connect() as conn:
+            for delivery_id, recipient in deliveries:
+                result = results.get(recipient) or {"success": False, "error": "발송 결과 없음"}
+                if result["success"]:
+                    conn.execute(
+                        "UPDATE deliveries SET status = 'sent', attempts = attempts + 1, last_error = NULL, "
+                        "updated_at = ?, sent_at = ? WHERE id = ?",
+                        (now, now, delivery_id),
+                    )
+                    sent += 1
+                    continue
+
+                attempts = conn.execute("SELECT attempts FROM deliveries WHERE id = ?", (delivery_id,)).fetchone()[0] + 1
+                if attempts >= self.max_attempts:
+                    status, next_attempt_at = "dead", now
+                    print(f"❌ {recipient} 메일 발송을 {attempts}회 실패하여 포기합니다: {result['error']}")
+                else:
+                    status, next_attempt_at = "retry", now + self._retry_delay(attempts)
+                    print(f"⚠️ {recipient} 메일 발송 실패, {self._retry_delay(attempts):.0f}초 후 다시 시도합니다: {result['error']}")
+                conn.execute(
+                    "UPDATE deliveries SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?, updated_at = ? "
+                    "WHERE id = ?",
+                    (status, attempts, next_attempt_at, result["error"], now, delivery_id),
+                )
+                failed += 1
+        return sent, failed
+
+    def cleanup(self):
+        # 보관 기간이 지난 완료(sent/dead) 메일 정리
+        cutoff = time.time() - self.retention_seconds
+        with self._connect() as conn:
+            conn.execute("DELETE FROM deliveries WHERE status IN ('sent', 'dead') AND updated_at < ?", (cutoff,))
+            conn.execute("DELETE FROM messages WHERE id NOT IN (SELECT DISTINCT message_id FROM deliveries)")
+
+    # ----------- 작업자 -----------
+    def start(self):
+        """편지함을 주기적으로 비우는 백그라운드 작업자를 시작합니다. (이미 실행 중이면 무시)"""
+        with self._start_lock:
+            if self._worker and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, name="iris-outbox", daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        last_cleanup = 0.0
+        while True:
+            try:
+                self.drain()
+                if time.time() - last_cleanup > 3600:
+                    self.cleanup()
+                    last_cleanup = time.time()
+            except Exception as e:
+                print(f"⚠️ 보낸편지함 처리 중 오류 발생: {e}")
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    # ----------- 상태 조회 -----------
+    def status(self, message_id):
+        """메시지의 전체 상태와 수신자별 상태를 반환합니다. 없으면 None"""
+        with self._connect() as conn:
+            message = conn.execute("SELECT subject, created_at FROM messages WHERE id = ?", (message_id,)).fetchone()
+            if message is None:
+                return None
+            rows = conn.execute(
+                "SELECT recipient, status, attempts, next_attempt_at, last_error, sent_at "
+                "FROM deliveries WHERE message_id = ? ORDER BY id",
+                (message_id,),
+            ).fetchall()
+
+        deliveries = [
+            {"recipient": r, "status": s, "attempts": a, "next_attempt_at": n, "last_error": e, "sent_at": t}
+            for r, s, a, n, e, t in rows
+        ]
+        statuses = {d["status"] for d in deliveries}
+        if statuses & set(self.PENDING):
+            overall = "pending"
+        elif statuses == {"sent"}:
+            overall = "sent"
+        elif statuses == {"dead"}:
+            overall = "dead"
+        else:
+            overall = "partial"
+        return {
+            "message_id": message_id,
+            "subject": message[0],
+            "created_at": message[1],
+            "status": overall,
+            "deliveries": deliveries,
+        }
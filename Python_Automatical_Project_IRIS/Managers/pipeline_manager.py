@@ -0,0 +1,90 @@
+# Managers/pipeline_manager.py
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class Stage:
+    def __init__(self, name, func, deps=(), timeout=None):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.timeout = timeout
+
+
+class PipelineManager:
+    """
+    브리핑 작업을 단계(Stage) 단위로 나누어, 의존 관계가 없는 단계는 동시에 실행합니다.
+    - 각 단계의 함수는 지금까지 끝난 단계들의 결과 딕셔너리(results)를 인자로 받습니다.
+    - 실패하거나 제한 시간을 넘긴 단계에 의존하는 단계는 건너뜁니다.
+    - run()이 끝나면 단계별 상태와 소요 시간을 timings에 기록합니다.
+    """
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.stages = {}
+        self.results = {}
+        self.timings = {}
+        self.status = {}
+
+    def add_stage(self, name, func, deps=(), timeout=None):
+        for dep in deps:
+            if dep not in self.stages:
+                raise ValueError(f"'{name}' 단계의 선행 단계 '{dep}'가 등록되지 않았습니다.")
+        self.stages[name] = Stage(name, func, deps, timeout)
+        return self
+
+    def run(self):
+        pending = dict(self.stages)
+        running = {}  # future -> (stage, 시작 시각)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while pending or running:
+                # 1. 선행 단계가 모두 성공한 단계는 실행, 하나라도 실패했으면 건너뜀
+                for name, stage in list(pending.items()):
+                    dep_status = [self.status.get(dep) for dep in stage.deps]
+                    if any(s in ("failed", "timeout", "skipped") for s in dep_status):
+                        self._finish(name, "skipped", 0.0)
+                        del pending[name]
+                    elif all(s == "done" for s in dep_status):
+                        future = executor.submit(stage.func, dict(self.results))
+                        running[future] = (stage, time.monotonic())
+                        del pending[name]
+
+                if not running:
+                    continue
+
+                # 2. 가장 먼저 끝나는 단계 또는 가장 가까운 제한 시간까지 대기
+                deadlines = [start + stage.timeout for stage, start in running.values() if stage.timeout]
+                wait_for = max(0, min(deadlines) - time.monotonic()) if deadlines else None
+                done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                now = time.monotonic()
+                for future in list(running):
+                    stage, start = running[future]
+                    if future in done:
+                        try:
+                            self.results[stage.name] = future.result()
+                            self._finish(stage.name, "done", now - start)
+                        except Exception as e:
+                            print(f"❌ '{stage.name}' 단계 실행 중 오류가 발생했습니다: {e}")
+                            self._finish(stage.name, "failed", now - start)
+                        del running[future]
+                    elif stage.timeout and now - start >= stage.timeout:
+                        future.cancel()
+                        print(f"❌ '{stage.name}' 단계가 제한 시간({stage.timeout}초)을 넘겼습니다.")
+                        self._finish(stage.name, "timeout", now - start)
+                        del running[future]
+        finally:
+            # 제한 시간을 넘긴 단계는 기다리지 않고 반환
+            executor.shutdown(wait=False, cancel_futures=True)
+        return self.results
+
+    def _finish(self, name, status, elapsed):
+        self.status[name] = status
+        self.timings[name] = elapsed
+
+    def report(self):
+        lines = ["⏱️ 단계별 소요 시간"]
+        for name in self.stages:
+            status = self.status.get(name, "pending")
+            lines.append(f"  - {name:<18} {status:<8} {self.timings.get(name, 0.0):6.2f}s")
+        return "\n".join(lines)
@@ -0,0 +1,80 @@
+# Managers/profile_manager.py
+import subprocess
+import sys
+import time
+import unicodedata
+from contextlib import contextmanager
+
+
+def measure_imports(module, cwd=None):
+    """
+    새 파이썬 프로세스에서 `python -X importtime -c "import module"`을 실행해 import 시간을 잽니다.
+    (이미 불러온 모듈은 다시 잴 수 없으므로 별도 프로세스에서 측정)
+    :return: (전체 시간(초), [(최상위 패키지, 그 패키지 모듈들의 자체 import 시간 합(초))] 오래 걸린 순)
+    """
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, capture_output=True, text=True, encoding="utf-8", errors="replace",
+    )
+    total = time.perf_counter() - started
+    if completed.returncode != 0:
+        last_line = completed.stderr.strip().splitlines()[-1:] or ["알 수 없는 오류"]
+        raise RuntimeError(f"'{module}'을(를) 불러오지 못했습니다: {last_line[0]}")
+
+    packages = {}
+    for line in completed.stderr.splitlines():
+        # 형식: "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # 머리글 줄
+        # 누가 불러왔는지와 상관없이 최상위 패키지 이름(예: 'google', 'flask')별로 자체 시간을 합산
+        top = name.strip().split(".")[0]
+        packages[top] = packages.get(top, 0.0) + int(self_us) / 1_000_000
+    return total, sorted(packages.items(), key=lambda item: item[1], reverse=True)
+
+
+def _display_width(text):
+    # 한글 등 전각 문자는 터미널에서 두 칸을 차지하므로 표의 열을 맞출 때 2로 계산
+    return sum(2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1 for ch in text)
+
+
+class StartupProfiler:
+    """
+    시작 단계별 소요 시간을 기록하고 보고서로 출력합니다.
+    - step(이름)으로 감싼 구간의 시간을 재고, 실패해도 다음 단계를 계속 잽니다.
+    """
+    def __init__(self, title):
+        self.title = title
+        self.steps = []  # (이름, 소요 시간, 오류 메시지 또는 None)
+
+    @contextmanager
+    def step(self, name):
+        started = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = str(e)
+        self.steps.append((name, time.perf_counter() - started, error))
+
+    def add_imports(self, module, cwd=None, top=12):
+        """module을 불러오는 시간과, 오래 걸린 패키지 top개를 기록합니다."""
+        try:
+            total, packages = measure_imports(module, cwd=cwd)
+        except Exception as e:
+            self.steps.append((f"import {module}", 0.0, str(e)))
+            return
+        self.steps.append((f"import {module} (프로세스 시작 포함)", total, None))
+        for name, seconds in packages[:top]:
+            self.steps.append((f"  └ {name}", seconds, None))
+
+    def report(self):
+        width = max([_display_width(name) for name, _, _ in self.steps] + [10])
+        lines = [f"⏱️ {self.title}", "-" * (width + 13)]
+        for name, seconds, error in self.steps:
+            line = f"{name}{' ' * (width - _display_width(name))}  {seconds * 1000:8.1f} ms"
+            lines.append(f"{line}  ❌ {error}" if error else line)
+        return "\n".join(lines)
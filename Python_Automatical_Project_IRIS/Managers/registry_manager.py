@@ -0,0 +1,146 @@
+# Managers/registry_manager.py
+import configparser
+import os
+import threading
+from collections import OrderedDict
+
+from .ai_manager import GeminiSummarizer
+from .cache_manager import SummaryCache
+from .news_manager import NewsManager
+from .outbox_manager import EmailOutbox
+from .render_manager import BriefingRenderer
+from .report_manager import ReportManager
+from .sender_manager import SenderManager
+from .weather_manager import WeatherManager
+
+
+def get_news_options(config):
+    # 뉴스 요약 동시 처리 옵션 (없으면 기본값 사용)
+    return {
+        "summary_count": config.getint('NEWS', 'summary_count', fallback=3),
+        "max_workers": config.getint('NEWS', 'summary_workers', fallback=4),
+        "summary_timeout": config.getfloat('NEWS', 'summary_timeout', fallback=30),
+    }
+
+
+def get_target_news_count(config, default=10):
+    # 브리핑에 넣을 뉴스 개수 (비어 있거나 숫자가 아니면 기본값 사용)
+    try:
+        return max(1, int(config.get('USER', 'target_news_count', fallback='')))
+    except ValueError:
+        return default
+
+
+class ManagerRegistry:
+    """
+    매니저 객체를 한 번만 만들어 여러 요청에서 재사용하기 위한 저장소입니다.
+    - config.ini는 파일의 수정 시각/크기가 바뀐 경우에만 다시 읽습니다.
+    - 각 매니저는 자신이 사용하는 설정 값을 키로 기억하고, 그 값이 바뀐 매니저만 새로 만듭니다.
+    """
+    def __init__(self, config_path, max_weather_managers=16, template_dir=None):
+        self.config_path = config_path
+        self.template_dir = template_dir or os.path.join(os.path.dirname(os.path.abspath(config_path)), 'templates')
+        self.max_weather_managers = max_weather_managers
+        self._config = None
+        self._config_stamp = None
+        self._instances = OrderedDict()  # 이름 -> (설정 키, 매니저)
+        self._lock = threading.RLock()
+
+    # ----------- 설정 파일 -----------
+    def get_config(self):
+        try:
+            stat = os.stat(self.config_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            stamp = None
+        with self._lock:
+            if self._config is None or stamp != self._config_stamp:
+                config = configparser.ConfigParser()
+                config.read(self.config_path, encoding='utf-8')
+                self._config, self._config_stamp = config, stamp
+                print("-> config.ini를 (다시) 읽었습니다.")
+            return self._config
+
+    def _get(self, name, key, factory):
+        with self._lock:
+            cached = self._instances.get(name)
+            if cached and cached[0] == key:
+                self._instances.move_to_end(name)
+                return cached[1]
+            instance = factory()
+            self._instances[name] = (key, instance)
+            self._instances.move_to_end(name)
+            self._evict_weather()
+            return instance
+
+    def _evict_weather(self):
+        # 도시별 WeatherManager는 최근 사용한 max_weather_managers개만 유지
+        weather_names = [name for name in self._instances if name[0] == "weather"]
+        for name in weather_names[:max(0, len(weather_names) - self.max_weather_managers)]:
+            del self._instances[name]
+
+    # ----------- 매니저 -----------
+    def summarizer(self):
+        config = self.get_config()
+        api_key = config['API']['GOOGLE_GEMINI_API_KEY']
+        output_path = config['PATHS']['output_directory']
+        return self._get(
+            ("summarizer",), (api_key, output_path),
+            lambda: GeminiSummarizer(api_key=api_key, cache=SummaryCache(output_path))
+        )
+
+    def news(self, file_path):
+        config = self.get_config()
+        client_id = config['API']['NAVER_API_KEY']
+        client_secret = config['API']['NAVER_API_PW']
+        options = get_news_options(config)
+        summarizer = self.summarizer()
+        return self._get(
+            ("news", file_path), (client_id, client_secret, tuple(sorted(options.items())), id(summarizer)),
+            lambda: NewsManager(client_id, client_secret, summarizer, file_path, **options)
+        )
+
+    def weather(self, city, file_path):
+        config = self.get_config()
+        api_key = config['API']["WEATHER_API_KEY"]
+        summarizer = self.summarizer()
+        return self._get(
+            ("weather", city, file_path), (api_key, id(summarizer)),
+            lambda: WeatherManager(api_key, city, file_path, summarizer)
+        )
+
+    def report(self):
+        config = self.get_config()
+        output_path = config['PATHS']['output_directory']
+        web_url = config['PATHS']['web_url']
+        return self._get(
+            ("report",), (output_path, web_url),
+            lambda: ReportManager(file_path=output_path, web_url=web_url)
+        )
+
+    def sender(self):
+        config = self.get_config()
+        settings = (
+            config['EMAIL']['SMTP_SERVER'], int(config['EMAIL']['SMTP_PORT']),
+            config['EMAIL']['SENDER_EMAIL'], config['EMAIL']['SENDER_PASSWORD'],
+        )
+        return self._get(("sender",), settings, lambda: SenderManager(*settings))
+
+    def renderer(self):
+        output_path = self.get_config()['PATHS']['output_directory']
+        return self._get(
+            ("renderer",), (self.template_dir, output_path),
+            lambda: BriefingRenderer(self.template_dir, cache_dir=os.path.join(output_path, 'template_cache'))
+        )
+
+    def outbox(self):
+        # 발송할 때마다 self.sender()를 호출하므로 SMTP 설정이 바뀌어도 편지함은 그대로 재사용
+        config = self.get_config()
+        output_path = config['PATHS']['output_directory']
+        parallel = config.getint('EMAIL', 'parallel_connections', fallback=2)
+        renderer = self.renderer()
+        return self._get(
+            ("outbox",), (output_path, parallel, id(renderer)),
+            lambda: EmailOutbox(output_path, sender_factory=self.sender, parallel=parallel,
+                                personalize=renderer.personalize)
+        )
@@ -0,0 +1,164 @@
+# Managers/render_manager.py
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from markupsafe import escape
+
+from .snapshot_manager import content_hash
+
+_STYLE_BLOCK = re.compile(r"<style[^>]*>(.*?)</style>", re.S | re.I)
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_RULE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_SIMPLE_SELECTOR = re.compile(r"^([a-zA-Z][a-zA-Z0-9]*)?((?:\.[\w-]+)*)$")
+_TAG = re.compile(r"<(/?)([a-zA-Z][a-zA-Z0-9]*)((?:\"[^\"]*\"|'[^']*'|[^'\">])*)>")
+_ATTR = re.compile(r"""([\w-]+)\s*=\s*("[^"]*"|'[^']*')""")
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+
+
+def parse_css_rules(css):
+    """
+    <style>의 CSS 중 태그/클래스 선택자와 자손 선택자(예: '.article-card h3 a')로만 된 규칙을 골라냅니다.
+    :return: [(선택자 단계 목록, 명시도, 순서, 선언 목록)]
+    """
+    rules = []
+    for order, (selectors, body) in enumerate(_CSS_RULE.findall(_CSS_COMMENT.sub("", css))):
+        declarations = [d.strip() for d in body.split(";") if d.strip()]
+        for selector in selectors.split(","):
+            parts = []
+            for part in selector.split():
+                match = _SIMPLE_SELECTOR.match(part)
+                if not match:
+                    parts = None  # :last-child 등은 인라인하지 않고 <style>에 그대로 둠
+                    break
+                parts.append((match.group(1), set(filter(None, match.group(2).split(".")))))
+            if parts:
+                specificity = (sum(len(classes) for _, classes in parts), sum(1 for tag, _ in parts if tag))
+                rules.append((parts, specificity, order, declarations))
+    return rules
+
+
+def _matches(part, element):
+    tag, classes = part
+    return (not tag or tag == element[0]) and classes <= element[1]
+
+
+def _selector_matches(parts, stack):
+    # 마지막 단계는 현재 요소, 나머지는 조상 중에서 순서대로 찾음
+    if not _matches(parts[-1], stack[-1]):
+        return False
+    ancestors = stack[:-1]
+    index = len(ancestors) - 1
+    for part in reversed(parts[:-1]):
+        while index >= 0 and not _matches(part, ancestors[index]):
+            index -= 1
+        if index < 0:
+            return False
+        index -= 1
+    return True
+
+
+def inline_css(source, rules):
+    """
+    (템플릿) HTML의 시작 태그마다 일치하는 CSS 규칙을 style 속성으로 넣습니다.
+    원래 있던 style 속성의 값이 우선하며, Jinja 태그는 글자 그대로 두므로 템플릿 원본에 적용할 수 있습니다.
+    """
+    stack = []
+    output, last = [], 0
+    for match in _TAG.finditer(source):
+        closing, tag, attrs = match.group(1), match.group(2).lower(), match.group(3)
+        if closing:
+            for depth in range(len(stack) - 1, -1, -1):
+                if stack[depth][0] == tag:
+                    del stack[depth:]
+                    break
+            continue
+
+        attr_values = {name.lower(): value[1:-1] for name, value in _ATTR.findall(attrs)}
+        element = (tag, set(attr_values.get("class", "").split()))
+        stack.append(element)
+        matched = sorted((r for r in rules if _selector_matches(r[0], stack)), key=lambda r: (r[1], r[2]))
+        if tag in _VOID_TAGS or attrs.rstrip().endswith("/"):
+            stack.pop()
+        if not matched:
+            continue
+
+        declarations = [d for rule in matched for d in rule[3]]
+        existing = attr_values.get("style", "").strip().rstrip(";")
+        style = "; ".join(declarations + ([existing] if existing else []))
+        if "style" in attr_values:
+            new_attrs = _ATTR.sub(
+                lambda m: f'style="{style}"' if m.group(1).lower() == "style" else m.group(0), attrs
+            )
+        else:
+            new_attrs = f'{attrs.rstrip("/").rstrip()} style="{style}"' + (" /" if attrs.rstrip().endswith("/") else "")
+        output.append(source[last:match.start()])
+        output.append(f"<{tag}{new_attrs}>")
+        last = match.end()
+    output.append(source[last:])
+    return "".join(output)
+
+
+class _InlineCssLoader(FileSystemLoader):
+    """템플릿을 읽을 때(컴파일 전에) 한 번만 CSS를 인라인하는 로더"""
+    def __init__(self, searchpath, rules):
+        super().__init__(searchpath)
+        self.rules = rules
+
+    def get_source(self, environment, template):
+        source, filename, uptodate = super().get_source(environment, template)
+        return inline_css(source, self.rules), filename, uptodate
+
+
+class BriefingRenderer:
+    """
+    Flask 앱 없이 templates/ 폴더의 이메일 브리핑을 렌더링합니다.
+    - Jinja 환경은 한 번만 만들고, 컴파일 결과는 디스크 바이트코드 캐시(cache_dir)에 저장해 다음 실행에서도 재사용합니다.
+    - 레이아웃(layouts/base.html)의 CSS는 템플릿을 불러올 때 한 번만 style 속성으로 인라인합니다.
+    - 같은 브리핑 데이터는 한 번만 렌더링하고, 수신자마다 달라지는 값은 personalize()로 치환만 합니다.
+    """
+    RECIPIENT_EMAIL = "%%IRIS_RECIPIENT_EMAIL%%"
+
+    def __init__(self, template_dir, cache_dir=None, inline_styles=True, max_rendered=16):
+        rules = []
+        if inline_styles:
+            with open(os.path.join(template_dir, "layouts", "base.html"), "r", encoding="utf-8") as f:
+                rules = [rule for css in _STYLE_BLOCK.findall(f.read()) for rule in parse_css_rules(css)]
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self.env = Environment(
+            loader=_InlineCssLoader(template_dir, rules),
+            autoescape=select_autoescape(["html", "xml"]),
+            bytecode_cache=FileSystemBytecodeCache(cache_dir) if cache_dir else None,
+            auto_reload=True,
+        )
+        self.max_rendered = max_rendered
+        self._rendered = OrderedDict()  # (템플릿, 데이터 해시) -> HTML
+        self._lock = threading.Lock()
+
+    def render(self, template_name, **context):
+        return self.env.get_template(template_name).render(**context)
+
+    def render_briefing(self, briefing_data, template_name="email_briefing.html"):
+        """
+        브리핑을 수신자 자리 표시자가 들어간 HTML로 렌더링합니다. (같은 데이터는 메모리에서 재사용)
+        실제 발송 전 personalize()로 수신자 값을 채웁니다.
+        """
+        key = (template_name, content_hash(briefing_data))
+        with self._lock:
+            if key in self._rendered:
+                self._rendered.move_to_end(key)
+                return self._rendered[key]
+        html = self.render(template_name, data=briefing_data, recipient={"email": self.RECIPIENT_EMAIL})
+        with self._lock:
+            self._rendered[key] = html
+            while len(self._rendered) > self.max_rendered:
+                self._rendered.popitem(last=False)
+        return html
+
+    @classmethod
+    def personalize(cls, html, recipient_email):
+        """렌더링된 HTML의 수신자 자리 표시자를 실제 값으로 바꿉니다."""
+        return html.replace(cls.RECIPIENT_EMAIL, str(escape(recipient_email)))
@@ -1,13 +1,22 @@
 import json
 import os
+import threading
 from datetime import datetime, timedelta
 
+from .snapshot_manager import read_snapshot
+from .store_manager import BriefingArchive
+
 class ReportManager:
+    # 파싱한 JSON 파일 캐시 (경로 -> (수정 시각, 크기, 데이터)), 같은 프로세스의 모든 인스턴스가 공유
+    _parsed_files = {}
+    _parsed_lock = threading.Lock()
+
     def __init__(self, file_path, web_url="", cutoff_hour=6):
         self.file_path = file_path
         self.web_url = web_url
         # [추가] NewsManager와 동일한 기준 시간을 설정
         self.CUTOFF_HOUR = cutoff_hour
+        self._archive = None
 
     # [추가] NewsManager와 동일한 날짜 계산 함수
     def _get_logical_date_obj(self):
@@ -17,35 +26,78 @@ class ReportManager:
         else:
             return now.date()
 
-    def get_briefing_data(self, subject=""):
+    def _get_news_filename(self):
         # [수정] 위에서 만든 함수를 사용하여 오늘 날짜 문자열 생성
         today_str = self._get_logical_date_obj().strftime('%Y-%m-%d')
-        
-        news_filename = os.path.join(self.file_path, f"news_summary_{today_str}.json")
-        weather_filename = os.path.join(self.file_path, 'weather_data.json')
+        return os.path.join(self.file_path, f"news_summary_{today_str}.json")
+
+    def _get_weather_filename(self):
+        return os.path.join(self.file_path, 'weather_data.json')
+
+    # 섹션별 데이터 파일의 마지막 수정 시각 (파일이 없으면 None)
+    def get_data_timestamps(self):
+        timestamps = {}
+        for section, filename in (("news", self._get_news_filename()), ("weather", self._get_weather_filename())):
+            try:
+                timestamps[section] = os.path.getmtime(filename)
+            except OSError:
+                timestamps[section] = None
+        return timestamps
+
+    @classmethod
+    def _load_json(cls, filename, prepare=None):
+        """
+        JSON 파일을 읽어 캐시합니다. 파일의 수정 시각/크기가 그대로면 다시 읽지 않고 메모리의 값을 반환합니다.
+        반환값은 여러 요청이 함께 쓰므로 읽기 전용으로 다뤄야 합니다.
+        :param prepare: 파일을 새로 읽었을 때 한 번만 적용할 후처리 함수
+        """
+        try:
+            stat = os.stat(filename)
+        except FileNotFoundError:
+            with cls._parsed_lock:
+                cls._parsed_files.pop(filename, None)
+            raise
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with cls._parsed_lock:
+            cached = cls._parsed_files.get(filename)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        data = read_snapshot(filename)
+        if prepare:
+            prepare(data)
+        with cls._parsed_lock:
+            cls._parsed_files[filename] = (stamp, data)
+        return data
+
+    @staticmethod
+    def _prepare_news(news_data_json):
+        # NewsManager가 저장할 때 formatted_date를 함께 기록하므로, 예전 파일에만 날짜 변환을 수행
+        for article in news_data_json.get('articles', []):
+            if 'formatted_date' in article:
+                continue
+            try:
+                pub_date = datetime.strptime(article['publication_date'], '%a, %d %b %Y %H:%M:%S %z')
+                article['formatted_date'] = pub_date.strftime('%Y-%m-%d %H:%M')
+            except (ValueError, KeyError):
+                article['formatted_date'] = "날짜 정보 없음"
+
+    def get_briefing_data(self, subject=""):
+        news_filename = self._get_news_filename()
+        weather_filename = self._get_weather_filename()
         
         news_articles, weather_data = [], None
         final_topic = "뉴스"
         
         try:
-            with open(news_filename, 'r', encoding='utf-8') as f:
-                news_data_json = json.load(f)
-                final_topic = news_data_json.get('topic', '주제 없음')
-                news_articles_raw = news_data_json.get('articles', [])
-                
-                for article in news_articles_raw:
-                    try:
-                        pub_date = datetime.strptime(article['publication_date'], '%a, %d %b %Y %H:%M:%S %z')
-                        article['formatted_date'] = pub_date.strftime('%Y-%m-%d %H:%M')
-                    except (ValueError, KeyError):
-                        article['formatted_date'] = "날짜 정보 없음"
-                news_articles = news_articles_raw
+            news_data_json = self._load_json(news_filename, prepare=self._prepare_news)
+            final_topic = news_data_json.get('topic', '주제 없음')
+            news_articles = news_data_json.get('articles', [])
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Warning: 뉴스 데이터를 불러오는 데 실패했습니다. ({e})")
 
         try:
-            with open(weather_filename, 'r', encoding='utf-8') as f:
-                weather_data = json.load(f)
+            weather_data = self._load_json(weather_filename)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Warning: 날짜 데이터를 불러오는 데 실패했습니다. ({e})")
 
@@ -58,4 +110,19 @@ class ReportManager:
             "news_data": news_articles,
             "weather_data": weather_data,
             "current_time_str": datetime.now().strftime('%H:%M')
-        }
\ No newline at end of file
+        }
+
+    # 지난 브리핑 조회 (보관소의 색인으로 조회하며, 파일을 뒤지지 않음)
+    def get_briefings(self, start_date, end_date, city=None, keyword=None, page=1, page_size=10):
+        """
+        :param start_date, end_date: 조회 기간 (date 또는 'YYYY-MM-DD', 양 끝 포함)
+        :return: {'total', 'page', 'page_size', 'briefings': [{'date', 'news', 'weather'}, ...]} (최신 날짜부터)
+        """
+        if self._archive is None:
+            self._archive = BriefingArchive(self.file_path)
+        page, page_size = max(1, int(page)), max(1, min(int(page_size), 100))
+        total, briefings = self._archive.get_briefings(
+            str(start_date), str(end_date), city=city, keyword=keyword,
+            limit=page_size, offset=(page - 1) * page_size
+        )
+        return {"total": total, "page": page, "page_size": page_size, "briefings": briefings}
@@ -0,0 +1,201 @@
+# Managers/scheduler_manager.py
+import datetime as dt
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class CronSchedule:
+    """
+    '분 시 일 월 요일' 5개 필드의 cron 식입니다. (*, 숫자, 범위 a-b, 목록 a,b, 간격 */n, a-b/n 지원)
+    요일은 0(일요일)~6(토요일)이며 7도 일요일로 봅니다.
+    """
+    FIELDS = (("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12), ("weekday", 0, 7))
+
+    def __init__(self, expression):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"cron 식은 5개 필드여야 합니다: '{expression}'")
+        self.expression = expression
+        values = [self._parse_field(part, low, high) for part, (_, low, high) in zip(parts, self.FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = values
+        self.weekdays = {0 if w == 7 else w for w in weekdays}
+        # 표준 cron 규칙: 일/요일이 둘 다 제한되어 있으면 둘 중 하나만 맞아도 실행
+        self._day_any, self._weekday_any = parts[2] == "*", parts[4] == "*"
+
+    @staticmethod
+    def _parse_field(field, low, high):
+        values = set()
+        for item in field.split(","):
+            base, _, step = item.partition("/")
+            if base == "*":
+                start, end = low, high
+            elif "-" in base:
+                start, end = (int(v) for v in base.split("-", 1))
+            else:
+                start = int(base)
+                end = high if step else start
+            step = int(step) if step else 1
+            if not (low <= start <= end <= high) or step < 1:
+                raise ValueError(f"cron 필드 값이 범위({low}-{high})를 벗어났습니다: '{field}'")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, day):
+        weekday = (day.weekday() + 1) % 7  # 파이썬은 월요일=0, cron은 일요일=0
+        day_ok, weekday_ok = day.day in self.days, weekday in self.weekdays
+        if self._day_any or self._weekday_any:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, after):
+        """after 이후(같은 분 제외) 처음으로 식에 맞는 시각을 반환합니다."""
+        candidate = after.replace(second=0, microsecond=0) + dt.timedelta(minutes=1)
+        for _ in range(366 * 5):  # 최대 5년 안에서 찾음
+            if candidate.month in self.months and self._day_matches(candidate):
+                for hour in sorted(h for h in self.hours if h >= candidate.hour):
+                    start_minute = candidate.minute if hour == candidate.hour else 0
+                    minutes = [m for m in sorted(self.minutes) if m >= start_minute]
+                    if minutes:
+                        return candidate.replace(hour=hour, minute=minutes[0])
+            candidate = (candidate + dt.timedelta(days=1)).replace(hour=0, minute=0)
+        raise ValueError(f"다음 실행 시각을 찾을 수 없습니다: '{self.expression}'")
+
+
+class BriefingScheduler:
+    """
+    cron 식으로 정한 시간대(슬롯)마다 브리핑을 실행하는 상주형 스케줄러입니다.
+    - 슬롯 prefetch_minutes분 전에 prefetch(슬롯)를 호출해 데이터를 미리 준비하고,
+      정각에 run(슬롯, 미리 준비한 결과)를 호출합니다.
+    - status()로 현재 상태와 다음/마지막 실행 정보를 확인할 수 있습니다.
+    """
+    def __init__(self, slots, run, prefetch=None, prefetch_minutes=5, tz=None):
+        if not slots:
+            raise ValueError("실행할 슬롯이 없습니다.")
+        self.schedules = {name: CronSchedule(expr) for name, expr in slots.items()}
+        self.run_slot = run
+        self.prefetch = prefetch
+        self.prefetch_delta = dt.timedelta(minutes=prefetch_minutes)
+        self.tz = tz
+        self.started_at = time.time()
+        self._state = "idle"
+        self._next = None
+        self._last_run = None
+        self._run_count = 0
+        self._failure_count = 0
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def _now(self):
+        return dt.datetime.now(self.tz)
+
+    def next_slot(self, after=None):
+        """(슬롯 이름, 실행 시각) 중 가장 가까운 것"""
+        after = after or self._now()
+        return min(((name, schedule.next_after(after)) for name, schedule in self.schedules.items()),
+                   key=lambda item: item[1])
+
+    def _set(self, **changes):
+        with self._lock:
+            for name, value in changes.items():
+                setattr(self, f"_{name}", value)
+
+    def _sleep_until(self, when):
+        # 긴 대기도 stop()에 바로 반응하도록 Event로 대기 (시계 보정에 대비해 최대 60초씩 나누어 대기)
+        while not self._stop.is_set():
+            remaining = (when - self._now()).total_seconds()
+            if remaining <= 0:
+                return True
+            self._stop.wait(min(remaining, 60))
+        return False
+
+    def run_forever(self):
+        print(f"⏰ 스케줄러를 시작합니다: " + ", ".join(f"{n}({s.expression})" for n, s in self.schedules.items()))
+        after = self._now()
+        while not self._stop.is_set():
+            slot, run_at = self.next_slot(after)
+            self._set(next=(slot, run_at), state="waiting")
+            print(f"-> 다음 브리핑: {slot} {run_at:%Y-%m-%d %H:%M} (미리 준비: {run_at - self.prefetch_delta:%H:%M})")
+
+            prefetched = None
+            if self.prefetch and self._sleep_until(run_at - self.prefetch_delta):
+                self._set(state="prefetching")
+                try:
+                    prefetched = self.prefetch(slot)
+                except Exception as e:
+                    print(f"⚠️ [{slot}] 미리 준비 중 오류 발생 (정각에 다시 수집합니다): {e}")
+                self._set(state="waiting")
+            if not self._sleep_until(run_at):
+                break
+
+            self._set(state="running")
+            started = time.time()
+            error = None
+            try:
+                self.run_slot(slot, prefetched)
+            except Exception as e:
+                error = str(e)
+                print(f"❌ [{slot}] 브리핑 실행 중 오류 발생: {e}")
+            with self._lock:
+                self._run_count += 1
+                self._failure_count += 1 if error else 0
+                self._last_run = {
+                    "slot": slot,
+                    "scheduled_at": run_at.isoformat(),
+                    "started_at": started,
+                    "duration": round(time.time() - started, 2),
+                    "ok": error is None,
+                    "error": error,
+                }
+            after = run_at
+        self._set(state="stopped")
+
+    def stop(self):
+        self._stop.set()
+
+    def status(self):
+        with self._lock:
+            next_slot = {"slot": self._next[0], "run_at": self._next[1].isoformat()} if self._next else None
+            return {
+                "state": self._state,
+                "uptime": round(time.time() - self.started_at, 1),
+                "slots": {name: schedule.expression for name, schedule in self.schedules.items()},
+                "next": next_slot,
+                "last_run": self._last_run,
+                "run_count": self._run_count,
+                "failure_count": self._failure_count,
+            }
+
+
+def start_status_server(status_fn, host="127.0.0.1", port=8765):
+    """
+    GET /health, /status 로 상태를 JSON으로 알려주는 작은 HTTP 서버를 백그라운드 스레드로 시작합니다.
+    /health는 마지막 실행이 실패했으면 503을 반환합니다.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path not in ("/health", "/status"):
+                self.send_error(404)
+                return
+            status = status_fn()
+            code = 200
+            if self.path == "/health":
+                last_run = status.get("last_run")
+                healthy = status.get("state") != "stopped" and (not last_run or last_run["ok"])
+                code = 200 if healthy else 503
+                status = {"healthy": healthy, "state": status.get("state"), "next": status.get("next")}
+            body = json.dumps(status, ensure_ascii=False).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 상태 조회 요청은 로그를 남기지 않음
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="iris-status", daemon=True).start()
+    print(f"-> 상태 확인 주소: http://{host}:{port}/health , /status")
+    return server
@@ -4,41 +4,150 @@ from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 class SenderManager :
-    def __init__(self, smtp_server, smtp_port, sender_email, sender_password):
+    def __init__(self, smtp_server, smtp_port, sender_email, sender_password, timeout=30):
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
         self.sender_email = sender_email
         self.sender_password = sender_password
+        self.timeout = timeout
 
-    def send_email(self, receiver_email, subject, body, attachment_path=None) :
+    # 쉼표로 구분된 수신자 문자열을 목록으로 변환 (공백/중복 제거, 순서 유지)
+    @staticmethod
+    def split_recipients(recipients):
+        if isinstance(recipients, str):
+            recipients = recipients.split(",")
+        return list(dict.fromkeys(r.strip() for r in recipients if r and r.strip()))
+
+    # SMTP 서버에 연결하고 로그인까지 마친 연결을 반환
+    def _connect(self):
+        smtp = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.timeout)
+        try:
+            smtp.starttls()  # TLS 보안 시작
+            smtp.login(self.sender_email, self.sender_password)
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
+
+    @staticmethod
+    def _close(smtp):
+        try:
+            smtp.quit()
+        except Exception:
+            smtp.close()
+
+    # 첨부 파일 파트 생성 (대량 발송 시 한 번만 읽어서 모든 메일에 재사용)
+    @staticmethod
+    def _attachment_part(attachment_path):
+        if not attachment_path or not os.path.exists(attachment_path):
+            return None
+        with open(attachment_path, 'rb') as attachment:
+            part = MIMEBase('application', 'octet-stream')
+            part.set_payload(attachment.read())
+        encoders.encode_base64(part)
+        # os.path.basename으로 파일 이름만 추출
+        part.add_header('Content-Disposition', f'attachment; filename={os.path.basename(attachment_path)}')
+        return part
+
+    def _build_message(self, receiver_email, subject, body, attachment_part=None):
         msg = MIMEMultipart()
         msg["From"] = self.sender_email
         msg["To"] = receiver_email
         msg["Subject"] = subject
 
         # 첨부 파일 추가해서 보내기
-        if attachment_path and os.path.exists(attachment_path):
-            with open(attachment_path, 'rb') as attachment:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(attachment.read())
-            encoders.encode_base64(part)
-            # os.path.basename으로 파일 이름만 추출
-            part.add_header('Content-Disposition', f'attachment; filename={os.path.basename(attachment_path)}')
-            msg.attach(part)
-            
+        if attachment_part is not None:
+            msg.attach(attachment_part)
+
         # 이메일 본문
         msg.attach(MIMEText(body, "html", "utf-8")) # HTML 형식으로 변경
+        return msg
+
+    def send_email(self, receiver_email, subject, body, attachment_path=None) :
+        msg = self._build_message(receiver_email, subject, body, self._attachment_part(attachment_path))
 
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as smtp:
-                smtp.starttls()  # TLS 보안 시작
-                smtp.login(self.sender_email, self.sender_password)
+            smtp = self._connect()
+            try:
                 smtp.send_message(msg)
+            finally:
+                self._close(smtp)
             print("✅ 메일 전송 성공!")
             return True
-            
+
         except Exception as e:
             print("❌ 메일 전송 실패:", e)
-            return False
\ No newline at end of file
+            return False
+
+    def send_bulk(self, recipients, subject, body, attachment_path=None, parallel=1, retries=1, personalize=None):
+        """
+        여러 수신자에게 같은 메일을 보냅니다.
+        연결마다 한 번만 로그인해서 여러 통을 보내고, 연결이 끊기면 다시 연결해 해당 메일부터 재시도합니다.
+        :param recipients: 수신자 목록 또는 쉼표로 구분된 문자열
+        :param parallel: 동시에 사용할 SMTP 연결 수 (수신자가 많을 때)
+        :param retries: 연결 오류 시 메일 한 통당 재시도 횟수
+        :param personalize: personalize(body, 수신자) 형태로 수신자별 값을 채워 넣는 함수 (없으면 본문 그대로)
+        :return: {수신자: {'success': bool, 'error': 오류 메시지 또는 None}}
+        """
+        recipients = self.split_recipients(recipients)
+        if not recipients:
+            return {}
+        attachment_part = self._attachment_part(attachment_path)
+        workers = max(1, min(int(parallel), len(recipients)))
+        # 수신자를 연결 수만큼 나누어 각 연결이 순서대로 보냄
+        chunks = [recipients[i::workers] for i in range(workers)]
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for chunk_results in executor.map(
+                lambda chunk: self._send_chunk(chunk, subject, body, attachment_part, retries, personalize), chunks
+            ):
+                results.update(chunk_results)
+
+        sent = sum(1 for r in results.values() if r['success'])
+        print(f"✅ 메일 일괄 전송 완료: 성공 {sent}건 / 실패 {len(results) - sent}건 (연결 {workers}개)")
+        return {r: results[r] for r in recipients}
+
+    def _send_chunk(self, recipients, subject, body, attachment_part, retries, personalize=None):
+        results = {}
+        smtp = None
+        try:
+            for index, receiver_email in enumerate(recipients):
+                personal_body = personalize(body, receiver_email) if personalize else body
+                msg = self._build_message(receiver_email, subject, personal_body, attachment_part)
+                for attempt in range(retries + 1):
+                    if smtp is None:
+                        try:
+                            smtp = self._connect()
+                        except Exception as e:
+                            # 연결/로그인 실패는 수신자와 무관하므로 수신자마다 다시 로그인하지 않고 남은 수신자를 모두 실패 처리
+                            # (잘못된 비밀번호로 로그인을 반복하면 계정이 잠길 수 있음)
+                            print(f"❌ SMTP 연결/로그인 실패, 남은 {len(recipients) - index}명에게 보내지 않습니다: {e}")
+                            for remaining in recipients[index:]:
+                                results[remaining] = {'success': False, 'error': str(e)}
+                            return results
+                    try:
+                        smtp.send_message(msg)
+                        results[receiver_email] = {'success': True, 'error': None}
+                        break
+                    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                        # 수신자/내용 문제는 연결과 무관하므로 재시도하지 않음 (연결은 계속 사용)
+                        results[receiver_email] = {'success': False, 'error': str(e)}
+                        break
+                    except (smtplib.SMTPException, OSError) as e:
+                        # 연결 문제: 현재 연결을 버리고 다음 시도에서 다시 연결
+                        if smtp is not None:
+                            smtp.close()
+                            smtp = None
+                        results[receiver_email] = {'success': False, 'error': str(e)}
+                        if attempt < retries:
+                            print(f"⚠️ 메일 전송 중 연결 오류, 다시 연결합니다 ({receiver_email}): {e}")
+                if not results[receiver_email]['success']:
+                    print(f"❌ 메일 전송 실패 ({receiver_email}): {results[receiver_email]['error']}")
+        finally:
+            if smtp is not None:
+                self._close(smtp)
+        return results
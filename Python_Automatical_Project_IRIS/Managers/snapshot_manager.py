@@ -0,0 +1,120 @@
+# Managers/snapshot_manager.py
+import hashlib
+import json
+import os
+import threading
+import time
+
+try:
+    import orjson  # 설치되어 있으면 더 빠르고 작은 JSON 인코딩 사용
+except ImportError:
+    orjson = None
+
+SCHEMA_VERSION = 1
+
+# 경로 -> ((수정 시각, 크기), 내용 해시): 같은 파일의 해시를 확인하려고 매번 다시 읽지 않도록 기억
+_known_hashes = {}
+_known_lock = threading.Lock()
+
+
+def _dumps(obj, compact=True, sort_keys=False):
+    if orjson is not None and compact:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    if compact:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=4, sort_keys=sort_keys).encode("utf-8")
+
+
+def _loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def content_hash(data):
+    """키 순서와 관계없이 같은 내용이면 같은 값이 나오는 sha256 해시"""
+    return hashlib.sha256(_dumps(data, compact=True, sort_keys=True)).hexdigest()
+
+
+def _file_stamp(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _remember(path, stamp, digest):
+    with _known_lock:
+        _known_hashes[path] = (stamp, digest)
+
+
+def _stored_hash(path):
+    # 파일에 기록된 내용 해시 (예전 형식이거나 읽을 수 없으면 None)
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return None
+    with _known_lock:
+        known = _known_hashes.get(path)
+    if known and known[0] == stamp:
+        return known[1]
+    try:
+        with open(path, "rb") as f:
+            envelope = _loads(f.read())
+    except (OSError, ValueError):
+        return None
+    digest = envelope.get("content_hash") if isinstance(envelope, dict) and "schema_version" in envelope else None
+    _remember(path, stamp, digest)
+    return digest
+
+
+def write_snapshot(path, data, compact=True):
+    """
+    브리핑 결과를 스냅샷 파일로 저장합니다.
+    - 임시 파일에 쓴 뒤 os.replace로 교체하므로, 동시에 읽는 쪽은 이전 파일 또는 완성된 새 파일만 보게 됩니다.
+    - 스키마 버전과 내용 해시를 함께 기록하고, 내용이 그대로면 파일을 다시 쓰지 않습니다.
+    :param compact: True면 줄바꿈/들여쓰기 없이 저장 (orjson이 있으면 orjson 사용)
+    :return: 파일을 새로 썼으면 True, 내용이 같아 건너뛰었으면 False
+    """
+    digest = content_hash(data)
+    if _stored_hash(path) == digest:
+        print(f"-> '{path}' 내용이 바뀌지 않아 저장을 건너뜁니다.")
+        return False
+
+    envelope = {
+        "schema_version": SCHEMA_VERSION,
+        "content_hash": digest,
+        "written_at": time.time(),
+        "data": data,
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(envelope, compact=compact))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    _remember(path, _file_stamp(path), digest)
+    return True
+
+
+def read_snapshot(path):
+    """
+    스냅샷 파일의 데이터를 반환합니다. 스키마 정보가 없는 예전 JSON 파일도 그대로 읽습니다.
+    파일이 없으면 FileNotFoundError, 형식이 잘못되면 json.JSONDecodeError(ValueError)를 발생시킵니다.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        payload = _loads(raw)
+    except ValueError as e:
+        raise json.JSONDecodeError(str(e), raw.decode("utf-8", errors="replace"), 0) from e
+    if isinstance(payload, dict) and "schema_version" in payload and "data" in payload:
+        if payload["schema_version"] > SCHEMA_VERSION:
+            print(f"⚠️ '{path}'의 스키마 버전({payload['schema_version']})이 지원 버전({SCHEMA_VERSION})보다 높습니다.")
+        return payload["data"]
+    return payload
@@ -0,0 +1,464 @@
+# Managers/store_manager.py
+import glob
+import json
+import os
+import re
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from .snapshot_manager import content_hash, read_snapshot
+
+
+class SeenTopicStore:
+    """
+    이미 보낸 뉴스 주제(정리된 제목)를 SQLite에 기록하는 저장소입니다.
+    - 날짜별 텍스트 파일 대신 시간 기준의 '최근 N시간' 창으로 조회하므로 자정/기준 시각이 지나도 기억이 유지됩니다.
+    - 기록 시각에 색인이 있어 기록이 몇 주 분량으로 쌓여도 '최근 N시간' 조회가 빠릅니다.
+    - WAL 모드로 웹 앱과 예약 실행이 동시에 기록해도 안전합니다.
+    - 보관 기간이 지난 기록은 백그라운드 스레드에서 주기적으로 정리합니다.
+    """
+    def __init__(self, file_path, filename="seen_topics.sqlite3", retention_days=7, cleanup_interval=600):
+        os.makedirs(file_path, exist_ok=True)
+        self.file_path = file_path
+        self.db_path = os.path.join(file_path, filename)
+        self.retention_seconds = retention_days * 24 * 3600
+        self.cleanup_interval = cleanup_interval
+        self._last_cleanup = 0.0
+        self._cleanup_lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA busy_timeout = 10000")
+        return conn
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen_topics (
+                    id      INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title   TEXT NOT NULL,
+                    seen_at REAL NOT NULL
+                )
+            """)
+            # 제목 비교는 유사도로 하므로 정규화 제목(norm_title) 열과 그 색인은 쓰지 않음 (예전 DB에서 제거)
+            conn.execute("DROP INDEX IF EXISTS idx_seen_topics_norm")
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(seen_topics)")]
+            if "norm_title" in columns:
+                self._drop_norm_title(conn)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_topics_seen_at ON seen_topics (seen_at)")
+            # 예전 파일 가져오기는 user_version으로 한 번만 수행 (clear_recent로 비운 뒤 다시 가져오지 않도록)
+            migrated = conn.execute("PRAGMA user_version").fetchone()[0] >= 1
+            has_rows = conn.execute("SELECT 1 FROM seen_topics LIMIT 1").fetchone() is not None
+        if not migrated:
+            if not has_rows:
+                self._import_legacy_files()
+            with self._connect() as conn:
+                conn.execute("PRAGMA user_version = 1")
+
+    @staticmethod
+    def _drop_norm_title(conn):
+        # 오래된 SQLite는 DROP COLUMN을 지원하지 않으므로 표를 새로 만들어 옮김
+        conn.executescript("""
+            CREATE TABLE seen_topics_new (
+                id      INTEGER PRIMARY KEY AUTOINCREMENT,
+                title   TEXT NOT NULL,
+                seen_at REAL NOT NULL
+            );
+            INSERT INTO seen_topics_new (id, title, seen_at) SELECT id, title, seen_at FROM seen_topics;
+            DROP TABLE seen_topics;
+            ALTER TABLE seen_topics_new RENAME TO seen_topics;
+        """)
+
+    def _import_legacy_files(self):
+        # 예전 seen_topics_YYYY-MM-DD.txt 파일을 가져옴 (파일 수정 시각을 기록 시각으로 사용)
+        rows = []
+        for filename in glob.glob(os.path.join(self.file_path, "seen_topics_*.txt")):
+            if not re.search(r"seen_topics_\d{4}-\d{2}-\d{2}\.txt$", filename):
+                continue
+            seen_at = os.path.getmtime(filename)
+            with open(filename, "r", encoding="utf-8") as f:
+                rows.extend((line.strip(), seen_at) for line in f if line.strip())
+        if rows:
+            with self._connect() as conn:
+                conn.executemany("INSERT INTO seen_topics (title, seen_at) VALUES (?, ?)", rows)
+            print(f"-> 예전 뉴스 주제 기록 {len(rows)}건을 저장소로 옮겼습니다.")
+
+    def add_many(self, titles):
+        now = time.time()
+        rows = [(title, now) for title in titles if title]
+        if rows:
+            with self._connect() as conn:
+                conn.executemany("INSERT INTO seen_topics (title, seen_at) VALUES (?, ?)", rows)
+        self._maybe_cleanup()
+
+    def recent_titles(self, window_hours=24):
+        # 유사도 비교에는 창 안의 제목이 모두 필요하므로 전부 읽음 (seen_at 색인으로 창 밖의 기록은 건너뜀)
+        since = time.time() - window_hours * 3600
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT title FROM seen_topics WHERE seen_at >= ? ORDER BY seen_at", (since,)
+            ).fetchall()
+        self._maybe_cleanup()
+        return [row[0] for row in rows]
+
+    def clear_recent(self, window_hours=24):
+        since = time.time() - window_hours * 3600
+        with self._connect() as conn:
+            deleted = conn.execute("DELETE FROM seen_topics WHERE seen_at >= ?", (since,)).rowcount
+        return deleted
+
+    def cleanup(self):
+        cutoff = time.time() - self.retention_seconds
+        try:
+            with self._connect() as conn:
+                deleted = conn.execute("DELETE FROM seen_topics WHERE seen_at < ?", (cutoff,)).rowcount
+            if deleted:
+                print(f"-> 보관 기간({datetime.fromtimestamp(cutoff):%Y-%m-%d %H:%M} 이전)이 지난 뉴스 주제 {deleted}건을 정리했습니다.")
+        except sqlite3.Error as e:
+            print(f"⚠️ 뉴스 주제 기록 정리 중 오류 발생: {e}")
+
+    def _maybe_cleanup(self):
+        # 정리 작업은 주기마다 한 번, 요청 흐름을 막지 않도록 백그라운드에서 수행
+        with self._cleanup_lock:
+            if time.time() - self._last_cleanup < self.cleanup_interval:
+                return
+            self._last_cleanup = time.time()
+        threading.Thread(target=self.cleanup, daemon=True).start()
+
+
+class BriefingStore:
+    """
+    웹 화면의 브리핑 데이터를 서버에 보관하는 저장소입니다. (쿠키에는 세션 ID만 저장)
+    - 메모리 LRU에 보관하고, 용량을 넘어 밀려난 항목은 spill_dir에 JSON 파일로 내려 둡니다.
+    - 브리핑은 news / weather / meta 섹션으로 나누어 섹션별 버전을 관리하므로,
+      '확인' 같은 부분 갱신은 해당 섹션만 교체합니다.
+    - 재시작 등으로 세션이 돌아오지 않아 남은 디스크 파일은 spill_ttl이 지나거나 max_spill_files를 넘으면 지웁니다.
+    """
+    SECTIONS = {
+        "news": ("news_data", "topic"),
+        "weather": ("weather_data",),
+    }
+
+    def __init__(self, capacity=256, spill_dir=None, spill_ttl=24 * 3600, max_spill_files=2048,
+                 cleanup_interval=600):
+        self.capacity = capacity
+        self.spill_dir = spill_dir
+        self.spill_ttl = spill_ttl
+        self.max_spill_files = max_spill_files
+        self.cleanup_interval = cleanup_interval
+        self._last_cleanup = 0.0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+            self._cleanup_spill()
+
+    @staticmethod
+    def new_session_id():
+        return secrets.token_hex(16)
+
+    def _spill_path(self, sid):
+        if not self.spill_dir or not re.fullmatch(r"[0-9a-f]{32}", sid or ""):
+            return None
+        return os.path.join(self.spill_dir, f"{sid}.json")
+
+    def _split(self, briefing_data):
+        sections = {"meta": {}}
+        for section in self.SECTIONS:
+            sections[section] = {}
+        for key, value in briefing_data.items():
+            section = next((name for name, keys in self.SECTIONS.items() if key in keys), "meta")
+            sections[section][key] = value
+        return sections
+
+    def _load(self, sid):
+        # 메모리에 없으면 디스크에 내려 둔 항목을 다시 올림 (lock 안에서 호출)
+        entry = self._entries.get(sid)
+        if entry is None:
+            path = self._spill_path(sid)
+            if path and os.path.exists(path):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        entry = json.load(f)
+                    os.remove(path)
+                except (OSError, json.JSONDecodeError):
+                    entry = None
+            if entry is None:
+                return None
+            self._entries[sid] = entry
+            self._evict()
+        self._entries.move_to_end(sid)
+        return entry
+
+    def _cleanup_spill(self):
+        # 오래된 파일부터 지움: 보관 기간이 지난 파일 전부 + 개수 상한을 넘는 만큼
+        self._last_cleanup = time.time()
+        files = []
+        for path in glob.glob(os.path.join(self.spill_dir, "*.json")):
+            try:
+                files.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        files.sort()
+        cutoff = self._last_cleanup - self.spill_ttl
+        excess = len(files) - self.max_spill_files
+        removed = 0
+        for index, (mtime, path) in enumerate(files):
+            if mtime >= cutoff and index >= excess:
+                break
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        if removed:
+            print(f"-> 오래된 브리핑 세션 파일 {removed}개를 정리했습니다.")
+
+    def _evict(self):
+        if self.spill_dir and time.time() - self._last_cleanup > self.cleanup_interval:
+            self._cleanup_spill()
+        while len(self._entries) > self.capacity:
+            sid, entry = self._entries.popitem(last=False)
+            path = self._spill_path(sid)
+            if path:
+                try:
+                    with open(path, "w", encoding="utf-8") as f:
+                        json.dump(entry, f, ensure_ascii=False)
+                except (OSError, TypeError) as e:
+                    print(f"⚠️ 브리핑 데이터를 디스크로 내리는 중 오류 발생: {e}")
+
+    def get(self, sid):
+        """세션의 브리핑 데이터(섹션을 합친 딕셔너리)를 반환합니다. 없으면 None"""
+        with self._lock:
+            entry = self._load(sid) if sid else None
+            if entry is None:
+                return None
+            merged = {}
+            for section in entry["sections"].values():
+                merged.update(section["data"])
+            return merged
+
+    def version(self, sid):
+        with self._lock:
+            entry = self._load(sid) if sid else None
+            if entry is None:
+                return None
+            return entry["version"], {name: section["version"] for name, section in entry["sections"].items()}
+
+    def put(self, sid, briefing_data):
+        """브리핑 전체를 교체합니다. 내용이 바뀐 섹션만 버전이 올라갑니다."""
+        with self._lock:
+            entry = self._load(sid) or {"version": 0, "sections": {}}
+            changed = False
+            for name, data in self._split(briefing_data).items():
+                section = entry["sections"].get(name)
+                if section is None or section["data"] != data:
+                    entry["sections"][name] = {"version": (section or {}).get("version", 0) + 1, "data": data}
+                    changed = True
+            if changed:
+                entry["version"] += 1
+            self._entries[sid] = entry
+            self._entries.move_to_end(sid)
+            self._evict()
+            return entry["version"]
+
+    def update_section(self, sid, section, data):
+        """한 섹션(news / weather / meta)의 일부 키만 갱신합니다."""
+        with self._lock:
+            entry = self._load(sid)
+            if entry is None:
+                return None
+            current = entry["sections"].setdefault(section, {"version": 0, "data": {}})
+            current["data"] = {**current["data"], **data}
+            current["version"] += 1
+            entry["version"] += 1
+            # 방금 갱신한 항목이 가장 먼저 밀려나지 않도록 최근 사용으로 표시
+            self._entries.move_to_end(sid)
+            return entry["version"]
+
+
+class BriefingArchive:
+    """
+    지난 뉴스/날씨 브리핑을 모두 보관하는 추가 전용(append-only) SQLite 저장소입니다.
+    - 실행할 때마다 덮어쓰는 weather_data.json, 날짜별 news_summary 파일과 달리 모든 스냅샷을 남깁니다.
+    - 날짜, 도시, 키워드, 기사 링크에 색인이 있어 기간 조회가 파일 검색/파싱 없이 색인 조회로 끝납니다.
+    - 같은 날짜/대상의 마지막 스냅샷과 내용이 같으면 다시 기록하지 않습니다.
+    """
+    def __init__(self, file_path, filename="briefing_archive.sqlite3"):
+        os.makedirs(file_path, exist_ok=True)
+        self.file_path = file_path
+        self.db_path = os.path.join(file_path, filename)
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA busy_timeout = 10000")
+        return conn
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS news_snapshots (
+                    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+                    briefing_date TEXT NOT NULL,
+                    topic         TEXT NOT NULL,
+                    content_hash  TEXT NOT NULL,
+                    created_at    REAL NOT NULL,
+                    payload       TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_news_snapshots_date ON news_snapshots (briefing_date, created_at);
+                CREATE INDEX IF NOT EXISTS idx_news_snapshots_topic ON news_snapshots (topic, briefing_date);
+
+                CREATE TABLE IF NOT EXISTS news_articles (
+                    snapshot_id      INTEGER NOT NULL REFERENCES news_snapshots (id),
+                    briefing_date    TEXT NOT NULL,
+                    keyword          TEXT,
+                    title            TEXT,
+                    link             TEXT,
+                    formatted_date   TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_news_articles_date ON news_articles (briefing_date);
+                CREATE INDEX IF NOT EXISTS idx_news_articles_keyword ON news_articles (keyword, briefing_date);
+                CREATE INDEX IF NOT EXISTS idx_news_articles_link ON news_articles (link);
+                CREATE INDEX IF NOT EXISTS idx_news_articles_snapshot ON news_articles (snapshot_id);
+
+                CREATE TABLE IF NOT EXISTS weather_snapshots (
+                    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+                    briefing_date TEXT NOT NULL,
+                    city          TEXT NOT NULL,
+                    content_hash  TEXT NOT NULL,
+                    created_at    REAL NOT NULL,
+                    payload       TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_weather_snapshots_date ON weather_snapshots (briefing_date, created_at);
+                CREATE INDEX IF NOT EXISTS idx_weather_snapshots_city ON weather_snapshots (city, briefing_date);
+            """)
+            is_empty = (conn.execute("SELECT 1 FROM news_snapshots LIMIT 1").fetchone() is None
+                        and conn.execute("SELECT 1 FROM weather_snapshots LIMIT 1").fetchone() is None)
+        if is_empty:
+            self._import_existing_files()
+
+    def _import_existing_files(self):
+        # 저장소를 처음 만들 때 남아 있는 결과 파일을 한 번만 가져옴 (날씨는 파일 수정 날짜를 기준으로 사용)
+        imported = 0
+        for filename in sorted(glob.glob(os.path.join(self.file_path, "news_summary_*.json"))):
+            match = re.search(r"news_summary_(\d{4}-\d{2}-\d{2})\.json$", filename)
+            if not match:
+                continue
+            try:
+                imported += self.add_news(match.group(1), read_snapshot(filename), created_at=os.path.getmtime(filename))
+            except (OSError, ValueError):
+                continue
+        weather_filename = os.path.join(self.file_path, "weather_data.json")
+        try:
+            mtime = os.path.getmtime(weather_filename)
+            imported += self.add_weather(datetime.fromtimestamp(mtime).strftime("%Y-%m-%d"),
+                                         read_snapshot(weather_filename), created_at=mtime)
+        except (OSError, ValueError):
+            pass
+        if imported:
+            print(f"-> 기존 브리핑 파일 {imported}개를 보관소로 옮겼습니다.")
+
+    def _is_duplicate(self, conn, table, column, briefing_date, value, digest):
+        row = conn.execute(
+            f"SELECT content_hash FROM {table} WHERE briefing_date = ? AND {column} = ? ORDER BY created_at DESC LIMIT 1",
+            (briefing_date, value),
+        ).fetchone()
+        return row is not None and row[0] == digest
+
+    def add_news(self, briefing_date, news_data, created_at=None):
+        """뉴스 스냅샷({'topic', 'articles', ...})을 기록합니다. 기록했으면 True"""
+        topic = news_data.get("topic", "")
+        digest = content_hash(news_data)
+        with self._connect() as conn:
+            if self._is_duplicate(conn, "news_snapshots", "topic", briefing_date, topic, digest):
+                return False
+            snapshot_id = conn.execute(
+                "INSERT INTO news_snapshots (briefing_date, topic, content_hash, created_at, payload) VALUES (?, ?, ?, ?, ?)",
+                (briefing_date, topic, digest, created_at or time.time(), json.dumps(news_data, ensure_ascii=False)),
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO news_articles (snapshot_id, briefing_date, keyword, title, link, formatted_date) VALUES (?, ?, ?, ?, ?, ?)",
+                [(snapshot_id, briefing_date, art.get("keyword", topic), art.get("cleaned_title"),
+                  art.get("naver_link"), art.get("formatted_date")) for art in news_data.get("articles", [])],
+            )
+        return True
+
+    def add_weather(self, briefing_date, weather_data, created_at=None):
+        """날씨 스냅샷을 기록합니다. 기록했으면 True"""
+        city = weather_data.get("city", "")
+        digest = content_hash(weather_data)
+        with self._connect() as conn:
+            if self._is_duplicate(conn, "weather_snapshots", "city", briefing_date, city, digest):
+                return False
+            conn.execute(
+                "INSERT INTO weather_snapshots (briefing_date, city, content_hash, created_at, payload) VALUES (?, ?, ?, ?, ?)",
+                (briefing_date, city, digest, created_at or time.time(), json.dumps(weather_data, ensure_ascii=False)),
+            )
+        return True
+
+    def _news_filter(self, keyword):
+        if not keyword:
+            return "", ()
+        return " AND id IN (SELECT snapshot_id FROM news_articles WHERE keyword = ?)", (keyword,)
+
+    def _weather_filter(self, city):
+        return (" AND city = ?", (city,)) if city else ("", ())
+
+    def get_briefings(self, start_date, end_date, city=None, keyword=None, limit=10, offset=0):
+        """
+        기간(YYYY-MM-DD, 양 끝 포함) 안의 날짜별 브리핑을 최신 날짜부터 반환합니다.
+        각 날짜에는 그날의 마지막 뉴스/날씨 스냅샷이 들어갑니다.
+        :return: (전체 날짜 수, [{'date', 'news', 'weather'}, ...])
+        """
+        news_sql, news_args = self._news_filter(keyword)
+        weather_sql, weather_args = self._weather_filter(city)
+        # 도시/키워드 조건을 준 경우에는 해당 섹션이 있는 날짜만 조회
+        sources = []
+        if not city or keyword:
+            sources.append((f"SELECT briefing_date FROM news_snapshots WHERE briefing_date BETWEEN ? AND ?{news_sql}",
+                            (start_date, end_date, *news_args)))
+        if not keyword or city:
+            sources.append((f"SELECT briefing_date FROM weather_snapshots WHERE briefing_date BETWEEN ? AND ?{weather_sql}",
+                            (start_date, end_date, *weather_args)))
+        dates_sql = " UNION ".join(sql for sql, _ in sources)
+        dates_args = tuple(arg for _, args in sources for arg in args)
+
+        with self._connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM ({dates_sql})", dates_args).fetchone()[0]
+            dates = [row[0] for row in conn.execute(
+                f"SELECT briefing_date FROM ({dates_sql}) ORDER BY briefing_date DESC LIMIT ? OFFSET ?",
+                (*dates_args, limit, offset),
+            )]
+            briefings = []
+            for briefing_date in dates:
+                news = conn.execute(
+                    f"SELECT payload FROM news_snapshots WHERE briefing_date = ?{news_sql} ORDER BY created_at DESC LIMIT 1",
+                    (briefing_date, *news_args),
+                ).fetchone()
+                weather = conn.execute(
+                    f"SELECT payload FROM weather_snapshots WHERE briefing_date = ?{weather_sql} ORDER BY created_at DESC LIMIT 1",
+                    (briefing_date, *weather_args),
+                ).fetchone()
+                briefings.append({
+                    "date": briefing_date,
+                    "news": json.loads(news[0]) if news else None,
+                    "weather": json.loads(weather[0]) if weather else None,
+                })
+        return total, briefings
+
+    def find_article(self, link):
+        """기사 링크가 실렸던 날짜와 키워드 목록"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT briefing_date, keyword, title FROM news_articles WHERE link = ? ORDER BY briefing_date",
+                (link,),
+            ).fetchall()
+        return [{"date": d, "keyword": k, "title": t} for d, k, t in rows]
@@ -1,16 +1,19 @@
 # ------------------ 표준 라이브러리 ------------------
 import datetime as dt
-import json
 import os
+import threading
+import time
 from typing import Any, Dict, List, Optional, Tuple
 
-# ------------------ 서드 파티 라이브러리 ------------------
-import requests
-from pytz import timezone
+# ------------------ 로컬 모듈 ------------------
+from .cache_manager import GeocodeCache
+from .http_manager import get_http_client
+from .snapshot_manager import write_snapshot
+from .store_manager import BriefingArchive
 
 # 시간대 상수 정의
-KST = timezone("Asia/Seoul")
-UTC = timezone("UTC")
+KST = dt.timezone(dt.timedelta(hours=9), "KST")  # 한국은 일광 절약 시간이 없어 고정 오프셋으로 충분
+UTC = dt.timezone.utc
 
 class WeatherManager:
     EMOJI = {
@@ -26,20 +29,51 @@ class WeatherManager:
         "Squall" : "강풍 주의",   "Tornado" : "실내 대피"
     }
 
-    def __init__(self, weather_api_key: str, target_city: str, file_path: str, summarizer: Any):
+    def __init__(self, weather_api_key: str, target_city: str, file_path: str, summarizer: Any, cache_ttl: int = 600,
+                 geocode_retry: int = 300):
         self.api_key = weather_api_key
         self.city_name = target_city
         self.file_path = file_path
         self.summarizer = summarizer
         self.KST = KST
-        self.coords = self._get_coords_for_location(self.city_name)
+        self.http = get_http_client()
+        # 지난 날씨 스냅샷을 모두 남기는 보관소 (파일 경로가 있을 때만)
+        self.archive = BriefingArchive(file_path) if file_path else None
+        # 실시간 날씨/5일 예보 응답을 TTL 동안 재사용하기 위한 메모 (key -> (저장 시각, 데이터))
+        self.cache_ttl = cache_ttl
+        self._memo: Dict[str, Tuple[float, Any]] = {}
+        self._memo_locks = {"current": threading.Lock(), "forecast": threading.Lock()}
+        # 좌표는 처음 필요할 때 캐시 -> API 순서로 조회 (생성 시에는 네트워크 호출 없음)
+        self.geocode_cache = GeocodeCache(file_path)
+        self._coords: Optional[Tuple[float, float]] = None
+        # 조회에 실패하면 geocode_retry초 동안은 다시 묻지 않음 (일시적인 오류로 매니저가 영구히 멈추지 않도록 이후에는 재시도)
+        self.geocode_retry = geocode_retry
+        self._coords_failed_at: Optional[float] = None
+
+    @property
+    def coords(self) -> Optional[Tuple[float, float]]:
+        if self._coords is None:
+            if self._coords_failed_at is not None and time.monotonic() - self._coords_failed_at < self.geocode_retry:
+                return None
+            coords = self.geocode_cache.get(self.city_name)
+            if coords is None:
+                coords = self._get_coords_for_location(self.city_name)
+                if coords:
+                    self.geocode_cache.set(self.city_name, coords)
+            if coords:
+                self._coords, self._coords_failed_at = coords, None
+            else:
+                self._coords_failed_at = time.monotonic()
+        return self._coords
 
     # ==============================================================================
     # 1. 자동화/이메일/캘린더를 위한 메인
     # ==============================================================================
-    def run_workflow(self, target_date: dt.date) -> Tuple[str, str]:
+    def run_workflow(self, target_date: dt.date, ai_comment: Optional[str] = None) -> Optional[Tuple[Any, str, str]]:
         """
         [자동화용] 실시간 날씨와 24시간 예보를 결합하여 최종 JSON을 생성하고 저장합니다.
+        ai_comment를 넘기면 (미리 받은) 해당 코멘트를 그대로 사용합니다.
+        :return: (날씨 데이터, 캘린더 제목, 캘린더 설명). 내일 예보가 없으면 날씨 데이터는 None
         """
         if not self.coords:
             print(f"❌ '{self.city_name}'의 좌표를 찾을 수 없어 날씨 작업을 중단합니다.")
@@ -52,16 +86,18 @@ class WeatherManager:
             return None
 
         # 2. 24시간 예보 데이터 가져오기 (서브)
-        hourly_forecasts = rain_slots, hourly_forecasts = self._process_24h_forecast()
-        current_forecast = self._get_current_weather()
-        print(rain_slots)
+        rain_slots, hourly_forecasts = self._process_24h_forecast()
+        current_forecast = main_weather_data
 
         if not hourly_forecasts:
             print("❌ 24시간 예보 정보가 없어 작업을 중단합니다.")
             return None
 
         # 3. AI 코멘트 생성 (24시간 예보를 바탕으로)
-        ai_comment = self._get_ai_weather_comment(current_forecast, hourly_forecasts)
+        if ai_comment:
+            ai_comment = ai_comment.strip().replace('"', '')
+        else:
+            ai_comment = self._get_ai_weather_comment(current_forecast, hourly_forecasts)
         print(f"-> AI 한마디: {ai_comment}")
 
         # 4. 브리핑 텍스트 생성 (실시간 날씨를 바탕으로)
@@ -101,11 +137,13 @@ class WeatherManager:
         else:
             # '내일' 모드: 내일 24시간 예보 중 비 예보만 추출하여 생성
             raw_data = self._fetch_raw_data()
+            if not raw_data or "list" not in raw_data:
+                return None, "내일 날씨 없음", "내일 예보 정보가 없습니다."
             target_str = target_date.strftime("%Y-%m-%d")
             filtered_forecasts = [item for item in raw_data["list"] if item["dt_txt"].startswith(target_str)]
 
             if not filtered_forecasts:
-                return "내일 날씨 없음", "내일 예보 정보가 없습니다."
+                return None, "내일 날씨 없음", "내일 예보 정보가 없습니다."
 
             snapshot = filtered_forecasts[0]
             status = snapshot["weather"][0]["main"]
@@ -141,11 +179,15 @@ class WeatherManager:
     
         # 6. 파일 저장
         if self.file_path:
-            os.makedirs(self.file_path, exist_ok=True)
             output_path = os.path.join(self.file_path, "weather_data.json")
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(full_weather_data, f, ensure_ascii=False, indent=4)
-            print(f"-> '{output_path}' 파일에 상세 날씨 정보를 저장했습니다.")
+            if write_snapshot(output_path, full_weather_data):
+                print(f"-> '{output_path}' 파일에 상세 날씨 정보를 저장했습니다.")
+            # 보관소에는 스냅샷을 실제로 받은 날짜(오늘)로만 기록 (내일 모드의 데이터도 오늘의 실시간 날씨임)
+            if is_today:
+                try:
+                    self.archive.add_weather(target_date.strftime("%Y-%m-%d"), full_weather_data)
+                except Exception as e:
+                    print(f"⚠️ 날씨 보관소 기록 중 오류 발생: {e}")
 
         return full_weather_data, summary, description
 
@@ -181,8 +223,9 @@ class WeatherManager:
     # ----------- 좌표 변환 API -----------
     def _get_coords_for_location(self, location_name: str) -> Optional[Tuple[float, float]]:
         try:
-            url = f"http://api.openweathermap.org/geo/1.0/direct?q={location_name}&limit=1&appid={self.api_key}"
-            response = requests.get(url)
+            url = "http://api.openweathermap.org/geo/1.0/direct"
+            params = {"q": location_name, "limit": 1, "appid": self.api_key}
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             data = response.json()
             if data:
@@ -194,14 +237,34 @@ class WeatherManager:
             print(f"❌ 좌표를 가져오는 중 오류 발생: {e}")
             return None
 
+    # ----------- 응답 메모 (TTL 내 중복 호출 방지) -----------
+    def _memoized(self, key: str, fetch) -> Any:
+        # 같은 key를 동시에 요청하면 한 스레드만 실제로 호출하고 나머지는 그 결과를 사용
+        with self._memo_locks[key]:
+            cached = self._memo.get(key)
+            if cached and time.monotonic() - cached[0] < self.cache_ttl:
+                return cached[1]
+            data = fetch()
+            if data is not None:
+                self._memo[key] = (time.monotonic(), data)
+            return data
+
+    def invalidate_cache(self) -> None:
+        """다음 호출에서 실시간 날씨와 예보를 새로 가져오도록 메모를 비웁니다."""
+        self._memo.clear()
+
     # ----------- 실시간 날씨 API -----------
     def _get_current_weather(self) -> Optional[Dict[str, Any]]:
+        return self._memoized("current", self._request_current_weather)
+
+    def _request_current_weather(self) -> Optional[Dict[str, Any]]:
         if not self.coords: return None
         lat, lon = self.coords
         
         try:
-            url = f"http://api.openweathermap.org/data/2.5/weather?lat={lat}&lon={lon}&appid={self.api_key}&units=metric&lang=kr"
-            response = requests.get(url)
+            url = "http://api.openweathermap.org/data/2.5/weather"
+            params = {"lat": lat, "lon": lon, "appid": self.api_key, "units": "metric", "lang": "kr"}
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             data = response.json()
             status = data['weather'][0]['main']
@@ -219,12 +282,16 @@ class WeatherManager:
     
     # ----------- 3시간 단위 날씨 API -----------
     def _fetch_raw_data(self) -> Optional[Dict[str, Any]]:
+        return self._memoized("forecast", self._request_raw_data)
+
+    def _request_raw_data(self) -> Optional[Dict[str, Any]]:
         if not self.coords: return None
         lat, lon = self.coords
         
         try:
-            url = f"http://api.openweathermap.org/data/2.5/forecast?lat={lat}&lon={lon}&appid={self.api_key}&units=metric&lang=kr"
-            response = requests.get(url)
+            url = "http://api.openweathermap.org/data/2.5/forecast"
+            params = {"lat": lat, "lon": lon, "appid": self.api_key, "units": "metric", "lang": "kr"}
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -276,6 +343,29 @@ class WeatherManager:
         if not self.summarizer or not current_forecast:
             return "오늘도 활기찬 하루 보내세요!"
 
+        prompt = self._build_ai_weather_prompt(current_forecast, hourly_forecasts)
+        try:
+            ai_comment = self.summarizer.summarize(text="", prompt=prompt)
+            return ai_comment.strip().replace('"', '')
+        except Exception as e:
+            print(f"-> 🤖 AI 날씨 코멘트 생성 중 오류 발생: {e}")
+            return "오늘도 활기찬 하루 보내세요!"
+
+    ## 미리 만든 프롬프트(build_ai_weather_prompt)로 날씨 한마디를 요청 (실패하면 None -> run_workflow가 다시 생성)
+    def get_ai_weather_comment(self, prompt: Optional[str]) -> Optional[str]:
+        if not self.summarizer or not prompt: return None
+        answer = self.summarizer.summarize_many([""], prompts=[prompt])[0]
+        return answer.strip().replace('"', '') or None
+
+    ## 날씨 한마디 프롬프트만 생성 (수집 단계에서 미리 만들어 두고 get_ai_weather_comment로 요청)
+    def build_ai_weather_prompt(self) -> Optional[str]:
+        if not self.coords: return None
+        current_weather = self._get_current_weather()
+        _, hourly_forecasts = self._process_24h_forecast()
+        if not current_weather or not hourly_forecasts: return None
+        return self._build_ai_weather_prompt(current_weather, hourly_forecasts)
+
+    def _build_ai_weather_prompt(self, current_forecast: Dict[str, Any], hourly_forecasts) -> str:
         current_status = current_forecast['status']
         current_temp = current_forecast['temp']
         current_hour = dt.datetime.now().hour
@@ -319,13 +409,7 @@ class WeatherManager:
 
         이제, 위 정보를 바탕으로 최고의 조언을 만들어주세요:
         """
-
-        try:
-            ai_comment = self.summarizer.summarize(text="", prompt=prompt)
-            return ai_comment.strip().replace('"', '')
-        except Exception as e:
-            print(f"-> 🤖 AI 날씨 코멘트 생성 중 오류 발생: {e}")
-            return "오늘도 활기찬 하루 보내세요!"
+        return prompt
         
     # 비가 오는지 확인 (비, 소나비, 천둥번개도 비라고 생각)
     def _is_rainy_strict(self, item: Dict[str, Any]) -> bool:
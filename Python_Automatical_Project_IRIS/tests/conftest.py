@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+import sys
+
+# 프로젝트 폴더(Managers 패키지가 있는 곳)를 import 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
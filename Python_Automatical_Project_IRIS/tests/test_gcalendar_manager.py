@@ -0,0 +1,129 @@
+# tests/test_gcalendar_manager.py
+import datetime as dt
+import itertools
+import unittest
+
+from Managers.gcalendar_manager import KST, GCalendarManager
+
+
+class FakeRequest:
+    def __init__(self, service, action):
+        self.service = service
+        self.action = action
+
+    def execute(self):
+        self.service.calls.append("execute")
+        return self.action()
+
+
+class FakeEvents:
+    def __init__(self, service):
+        self.service = service
+
+    def list(self, calendarId, timeMin, timeMax, privateExtendedProperty=(), pageToken=None, **_):
+        def action():
+            self.service.list_calls += 1
+            items = [event for event in self.service.store.values()
+                     if timeMin <= event["start"]["dateTime"] <= timeMax]
+            return {"items": [dict(event) for event in items]}
+        return FakeRequest(self.service, action)
+
+    def insert(self, calendarId, body):
+        def action():
+            event_id = str(next(self.service.ids))
+            self.service.store[event_id] = dict(body, id=event_id)
+            return self.service.store[event_id]
+        return FakeRequest(self.service, action)
+
+    def patch(self, calendarId, eventId, body):
+        def action():
+            self.service.store[eventId].update(body)
+            return self.service.store[eventId]
+        return FakeRequest(self.service, action)
+
+    def delete(self, calendarId, eventId):
+        return FakeRequest(self.service, lambda: self.service.store.pop(eventId))
+
+
+class FakeBatch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.service.batches.append(len(self.requests))
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.action(), None)
+            except Exception as e:
+                self.callback(request_id, None, e)
+
+
+class FakeCalendarService:
+    """Calendar API 중 날씨 일정 동기화에 쓰는 부분만 메모리에서 흉내 내는 가짜 서비스"""
+    def __init__(self):
+        self.store = {}
+        self.ids = itertools.count(1)
+        self.calls = []        # 개별 execute() 호출 (목록 조회만 있어야 함)
+        self.list_calls = 0
+        self.batches = []      # 배치마다 담긴 요청 수
+
+    def events(self):
+        return FakeEvents(self)
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+
+class SyncWeatherEventsTest(unittest.TestCase):
+    def setUp(self):
+        self.service = FakeCalendarService()
+        self.manager = GCalendarManager(service=self.service)
+        self.today = dt.datetime.now(KST).date()
+        self.tomorrow = self.today + dt.timedelta(days=1)
+        self.today_start = dt.datetime.combine(self.today, dt.time(6, 0), tzinfo=KST)
+
+    def sync(self, today_desc="맑음", tomorrow_desc="비"):
+        return self.manager.sync_weather_events({
+            self.today: ("오늘의 날씨", today_desc, self.today_start),
+            self.tomorrow: ("내일의 날씨", tomorrow_desc),
+        })
+
+    def test_creates_with_one_list_and_one_batch(self):
+        outcome = self.sync()
+        self.assertEqual(set(outcome.values()), {"created"})
+        self.assertEqual(self.service.list_calls, 1)
+        self.assertEqual(len(self.service.calls), 1)  # 목록 조회 외에는 개별 요청이 없음
+        self.assertEqual(self.service.batches, [2])
+        self.assertEqual(len(self.service.store), 2)
+
+    def test_unchanged_content_sends_no_write(self):
+        self.sync()
+        self.service.batches.clear()
+        outcome = self.sync()
+        self.assertEqual(set(outcome.values()), {"unchanged"})
+        self.assertEqual(self.service.list_calls, 2)
+        self.assertEqual(self.service.batches, [])
+
+    def test_changed_content_is_patched_in_place(self):
+        self.sync()
+        ids_before = set(self.service.store)
+        outcome = self.sync(tomorrow_desc="눈")
+        self.assertEqual(outcome[self.tomorrow.isoformat()], "updated")
+        self.assertEqual(outcome[self.today.isoformat()], "unchanged")
+        self.assertEqual(self.service.batches, [2, 1])
+        self.assertEqual(set(self.service.store), ids_before)
+
+    def test_none_payload_deletes(self):
+        self.sync()
+        outcome = self.manager.sync_weather_events({self.tomorrow: None})
+        self.assertEqual(outcome, {self.tomorrow.isoformat(): "deleted"})
+        self.assertEqual(len(self.service.store), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# tests/test_news_manager.py
+import datetime as dt
+import os
+import tempfile
+import unittest
+
+from Managers.news_manager import NewsManager
+from Managers.snapshot_manager import read_snapshot
+
+TITLES = [
+    "alpha rocket launch", "beta stock market", "gamma election vote", "delta weather storm",
+    "epsilon football win", "zeta movie award", "eta chip factory", "theta bank rate",
+]
+
+
+class FakeSummarizer:
+    def summarize_many(self, texts, prompts=None, max_workers=4, timeout=None):
+        return [f"요약: {text}" if text else "" for text in texts]
+
+
+class FakeNewsManager(NewsManager):
+    """네이버 API 대신 고정된 최근 기사 목록을 돌려주는 NewsManager"""
+    def __init__(self, file_path):
+        super().__init__("id", "secret", FakeSummarizer(), file_path)
+        now = dt.datetime.now(dt.timezone.utc)
+        self.items = [{
+            "title": title, "description": f"본문 {i}", "link": f"https://n.news/{i}",
+            "originallink": f"https://origin/{i}",
+            "pubDate": (now - dt.timedelta(minutes=10 * i)).strftime('%a, %d %b %Y %H:%M:%S %z'),
+        } for i, title in enumerate(TITLES)]
+
+    def _fetch_from_api(self, query, count, start):
+        return [dict(item) for item in self.items] if start == 1 else []
+
+
+class TemporaryModeTest(unittest.TestCase):
+    def test_repeated_calls_return_full_results(self):
+        manager = FakeNewsManager("")
+        first = manager.get_temporary_news("kw", 3)
+        second = manager.get_temporary_news("kw", 3)
+        self.assertEqual(len(first["articles"]), 3)
+        self.assertEqual(len(second["articles"]), 3)
+
+
+class FileModeTest(unittest.TestCase):
+    def test_unselected_articles_stay_candidates(self):
+        with tempfile.TemporaryDirectory() as file_path:
+            manager = FakeNewsManager(file_path)
+            picked = [manager.fetch_articles("kw", 3) for _ in range(3)]
+            titles = [article["title"] for batch in picked for article in batch]
+            self.assertEqual(sorted(titles), sorted(TITLES))
+
+    def test_fetch_stats_are_returned_per_call(self):
+        with tempfile.TemporaryDirectory() as file_path:
+            manager = FakeNewsManager(file_path)
+            _, first_stats = manager.fetch_articles_with_stats("kw", 3)
+            _, second_stats = manager.fetch_articles_with_stats("kw", 3)
+            self.assertEqual(first_stats["kw"]["new"], len(TITLES))
+            # 두 번째 호출의 통계가 첫 번째 호출의 결과를 덮어쓰지 않음
+            self.assertIsNot(first_stats, second_stats)
+            self.assertFalse(hasattr(manager, "last_fetch_stats"))
+
+    def test_snapshot_is_stable_for_same_articles(self):
+        with tempfile.TemporaryDirectory() as file_path:
+            manager = FakeNewsManager(file_path)
+            articles = manager.fetch_articles("kw", 3)
+            manager.run_workflow("kw", 3, articles=articles)
+            written = [name for name in os.listdir(file_path) if name.startswith("news_summary_")]
+            path = os.path.join(file_path, written[0])
+            mtime = os.stat(path).st_mtime_ns
+
+            # 같은 기사로 다시 실행하면 내용 해시가 같아 파일을 다시 쓰지 않음
+            manager.run_workflow("kw", 3, articles=articles)
+            self.assertEqual(os.stat(path).st_mtime_ns, mtime)
+            self.assertNotIn("fetch_stats", read_snapshot(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
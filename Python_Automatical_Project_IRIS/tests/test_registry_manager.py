@@ -0,0 +1,25 @@
+# tests/test_registry_manager.py
+import configparser
+import unittest
+
+from Managers.registry_manager import get_target_news_count
+
+
+def make_config(value):
+    config = configparser.ConfigParser()
+    config.read_dict({'USER': {'target_news_count': value}})
+    return config
+
+
+class TargetNewsCountTest(unittest.TestCase):
+    def test_number(self):
+        self.assertEqual(get_target_news_count(make_config('7')), 7)
+
+    def test_blank_or_invalid_uses_default(self):
+        self.assertEqual(get_target_news_count(make_config('')), 10)
+        self.assertEqual(get_target_news_count(make_config('열개')), 10)
+        self.assertEqual(get_target_news_count(configparser.ConfigParser()), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+# tests/test_store_manager.py
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from Managers.store_manager import SeenTopicStore
+
+
+class QuietSeenTopicStore(SeenTopicStore):
+    # 임시 폴더가 지워진 뒤 백그라운드 정리가 실행되지 않도록 정리 작업은 생략
+    def _maybe_cleanup(self):
+        pass
+
+
+class SeenTopicStoreTest(unittest.TestCase):
+    def test_recent_titles_within_window(self):
+        with tempfile.TemporaryDirectory() as file_path:
+            store = QuietSeenTopicStore(file_path)
+            store.add_many(["첫 번째 주제", "두 번째 주제", "첫 번째 주제"])
+            self.assertEqual(sorted(store.recent_titles(24)), ["두 번째 주제", "첫 번째 주제"])
+
+    def test_old_database_drops_norm_title(self):
+        with tempfile.TemporaryDirectory() as file_path:
+            # norm_title 열이 있던 예전 형식의 DB
+            with sqlite3.connect(os.path.join(file_path, "seen_topics.sqlite3")) as conn:
+                conn.execute("""
+                    CREATE TABLE seen_topics (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL,
+                        norm_title TEXT NOT NULL, seen_at REAL NOT NULL
+                    )
+                """)
+                conn.execute("INSERT INTO seen_topics (title, norm_title, seen_at) VALUES (?, ?, ?)",
+                             ("예전 주제", "예전 주제", time.time()))
+                conn.execute("PRAGMA user_version = 1")
+
+            store = QuietSeenTopicStore(file_path)
+            store.add_many(["새 주제"])
+            with store._connect() as conn:
+                columns = [row[1] for row in conn.execute("PRAGMA table_info(seen_topics)")]
+            self.assertNotIn("norm_title", columns)
+            self.assertEqual(sorted(store.recent_titles(24)), ["새 주제", "예전 주제"])
+
+
+if __name__ == "__main__":
+    unittest.main()
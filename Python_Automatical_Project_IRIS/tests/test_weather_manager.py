@@ -0,0 +1,82 @@
+# tests/test_weather_manager.py
+import datetime as dt
+import tempfile
+import unittest
+
+from Managers.weather_manager import KST, WeatherManager
+
+
+class FakeWeatherManager(WeatherManager):
+    """네트워크 대신 고정된 실시간 날씨/예보를 돌려주는 WeatherManager"""
+    def __init__(self, raw_forecast, file_path=""):
+        super().__init__("key", "Seoul", file_path, summarizer=None)
+        self._coords = (37.5665, 126.9780)
+        self.raw_forecast = raw_forecast
+
+    def _get_current_weather(self):
+        return {"status": "Clear", "temp": 20.0, "humi": 50}
+
+    def _process_24h_forecast(self):
+        return {}, [{"time": "09:00", "status": "Clear", "temp": 20.0}]
+
+    def _fetch_raw_data(self):
+        return self.raw_forecast
+
+
+class RunWorkflowTomorrowTest(unittest.TestCase):
+    def setUp(self):
+        self.tomorrow = dt.datetime.now(KST).date() + dt.timedelta(days=1)
+
+    def test_empty_forecast_returns_three_values(self):
+        manager = FakeWeatherManager({"list": []})
+        data, summary, description = manager.run_workflow(self.tomorrow, ai_comment="좋은 하루")
+        self.assertIsNone(data)
+        self.assertEqual(summary, "내일 날씨 없음")
+        self.assertEqual(description, "내일 예보 정보가 없습니다.")
+
+    def test_missing_forecast_returns_three_values(self):
+        manager = FakeWeatherManager(None)
+        data, summary, _ = manager.run_workflow(self.tomorrow, ai_comment="좋은 하루")
+        self.assertIsNone(data)
+        self.assertEqual(summary, "내일 날씨 없음")
+
+    def test_non_matching_forecast_returns_three_values(self):
+        other_day = (self.tomorrow + dt.timedelta(days=3)).strftime("%Y-%m-%d")
+        manager = FakeWeatherManager({"list": [
+            {"dt_txt": f"{other_day} 09:00:00", "weather": [{"main": "Rain"}], "rain": {"3h": 2.0}},
+        ]})
+        data, summary, _ = manager.run_workflow(self.tomorrow, ai_comment="좋은 하루")
+        self.assertIsNone(data)
+        self.assertEqual(summary, "내일 날씨 없음")
+
+    def test_matching_forecast_lists_rain(self):
+        day = self.tomorrow.strftime("%Y-%m-%d")
+        manager = FakeWeatherManager({"list": [
+            {"dt_txt": f"{day} 06:00:00", "weather": [{"main": "Rain"}], "rain": {"3h": 2.5}, "pop": 0.9},
+            {"dt_txt": f"{day} 09:00:00", "weather": [{"main": "Clouds"}]},
+        ]})
+        data, summary, description = manager.run_workflow(self.tomorrow, ai_comment="좋은 하루")
+        self.assertIsNotNone(data)
+        self.assertIn("내일의 날씨", summary)
+        self.assertIn("내일", description)
+
+
+class ArchiveDateTest(unittest.TestCase):
+    def test_only_today_snapshot_is_archived(self):
+        today = dt.datetime.now(KST).date()
+        tomorrow = today + dt.timedelta(days=1)
+        day = tomorrow.strftime("%Y-%m-%d")
+        with tempfile.TemporaryDirectory() as file_path:
+            manager = FakeWeatherManager({"list": [
+                {"dt_txt": f"{day} 09:00:00", "weather": [{"main": "Clouds"}]},
+            ]}, file_path=file_path)
+            manager.run_workflow(today, ai_comment="좋은 하루")
+            manager.run_workflow(tomorrow, ai_comment="좋은 하루")
+
+            total, briefings = manager.archive.get_briefings(today.isoformat(), tomorrow.isoformat())
+            archived = {b["date"] for b in briefings if b["weather"]}
+            self.assertEqual(archived, {today.isoformat()})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,17 @@
 import os
-from flask import Flask, request, render_template, jsonify, session
+import sys
+from flask import Flask, Response, request, render_template, jsonify, session, stream_with_context
 import configparser
+import json
 import datetime as dt
 
-from Managers.ai_manager import GeminiSummarizer
-from Managers.news_manager import NewsManager
-from Managers.weather_manager import WeatherManager
-from Managers.report_manager import ReportManager
-from Managers.sender_manager import SenderManager
+from Managers.cache_manager import SectionCache
+from Managers.job_manager import JobManager
+from Managers.outbox_manager import EmailOutbox
+from Managers.profile_manager import StartupProfiler
+from Managers.registry_manager import ManagerRegistry, get_target_news_count
+from Managers.render_manager import BriefingRenderer
+from Managers.store_manager import BriefingStore
 
 app = Flask(__name__, template_folder='templates')
 # [추가] 세션 기능을 사용하기 위해 시크릿 키를 반드시 설정해야 합니다.
@@ -23,13 +27,54 @@ CITIES = {
 
 CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.ini')
 
+# 설정과 매니저 객체는 앱 전체에서 한 번만 만들고, config.ini가 바뀐 경우에만 다시 구성
+registry = ManagerRegistry(CONFIG_PATH)
+
 def get_config():
-    config = configparser.ConfigParser()
-    config.read(CONFIG_PATH, encoding='utf-8')
-    return config
+    return registry.get_config()
+
+# 브리핑 데이터는 서버에 보관하고, 쿠키 세션에는 브리핑 ID만 저장
+briefing_store = BriefingStore(
+    capacity=256,
+    spill_dir=os.path.join(get_config().get('PATHS', 'output_directory', fallback='./files'), 'briefing_sessions')
+)
+
+# 이메일 본문 렌더러: Jinja 환경/CSS 인라인은 한 번만 준비하고, 같은 브리핑은 한 번만 렌더링
+email_renderer = BriefingRenderer(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates'),
+    cache_dir=os.path.join(get_config().get('PATHS', 'output_directory', fallback='./files'), 'template_cache'),
+)
+
+# 메일은 보낸편지함(SQLite)에 저장만 하고, 백그라운드 작업자가 발송 (일시적인 실패는 재시도)
+# 작업자는 import 시점이 아니라 서버를 실행할 때(또는 첫 메일 요청 때) 시작
+outbox = EmailOutbox(
+    get_config().get('PATHS', 'output_directory', fallback='./files'),
+    sender_factory=registry.sender,
+    parallel=get_config().getint('EMAIL', 'parallel_connections', fallback=2),
+    personalize=email_renderer.personalize,
+)
+
+# '확인'/'갱신' 작업은 요청 스레드가 아닌 백그라운드에서 실행 (같은 키워드/도시의 동시 요청은 하나로 합침)
+job_manager = JobManager(max_workers=2)
+
+# 뉴스/날씨 섹션 캐시: 신선도가 지난 데이터도 바로 보여주고, 백그라운드에서 한 번만 새로 고침
+section_cache = SectionCache(
+    freshness={
+        "weather": get_config().getint('WEB', 'weather_fresh_minutes', fallback=10) * 60,
+        "news": get_config().getint('WEB', 'news_fresh_minutes', fallback=30) * 60,
+    },
+    submit=job_manager.submit,
+)
+
+def get_briefing_id():
+    if 'briefing_id' not in session:
+        session['briefing_id'] = BriefingStore.new_session_id()
+    return session['briefing_id']
 
 def update_config_file(section, key, value):
-    config = get_config()
+    # 공유 중인 설정 객체를 건드리지 않도록 파일을 새로 읽어서 수정 (저장 후 registry가 변경을 감지)
+    config = configparser.ConfigParser()
+    config.read(CONFIG_PATH, encoding='utf-8')
     config.set(section, key, value)
     with open(CONFIG_PATH, 'w', encoding='utf-8') as configfile:
         config.write(configfile)
@@ -47,8 +92,7 @@ def get_iris_subject(part=""):
 
 @app.route('/')
 def index():
-    # [수정] 처음 접속 시에는 세션을 비워 새로운 정보를 불러오게 합니다.
-    session.pop('briefing_data', None)
+    # [수정] 처음 접속 시에는 initial_load로 파일에서 새로운 정보를 불러오게 합니다.
     config = get_config()
     keyword = config['USER']['news_keyword']
     city = config['USER']['target_city']
@@ -73,87 +117,202 @@ def results():
 # [핵심 수정] process_briefing 함수 전체 로직 변경
 def process_briefing(keyword, city, config, update_type=None, action=None):
     try:
-        output_path = config['PATHS']['output_directory']
-        naver_client_id = config['API']['NAVER_API_KEY']
-        naver_client_secret = config['API']['NAVER_API_PW']
-        weather_api_key = config['API']["WEATHER_API_KEY"]
-        gemini_api_key = config['API']['GOOGLE_GEMINI_API_KEY']
-        target_news_count = int(config['USER']['target_news_count'])
-        ai_summarizer = GeminiSummarizer(api_key=gemini_api_key)
-
-        # 1. 세션에서 기존 데이터를 불러오고, 없으면 파일에서 새로 가져옵니다.
-        briefing_data = session.get('briefing_data')
+        # 1. 서버 저장소에서 기존 데이터를 불러오고, 없거나 초기 로드면 섹션 캐시(없으면 저장된 파일)로 구성합니다.
+        briefing_id = get_briefing_id()
+        briefing_data = briefing_store.get(briefing_id)
+        job_id, reload_url = None, '/briefing'
         if not briefing_data or action == 'initial_load':
-            print("-> 세션 데이터가 없거나 초기 로드입니다. 파일에서 데이터를 로드합니다.")
-            report_manager = ReportManager(file_path=output_path, web_url=config['PATHS']['web_url'])
-            report_subject = get_iris_subject(part='report')
-            briefing_data = report_manager.get_briefing_data(subject=report_subject)
-
-        # 2. '확인' 버튼: 요청한 부분만 임시로 빠르게 갱신합니다.
-        if action == 'confirm':
-            if update_type == 'weather':
-                print(f"-> 날씨 임시 갱신: {city}")
-                weather_manager = WeatherManager(weather_api_key, city, "", ai_summarizer)
-                temp_weather = weather_manager.get_temporary_weather()
-                if temp_weather: briefing_data['weather_data'] = temp_weather
-            elif update_type == 'news':
-                print(f"-> 뉴스 임시 갱신: {keyword}")
-                news_manager = NewsManager(naver_client_id, naver_client_secret, ai_summarizer, "")
-                temp_news = news_manager.get_temporary_news(query=keyword, target_count=target_news_count)
-                if temp_news and temp_news['articles']:
-                    briefing_data['news_data'] = temp_news['articles']
-                    briefing_data['topic'] = temp_news['topic']
-
-        # 3. '갱신' 버튼: 파일을 영구 저장하고, 파일 기준의 최신 정보로 전체를 다시 불러옵니다.
-        if action == 'update_config':
-            if update_type == 'weather':
-                print(f"-> 날씨 설정 저장: {city}")
-                weather_manager = WeatherManager(weather_api_key, city, output_path, ai_summarizer)
-                weather_manager.run_workflow(target_date=dt.datetime.now().date())
-            elif update_type == 'news':
-                print(f"-> 뉴스 설정 저장: {keyword}")
-                news_manager = NewsManager(naver_client_id, naver_client_secret, ai_summarizer, output_path)
-                news_manager.run_workflow(query=keyword, target_count=target_news_count)
-            
-            print("-> 설정 저장이 완료되어 파일에서 데이터를 다시 로드합니다.")
-            report_manager = ReportManager(file_path=output_path, web_url=config['PATHS']['web_url'])
-            report_subject = get_iris_subject(part='report')
-            briefing_data = report_manager.get_briefing_data(subject=report_subject)
-
-        # 4. 최종 데이터를 세션에 저장합니다.
-        session['briefing_data'] = briefing_data
-
-        # 5. 화면을 렌더링합니다.
-        form_data = {"current_keyword": keyword, "current_city": city, "cities_map": CITIES}
+            briefing_data, job_id = build_cached_briefing(keyword, city, config)
+            briefing_store.put(briefing_id, briefing_data)
+            reload_url = '/'
+
+        # 2. '확인'/'갱신' 버튼: 캐시된 데이터는 바로 보여주고, 새로 받아야 하는 작업은 백그라운드로 넘깁니다.
+        if action == 'confirm' and update_type in ('news', 'weather'):
+            job_id = confirm_section(briefing_id, config, update_type, keyword, city)
+            briefing_data = briefing_store.get(briefing_id)
+            reload_url = '/briefing'
+        elif action == 'update_config' and update_type in ('news', 'weather'):
+            job_id = submit_update_job(briefing_id, config, update_type, keyword, city)
+            reload_url = '/briefing'
+
+        # 3. 화면을 렌더링합니다. (작업이 끝나면 페이지가 최신 데이터로 다시 그려짐)
+        form_data = {
+            "current_keyword": keyword, "current_city": city, "cities_map": CITIES,
+            "job_id": job_id, "reload_url": reload_url,
+        }
         return render_template('web_briefing.html', data=briefing_data, form=form_data, config=config)
 
     except Exception as e:
         print(f"Error in process_briefing: {e}")
         return f"<h1>오류가 발생했습니다.</h1><p>{e}</p><a href='/'>돌아가기</a>"
-    
+
+def news_cache_key(keyword, config):
+    return (keyword, get_target_news_count(config))
+
+def load_weather_section(city):
+    def work(report):
+        report(f"{city} 날씨 조회 중")
+        temp_weather = registry.weather(city, "").get_temporary_weather()
+        return {'weather_data': temp_weather} if temp_weather else None
+    return work
+
+def load_news_section(keyword, target_count):
+    def work(report):
+        report(f"'{keyword}' 뉴스 수집 및 요약 중")
+        temp_news = registry.news("").get_temporary_news(query=keyword, target_count=target_count)
+        if not temp_news or not temp_news['articles']:
+            return None
+        return {'news_data': temp_news['articles'], 'topic': temp_news['topic']}
+    return work
+
+def seed_section_cache(keyword, city, config):
+    # 캐시가 비어 있으면 저장된 파일로 채움 (API 호출 없이 파일 읽기만, 저장 시각은 파일 수정 시각)
+    news_key = news_cache_key(keyword, config)
+    if section_cache.peek('news', news_key) and section_cache.peek('weather', city):
+        return
+    report_manager = registry.report()
+    timestamps = report_manager.get_data_timestamps()
+    file_data = report_manager.get_briefing_data()
+    weather_data = file_data['weather_data']
+    if weather_data and timestamps['weather'] and weather_data.get('city') == city:
+        section_cache.set('weather', city, {'weather_data': weather_data}, stored_at=timestamps['weather'])
+    if file_data['news_data'] and timestamps['news'] and file_data['topic'] == keyword:
+        section_cache.set('news', news_key, {'news_data': file_data['news_data'], 'topic': file_data['topic']},
+                          stored_at=timestamps['news'])
+
+def build_cached_briefing(keyword, city, config):
+    """
+    캐시된 섹션으로 브리핑 화면 데이터를 만듭니다. 신선도가 지난 섹션은 그대로 쓰고 백그라운드에서 새로 고칩니다.
+    :return: (브리핑 데이터, 비어 있던 섹션을 채우는 작업 ID 또는 None)
+    """
+    seed_section_cache(keyword, city, config)
+    briefing_data = {
+        "display_title": get_iris_subject(part='report'),
+        "topic": "뉴스",
+        "web_url": config['PATHS']['web_url'],
+        "news_data": [],
+        "weather_data": None,
+        "current_time_str": dt.datetime.now().strftime('%H:%M'),
+    }
+    pending_job = None
+    for section, key, loader in (
+        ('weather', city, load_weather_section(city)),
+        ('news', news_cache_key(keyword, config), load_news_section(keyword, get_target_news_count(config))),
+    ):
+        value, job_id = section_cache.get(section, key, loader)
+        if value:
+            briefing_data.update(value)
+        elif job_id:
+            pending_job = job_id
+    return briefing_data, pending_job
+
+def confirm_section(briefing_id, config, update_type, keyword, city):
+    # '확인' 버튼: 요청한 섹션만 (캐시 또는 새로 조회한 값으로) 교체합니다.
+    if update_type == 'weather':
+        key, loader = city, load_weather_section(city)
+    else:
+        key, loader = news_cache_key(keyword, config), load_news_section(keyword, get_target_news_count(config))
+
+    value, job_id = section_cache.get(
+        update_type, key, loader,
+        on_refresh=lambda fresh: briefing_store.update_section(briefing_id, update_type, fresh)
+    )
+    if value:
+        briefing_store.update_section(briefing_id, update_type, value)
+    return job_id
+
+def submit_update_job(briefing_id, config, update_type, keyword, city):
+    # '갱신' 버튼: 파일을 영구 저장하고, 파일 기준의 최신 정보로 전체를 다시 불러옵니다.
+    output_path = config['PATHS']['output_directory']
+    target_news_count = get_target_news_count(config)
+
+    def work(report):
+        if update_type == 'weather':
+            report(f"{city} 날씨 저장 중")
+            registry.weather(city, output_path).run_workflow(target_date=dt.datetime.now().date())
+        else:
+            report(f"'{keyword}' 뉴스 수집, 요약 및 저장 중")
+            registry.news(output_path).run_workflow(query=keyword, target_count=target_news_count)
+        report("파일에서 데이터를 다시 불러오는 중")
+        return registry.report().get_briefing_data(subject=get_iris_subject(part='report'))
+
+    def on_done(briefing_data):
+        # 다시 불러온 데이터를 서버 저장소와 섹션 캐시에 저장합니다. (바뀐 섹션만 버전 증가)
+        briefing_store.put(briefing_id, briefing_data)
+        if update_type == 'weather' and briefing_data['weather_data']:
+            section_cache.set('weather', city, {'weather_data': briefing_data['weather_data']})
+        elif update_type == 'news' and briefing_data['news_data']:
+            section_cache.set('news', news_cache_key(keyword, config),
+                              {'news_data': briefing_data['news_data'], 'topic': briefing_data['topic']})
+
+    target = city if update_type == 'weather' else keyword
+    return job_manager.submit(('update', update_type, target), work, f"설정 저장: {update_type} {target}", on_done)
+
+@app.route('/briefing')
+def briefing():
+    # 백그라운드 작업이 끝난 뒤, 파일을 다시 읽지 않고 서버 저장소의 최신 데이터로 화면을 그립니다.
+    config = get_config()
+    keyword = request.args.get('news_keywords') or config['USER']['news_keyword']
+    city = request.args.get('weather_location') or config['USER']['target_city']
+    return process_briefing(keyword, city, config)
+
+@app.route('/api/jobs/<job_id>')
+def job_status(job_id):
+    job = job_manager.get(job_id)
+    if not job:
+        return jsonify({'status': 'error', 'message': '작업을 찾을 수 없습니다.'}), 404
+    return jsonify(job)
+
+@app.route('/api/jobs/<job_id>/events')
+def job_events(job_id):
+    # Server-Sent Events: 작업 상태가 바뀔 때마다 한 줄씩 전송하고, 끝나면 연결 종료
+    def stream():
+        job = job_manager.get(job_id)
+        while job:
+            yield f"data: {json.dumps(job, ensure_ascii=False)}\n\n"
+            if job['status'] in ('done', 'failed'):
+                return
+            job = job_manager.wait_for_change(job_id, job['version'], timeout=15)
+        yield f"data: {json.dumps({'status': 'failed', 'error': '작업을 찾을 수 없습니다.'}, ensure_ascii=False)}\n\n"
+    return Response(stream_with_context(stream()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/api/force_refresh_news', methods=['POST'])
 def refresh_and_confirm():
     print("🔄 새로고침(삭제+확인) 요청을 받았습니다...")    
 
     try:
         config = get_config()
-        ai_summarizer = GeminiSummarizer(api_key=config['API']['GOOGLE_GEMINI_API_KEY'])
-        news_manager = NewsManager(
-            naver_client_id=config['API']['NAVER_API_KEY'],
-            naver_client_secret=config['API']['NAVER_API_PW'],
-            summarizer=ai_summarizer,
-            file_path=config['PATHS']['output_directory']
-        )
+        news_manager = registry.news(config['PATHS']['output_directory'])
         news_manager.clear_today_seen_topics()
         keyword = config['USER']['news_keyword']
-        count = int(config['USER']['target_news_count'])
-        new_news_data = news_manager.get_temporary_news(query=keyword, target_count=count)
+        new_news_data = news_manager.get_temporary_news(query=keyword, target_count=get_target_news_count(config))
+        if new_news_data['articles']:
+            section_cache.set('news', news_cache_key(keyword, config), {'news_data': new_news_data['articles'], 'topic': new_news_data['topic']})
         return jsonify({'status': 'success', 'data': new_news_data})
 
     except Exception as e:
         print(f"❌ API 강제 새로고침 중 오류 발생: {e}")
         return jsonify({'status': 'error', 'message': str(e)})
 
+@app.route('/api/history')
+def api_history():
+    # 지난 브리핑 조회: /api/history?start=YYYY-MM-DD&end=YYYY-MM-DD&city=&keyword=&page=1&page_size=10
+    try:
+        today = dt.date.today()
+        end = dt.date.fromisoformat(request.args.get('end', today.isoformat()))
+        start = dt.date.fromisoformat(request.args.get('start', (end - dt.timedelta(days=30)).isoformat()))
+        history = registry.report().get_briefings(
+            start, end,
+            city=request.args.get('city') or None,
+            keyword=request.args.get('keyword') or None,
+            page=request.args.get('page', 1, type=int),
+            page_size=request.args.get('page_size', 10, type=int),
+        )
+        return jsonify({'status': 'success', **history})
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': f'날짜 형식이 올바르지 않습니다. (YYYY-MM-DD) {e}'}), 400
+
 @app.route('/api/send_email', methods=['POST'])
 def api_send_email():
     print("📧 API를 통한 이메일 발송 요청을 받았습니다...")
@@ -162,21 +321,48 @@ def api_send_email():
         receiver_email = briefing_data.pop('receiver_email', None)
         if not receiver_email:
             return jsonify({'status': 'error', 'message': '이메일 주소를 입력해주세요.'})
-        config = get_config()
-        sender_manager = SenderManager(
-            smtp_server=config['EMAIL']['SMTP_SERVER'],
-            smtp_port=int(config['EMAIL']['SMTP_PORT']),
-            sender_email=config['EMAIL']['SENDER_EMAIL'],
-            sender_password=config['EMAIL']['SENDER_PASSWORD']
-        )
-        html_body = render_template('email_briefing.html', data=briefing_data)
+        html_body = email_renderer.render_briefing(briefing_data)
         mail_subject = get_iris_subject(part='mail')
-        sender_manager.send_email(receiver_email=receiver_email, subject=mail_subject, body=html_body)
-        return jsonify({'status': 'success', 'message': f'{receiver_email}로 브리핑을 성공적으로 발송했습니다.'})
+        outbox.start()  # 다른 WSGI 서버로 실행한 경우에도 작업자가 돌도록 (이미 실행 중이면 무시)
+        # 보낸편지함에 저장하고 바로 응답 (쉼표로 여러 주소 입력 가능, 발송 상태는 /api/email_status로 확인)
+        message_id = outbox.enqueue(receiver_email, subject=mail_subject, body=html_body)
+        return jsonify({'status': 'queued', 'message_id': message_id,
+                        'message': f'{receiver_email}로 보낼 브리핑을 발송 대기열에 넣었습니다.'})
 
     except Exception as e:
         print(f"❌ API 이메일 발송 중 오류 발생: {e}")
         return jsonify({'status': 'error', 'message': str(e)})
 
+@app.route('/api/email_status/<message_id>')
+def api_email_status(message_id):
+    status = outbox.status(message_id)
+    if status is None:
+        return jsonify({'status': 'error', 'message': '메일을 찾을 수 없습니다.'}), 404
+    return jsonify(status)
+
+def profile_startup():
+    # import 시간(패키지별)과 첫 요청까지 걸리는 시간(템플릿 컴파일, 매니저 생성 포함)을 출력
+    # 섹션 새로 고침은 빈 작업으로 바꿔서 뉴스/날씨 API를 호출하지 않고 시작 비용만 잼
+    global load_weather_section, load_news_section
+    loaders = (load_weather_section, load_news_section)
+    load_weather_section = load_news_section = lambda *args: (lambda report: None)
+    profiler = StartupProfiler("web_app 시작 시간")
+    profiler.add_imports("web_app", cwd=os.path.dirname(os.path.abspath(__file__)))
+    client = app.test_client()
+    try:
+        for path in ('/', '/api/history'):
+            for attempt in ('첫', '두 번째'):
+                with profiler.step(f"GET {path} ({attempt} 요청)"):
+                    response = client.get(path)
+                    if response.status_code >= 500:
+                        raise RuntimeError(f"HTTP {response.status_code}")
+    finally:
+        load_weather_section, load_news_section = loaders
+    print(profiler.report())
+
 if __name__ == "__main__" :
-    app.run(host="0.0.0.0", port = 5000)
\ No newline at end of file
+    if '--profile-startup' in sys.argv:
+        profile_startup()
+    else:
+        outbox.start()  # 지난 실행에서 남은 메일도 바로 발송
+        app.run(host="0.0.0.0", port = 5000)
\ No newline at end of file